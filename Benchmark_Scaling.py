@@ -0,0 +1,211 @@
+from Class_MockSite import MockSite
+from Class_Scraping import QuoteScraping, BookScraping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, List, Any, Optional, Tuple
+import argparse
+import csv
+import importlib.util
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+# Operations measured, the website they use, and what their time grows with
+OPERATIONS = {
+    "all_quotes": ("quotes", "scrape_all_quotes: every listing page"),
+    "author_match": ("quotes", "get_author_url with a misspelled name: author crawl and difflib"),
+    "all_books": ("books", "scrape_all_books: every catalogue page"),
+    "book_url": ("books", "get_book_url of the last book, without its genre: genre crawl and lookups"),
+    "book_match": ("books", "get_book_url with a misspelled title and its genre: crawl of the genre and difflib"),
+}
+
+
+def serve(sizes: Dict[str, int], queue: Any, stop: Any) -> None:
+    """Runs a mock site in its own process, so its data and work do not count in the measurements, until `stop` is set."""
+    with MockSite(quote_count=sizes["quotes"], author_count=sizes["authors"], book_count=sizes["books"], genre_count=sizes["genres"]) as site:
+        queue.put((site.quotes_url, site.books_url))
+        stop.wait()
+
+
+def peak_memory() -> Optional[float]:
+    """The peak resident memory of this process in MB, or None where the resource module is not available (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10      # Bytes on macOS, kilobytes elsewhere
+
+
+def measure(operation: str, sizes: Dict[str, int], url: str) -> Dict[str, Any]:
+    """
+    Runs one operation against a mock site, in a fresh worker process so the peak memory is its own.
+
+    Parameters:
+        operation (str): One of `OPERATIONS`.
+        sizes (Dict[str, int]): Number of quotes, authors, books and genres of the site.
+        url (str): Base URL of the website the operation uses.
+
+    Returns:
+        dict: Seconds taken, items per second, growth of the peak memory in MB, and whether the result was correct.
+    """
+    last_author = f"Author {chr(65 + (sizes['authors'] - 1) % 26)}{sizes['authors'] - 1:04d}"
+    last_book = f"Book Title {sizes['books'] - 1}"
+    last_slug = f"book-title-{sizes['books'] - 1}_{sizes['books']}"
+
+    if OPERATIONS[operation][0] == "quotes":
+        scraper = QuoteScraping(base_url=url)
+    else:
+        scraper = BookScraping(base_url=url)
+    scraper.delay = [0, 0]
+    scraper.auto_confirm = operation.endswith("_match")      # Misspellings are resolved to the first similar name, exact names only match exactly
+
+    baseline = peak_memory()
+    start = time.perf_counter()
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        if operation == "all_quotes":
+            result = scraper.scrape_all_quotes()
+            items = sum(len(quotes) for tags in result.values() for quotes in tags.values())
+            correct = len(result) == min(sizes["authors"], sizes["quotes"])
+        elif operation == "author_match":
+            result = scraper.get_author_url(last_author.replace("Author", "Autor"))
+            items = sizes["quotes"]
+            correct = result.endswith(MockSite.author_slug(last_author))
+        elif operation == "all_books":
+            result = scraper.scrape_all_books()
+            items = len(result)
+            correct = items == sizes["books"]
+        elif operation == "book_url":
+            result = scraper.get_book_url(last_book)
+            items = sizes["books"]
+            correct = result.split("/")[-2] == last_slug
+        else:
+            # Without the genre, the first genre searched has a similar title, which would be confirmed instead
+            genre_index = (sizes["books"] - 1) % sizes["genres"]        # Books are dealt to the genres in turn
+            result = scraper.get_book_url(last_book.replace("Book", "Bok"), scraper.genre_list()[genre_index])
+            items = (sizes["books"] - 1 - genre_index) // sizes["genres"] + 1
+            correct = result.split("/")[-2] == last_slug
+
+    elapsed = time.perf_counter() - start
+    memory = peak_memory()
+
+    return {"seconds": elapsed, "items_per_second": items / elapsed if elapsed else 0.0,
+            "memory_mb": memory - baseline if memory is not None else None, "correct": correct}
+
+
+def site_sizes(size: int, quotes_per_author: int, books_per_genre: int) -> Dict[str, int]:
+    """The number of quotes, authors, books and genres of a site of the given size (quotes and books)."""
+    return {"quotes": size, "authors": max(20, size // quotes_per_author), "books": size, "genres": max(6, size // books_per_genre)}
+
+
+def growth(rows: List[Dict[str, Any]], operation: str, size: int) -> Optional[float]:
+    """The exponent k of time ~ size**k between the previous size and this one (about 1 for a linear scan, 2 for a quadratic one)."""
+    times = [(row["size"], row["seconds"]) for row in rows if row["operation"] == operation and row["size"] <= size]
+    if len(times) < 2 or times[-2][1] <= 0:
+        return None
+    (size_1, time_1), (size_2, time_2) = times[-2], times[-1]
+    return math.log(time_2 / time_1) / math.log(size_2 / size_1)
+
+
+def plot(rows: List[Dict[str, Any]], filename: str) -> bool:
+    """Plots throughput and memory against size with matplotlib, if it is installed. Returns True if the plot was written."""
+    if importlib.util.find_spec("matplotlib") is None:
+        return False
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    def points(measured: List[Dict[str, Any]], column: str) -> Tuple[List[int], List[float]]:
+        """Sizes and values of a column, without missing or zero values, which a log axis cannot show."""
+        kept = [(row["size"], row[column]) for row in measured if row[column] is not None and row[column] > 0]
+        return [size for size, _ in kept], [value for _, value in kept]
+
+    figure, (throughput, memory) = plt.subplots(1, 2, figsize=(12, 5))
+    for operation in dict.fromkeys(row["operation"] for row in rows):
+        measured = [row for row in rows if row["operation"] == operation]
+        throughput.plot(*points(measured, "items_per_second"), marker="o", label=operation)
+        memory.plot(*points(measured, "memory_mb"), marker="o", label=operation)
+
+    for axes, label in ((throughput, "Items per second"), (memory, "Peak memory growth (MB)")):
+        axes.set_xscale("log")
+        axes.set_yscale("log")
+        axes.set_xlabel("Quotes / books on the site")
+        axes.set_ylabel(label)
+        axes.grid(True, which="both", alpha=0.3)
+        axes.legend()
+
+    figure.tight_layout()
+    figure.savefig(filename)
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measures how the scraping operations scale with the size of the website, against generated "
+                                                 "mock sites with the markup of the real ones. Every operation runs in a fresh process.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Numbers of quotes (and of books) of the sites. Default is 1000 10000 100000.")
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS),
+                        help="Operations to measure. Default is all of them.")
+    parser.add_argument("--quotes-per-author", type=int, default=100, help="Quotes per author (at least 20 authors). Default is 100.")
+    parser.add_argument("--books-per-genre", type=int, default=500, help="Books per genre (at least 6 genres). Default is 500.")
+    parser.add_argument("--csv", help="CSV file the measurements are written to.")
+    parser.add_argument("--plot", default="scaling.png", help="Image of throughput and memory against size, if matplotlib is installed. "
+                                                              "Default is scaling.png.")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    rows: List[Dict[str, Any]] = []
+
+    print(f"{'operation':<14}{'size':>10}{'seconds':>10}{'items/s':>12}{'memory MB':>11}{'growth':>8}  correct")
+
+    for size in sorted(args.sizes):
+        sizes = site_sizes(size, args.quotes_per_author, args.books_per_genre)
+        queue, stop = context.Queue(), context.Event()
+        server = context.Process(target=serve, args=(sizes, queue, stop), daemon=True)
+        server.start()
+
+        try:
+            urls: Tuple[str, str] = queue.get(timeout=600)
+
+            for operation in args.operations:
+                url = urls[0] if OPERATIONS[operation][0] == "quotes" else urls[1]
+
+                # A new process per measurement, so memory and caches do not carry over
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    result = executor.submit(measure, operation, sizes, url).result()
+
+                rows.append({"operation": operation, "size": size, **sizes, **result})
+                exponent = growth(rows, operation, size)
+                memory = f"{result['memory_mb']:.1f}" if result["memory_mb"] is not None else "-"
+                print(f"{operation:<14}{size:>10}{result['seconds']:>10.2f}{result['items_per_second']:>12.0f}{memory:>11}"
+                      f"{exponent if exponent is not None else float('nan'):>8.2f}  {result['correct']}", flush=True)
+        finally:
+            stop.set()
+            server.join()
+
+    print()
+    for operation in args.operations:
+        print(f"{operation}: {OPERATIONS[operation][1]}")
+    print("growth: exponent k of time ~ size**k from the previous size (1 is linear, 2 is quadratic)")
+    print("correct: False means a different, similar name was returned")
+
+    if args.csv:
+        with open(args.csv, "w", newline="", encoding="utf-8") as file:
+            writer = csv.DictWriter(file, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"Measurements written to {args.csv}")
+
+    if plot(rows, args.plot):
+        print(f"Plot written to {args.plot}")
+    else:
+        print("matplotlib is not installed, so no plot was drawn: pip install matplotlib")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from typing import Dict, List, Tuple
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+# Modules whose import time is measured, and heavy dependencies that must not be imported at startup
+MODULES = ["Class_Scraping", "Program_QuoteScraping", "Program_BookScraping"]
+LAZY_DEPENDENCIES = ["requests", "bs4", "colorama", "difflib", "httpx", "orjson", "msgspec"]
+
+
+def import_times(module: str) -> Tuple[float, Dict[str, float], Dict[str, float]]:
+    """
+    Imports a module in a fresh interpreter with `python -X importtime`.
+
+    Parameters:
+        module (str): The module to import.
+
+    Returns:
+        tuple: The cumulative import time of the module in milliseconds, the cumulative time of every module imported with it,
+        and the cumulative time of the modules it imports directly.
+    """
+    # Bytecode must be written, otherwise every run includes compiling the module
+    environment = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             capture_output=True, text=True, check=True, env=environment)
+    times: Dict[str, float] = dict()
+    direct: Dict[str, float] = dict()
+    children: Dict[str, float] = dict()
+
+    # Lines look like "import time:       self [us] |  cumulative | imported package"
+    # A module is listed after the modules it imports, which are indented one level more
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        times[name] = int(cumulative) / 1000
+
+        if depth == 1:
+            children[name] = times[name]
+        elif depth == 0:
+            if name == module:
+                direct = children
+            children = dict()
+
+    return times[module], times, direct
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measures the import time of the scraping modules and programs, and enforces a budget.")
+    parser.add_argument("--runs", type=int, default=7, help="Fresh interpreters per module (the median is reported). Default is 7.")
+    parser.add_argument("--budget", type=float, default=40.0, help="Maximum median import time of each module in milliseconds. Default is 40.")
+    parser.add_argument("--modules", nargs="+", default=MODULES, help="Modules to measure. Default is the scraping module and both programs.")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+
+    for module in args.modules:
+        import_times(module)        # Warm-up run, so the bytecode is compiled before measuring
+
+        runs = [import_times(module) for _ in range(args.runs)]
+        median = statistics.median(total for total, _, _ in runs)
+        _, imported, direct = runs[-1]
+
+        print(f"{module}: {median:.1f} ms (median of {args.runs}, budget {args.budget:.0f} ms)")
+
+        # Slowest modules imported directly by the measured module (modules already imported are not listed)
+        slowest = sorted(((time, name) for name, time in direct.items()), reverse=True)[:5]
+        for time, name in slowest:
+            print(f"    {name}: {time:.1f} ms")
+
+        if median > args.budget:
+            failures.append(f"{module} takes {median:.1f} ms to import, over the budget of {args.budget:.0f} ms")
+
+        eager = [name for name in LAZY_DEPENDENCIES if name in imported]
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} at startup")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+
+    print("All modules are within the startup budget")
+
+
+if __name__ == "__main__":
+    main()
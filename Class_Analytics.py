@@ -0,0 +1,248 @@
+from Class_Scraping import Book, BookScraping, CommonMethods, Fore
+from typing import Dict, List, Any, Iterable, Optional, Union
+import re
+
+# NumPy and pandas are only needed for analytics
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:
+    np = None
+    pd = None
+
+
+class BookAnalytics:
+    """
+    A class for price, rating and availability analytics over a catalogue of books scraped with `BookScraping`.
+
+    Books are stored in typed columns instead of dictionaries of strings: price as float, rating as int8,
+    stock as int32 (parsed from "In stock (22 available)", 0 when the count is not shown) and genre as a categorical column.
+    Summaries and filters are vectorized, so they stay fast for catalogues much larger than books.toscrape.com.
+
+    Class Attributes:
+    ----------------------
+        columns: Dict[str, str]
+            The columns of the catalogue and their dtypes.
+        stock_pattern: re.Pattern
+            Pattern extracting the number of books in stock from the availability text.
+
+    Instance Attributes:
+    ------------------------
+        frame: pandas.DataFrame
+            The catalogue, one row per book.
+        chunk_size: int
+            Number of books converted to columns at a time when adding books.
+
+    Methods:
+    ----------------------------
+    - `from_scraper`: Harvests the details of all books of a `BookScraping` instance.
+    - `from_json`: Loads books written with `write_to_json`.
+    - `add_books`: Adds books to the catalogue.
+    - `price_summary`: Price statistics, optionally grouped.
+    - `rating_histogram`: Number of books per rating, optionally grouped.
+    - `stock_totals`: Total books in stock, optionally grouped.
+    - `filter`: Books matching price, rating, genre and stock conditions.
+
+    Example:
+    ----------------------------
+    ```python
+    analytics = BookAnalytics.from_scraper(BookScraping())
+    print(analytics.price_summary(by="genre"))
+    cheap = analytics.filter(max_price=20, min_rating=4, in_stock=True)
+    ```
+    """
+    columns = {
+        "title": "object", "genre": "category", "upc": "object", "price": "float64",
+        "rating": "int8", "stock": "int32", "in_stock": "bool", "availability": "category", "url": "object"
+    }
+    stock_pattern = re.compile(r"\((\d+) available\)")
+
+    def __init__(self, books: Iterable[Union[Book, Dict[str, Any]]] = (), chunk_size: int = 50_000) -> None:
+        """
+        Initializes the catalogue, optionally with books.
+
+        Parameters:
+            books (Iterable[Book | Dict[str, Any]]): `Book` records, or dictionaries in the shape of `Book.to_dict()`. Default is no books.
+            chunk_size (int): Number of books converted to columns at a time. Default is 50,000.
+
+        Raises:
+            ImportError: If NumPy or pandas is not installed.
+        """
+        if pd is None:
+            raise ImportError(Fore.RED + "BookAnalytics needs NumPy and pandas: pip install numpy pandas")
+
+        self.chunk_size = chunk_size
+        self.frame = pd.DataFrame({name: pd.Series(dtype=dtype) for name, dtype in BookAnalytics.columns.items()})
+        self.add_books(books)
+
+    @classmethod
+    def from_scraper(cls, scraper: BookScraping, limit: Optional[int] = None) -> "BookAnalytics":
+        """
+        Harvests the details of all books of the books website and loads them into a catalogue.
+
+        Parameters:
+            scraper (BookScraping): The scraper used to list and scrape the books.
+            limit (int, optional): Maximum number of books to scrape. Default is all books.
+
+        Returns:
+            BookAnalytics: The catalogue of the scraped books.
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        book_urls = list(scraper.scrape_all_books().values())[:limit]
+        return cls(scraper.scrape_book_info(url, print_info=False) for url in book_urls)
+
+    @classmethod
+    def from_json(cls, filename: str) -> "BookAnalytics":
+        """
+        Loads books from a JSON file written with `write_to_json`, mapping names (for example titles) to `Book.to_dict()` dictionaries.
+
+        Parameters:
+            filename (str): The name of the JSON file.
+
+        Returns:
+            BookAnalytics: The catalogue of the books in the file.
+        """
+        data = CommonMethods.read_from_json(filename)
+        return cls({**book, "Title": book.get("Title", title)} for title, book in data.items())
+
+    def add_books(self, books: Iterable[Union[Book, Dict[str, Any]]]) -> None:
+        """
+        Adds books to the catalogue. Books are converted to columns in chunks of `chunk_size`, so memory stays bounded while loading.
+
+        Parameters:
+            books (Iterable[Book | Dict[str, Any]]): `Book` records, or dictionaries in the shape of `Book.to_dict()`.
+        """
+        frames = [self.frame] if len(self.frame) else []
+        chunk: list[tuple] = []
+
+        for book in books:
+            chunk.append(BookAnalytics._row(book))
+
+            if len(chunk) == self.chunk_size:
+                frames.append(self._to_frame(chunk))
+                chunk = []
+
+        if chunk:
+            frames.append(self._to_frame(chunk))
+
+        if frames:
+            self.frame = pd.concat(frames, ignore_index=True)
+            # Categories of the chunks are merged, so the categorical dtypes are restored after concatenation
+            self.frame = self.frame.astype({"genre": "category", "availability": "category"})
+
+    @staticmethod
+    def _row(book: Union[Book, Dict[str, Any]]) -> tuple:
+        """Converts a book to a row (title, genre, UPC, price in pence, rating, availability, URL)."""
+        if isinstance(book, Book):
+            return (book.title, book.genre, book.upc, book.price, book.rating, book.availability, book.url)
+
+        price = book.get("Price", 0)
+        if isinstance(price, str):
+            price = Book.parse_price(price)
+        return (book.get("Title", ""), book.get("Genre", "Unknown"), book.get("UPC", ""), price,
+                book.get("Rating", 0), book.get("Availability", ""), book.get("URL", ""))
+
+    def _to_frame(self, rows: List[tuple]) -> "pd.DataFrame":
+        """Converts a chunk of rows to typed columns."""
+        title, genre, upc, price, rating, availability, url = zip(*rows)
+        availability = pd.Series(availability, dtype="category")
+
+        # The stock is parsed once per distinct availability text
+        categories = availability.cat.categories
+        stock_by_text = categories.str.extract(BookAnalytics.stock_pattern, expand=False).fillna(0).astype("int32")
+        in_stock_by_text = categories.str.lower().str.startswith("in stock")
+        codes = availability.cat.codes.to_numpy()
+
+        return pd.DataFrame({
+            "title": pd.Series(title, dtype="object"),
+            "genre": pd.Series(genre, dtype="category"),
+            "upc": pd.Series(upc, dtype="object"),
+            "price": np.asarray(price, dtype=np.int64) / 100,
+            "rating": np.asarray(rating, dtype=np.int8),
+            "stock": np.asarray(stock_by_text)[codes],
+            "in_stock": np.asarray(in_stock_by_text, dtype=bool)[codes],
+            "availability": availability,
+            "url": pd.Series(url, dtype="object"),
+        })
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def price_summary(self, by: Optional[str] = "genre") -> "pd.DataFrame":
+        """
+        Price statistics (count, mean, standard deviation, min, quartiles and max) of the catalogue.
+
+        Parameters:
+            by (str, optional): Column to group the books by, for example 'genre' or 'rating'. None for the whole catalogue. Default is 'genre'.
+
+        Returns:
+            pandas.DataFrame: One row of statistics per group (or a single row for the whole catalogue).
+        """
+        if by is None:
+            return self.frame["price"].describe().to_frame().T
+        return self.frame.groupby(by, observed=True)["price"].describe()
+
+    def rating_histogram(self, by: Optional[str] = None) -> "pd.DataFrame":
+        """
+        Number of books per rating (1 to 5).
+
+        Parameters:
+            by (str, optional): Column to group the books by, for example 'genre'. None for the whole catalogue. Default is None.
+
+        Returns:
+            pandas.DataFrame: Counts with one column per rating and one row per group (or a single row for the whole catalogue).
+        """
+        ratings = pd.Categorical(self.frame["rating"], categories=range(1, 6))
+
+        if by is None:
+            return pd.Series(ratings).value_counts(sort=False).to_frame("count").T
+        return pd.crosstab(self.frame[by], ratings).reindex(columns=range(1, 6), fill_value=0)
+
+    def stock_totals(self, by: Optional[str] = "genre") -> "pd.DataFrame":
+        """
+        Total number of books in stock, number of titles and number of titles out of stock.
+
+        Parameters:
+            by (str, optional): Column to group the books by. None for the whole catalogue. Default is 'genre'.
+
+        Returns:
+            pandas.DataFrame: Totals per group (or a single row for the whole catalogue).
+        """
+        frame = self.frame.assign(out_of_stock=~self.frame["in_stock"])
+        aggregations = {"stock": "sum", "title": "count", "out_of_stock": "sum"}
+
+        if by is None:
+            return frame.agg(aggregations).to_frame().T
+        return frame.groupby(by, observed=True).agg(aggregations)
+
+    def filter(self, min_price: Optional[float] = None, max_price: Optional[float] = None, min_rating: Optional[int] = None,
+               genres: Optional[List[str]] = None, in_stock: Optional[bool] = None) -> "pd.DataFrame":
+        """
+        Books matching all the given conditions.
+
+        Parameters:
+            min_price (float, optional): Minimum price (inclusive).
+            max_price (float, optional): Maximum price (inclusive).
+            min_rating (int, optional): Minimum rating (inclusive).
+            genres (List[str], optional): Genres the books must belong to.
+            in_stock (bool, optional): True for books in stock only, False for books out of stock only.
+
+        Returns:
+            pandas.DataFrame: The matching books.
+        """
+        mask = np.ones(len(self.frame), dtype=bool)
+
+        if min_price is not None:
+            mask &= (self.frame["price"] >= min_price).to_numpy()
+        if max_price is not None:
+            mask &= (self.frame["price"] <= max_price).to_numpy()
+        if min_rating is not None:
+            mask &= (self.frame["rating"] >= min_rating).to_numpy()
+        if genres is not None:
+            mask &= self.frame["genre"].isin(genres).to_numpy()
+        if in_stock is not None:
+            mask &= (self.frame["in_stock"] == in_stock).to_numpy()
+
+        return self.frame[mask]
@@ -0,0 +1,326 @@
+from Class_Scraping import Fore
+from contextlib import contextmanager
+from typing import Dict, List, Any, Iterator, Literal, Optional, Tuple
+import importlib
+import importlib.util
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+
+
+class ArchivedResponse:
+    """
+    A response read from a `PageArchive`, with the attributes of a requests response that the scraping classes use.
+
+    Instance Attributes:
+    ------------------------
+        url: str
+            The URL of the page.
+        status_code: int
+            The HTTP status of the response when it was archived.
+        headers: Dict[str, str]
+            The Content-Type of the response when it was archived.
+        content: bytes
+            The body of the response.
+        timestamp: float
+            When the response was archived (seconds since the epoch).
+    """
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes, timestamp: float = 0.0) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.timestamp = timestamp
+
+    @property
+    def encoding(self) -> str:
+        """The charset of the Content-Type header, UTF-8 if there is none."""
+        content_type = self.headers.get("Content-Type", "")
+        for part in content_type.split(";"):
+            name, _, value = part.strip().partition("=")
+            if name.lower() == "charset" and value:
+                return value.strip('"')
+        return "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+
+class PageArchive:
+    """
+    An append-only archive of raw responses, so pages can be parsed again later without fetching them.
+
+    Every response is one record: a fixed header, the URL, the Content-Type and the compressed body (zstd when `zstandard` is installed,
+    zlib otherwise). Each body is compressed on its own, so any page can be read without reading the ones before it.
+    An index file next to the archive (`<archive>.idx`, one line per record) maps URLs to the offset of their last record.
+    Records are only ever appended, so an interrupted crawl leaves a valid archive; a missing or short index is rebuilt by scanning it.
+    Reads use positional reads on one file descriptor, so any number of threads can read at the same time.
+
+    Record layout:
+    ----------------------
+        - Header: magic, codec, HTTP status, URL length, Content-Type length, compressed body length and timestamp.
+        - The URL and the Content-Type (UTF-8), then the compressed body.
+
+    Class Attributes:
+    ----------------------
+        magic: bytes
+            The first bytes of every record.
+        codecs: Dict[str, int]
+            The compression codecs and their ids in the records.
+
+    Instance Attributes:
+    ------------------------
+        filename: str
+            The archive file.
+        compression: Literal['zstd', 'zlib']
+            The codec used for new records.
+        index: Dict[str, Tuple[int, int]]
+            Offset and length of the last record of every URL.
+
+    Methods:
+    ----------------------------
+    - `add`: Archives a response.
+    - `get`: Reads the archived response of a URL.
+    - `urls`: The archived URLs.
+    - `close`: Closes the files.
+
+    Example:
+    ----------------------------
+    ```python
+    scraper = BookScraping()
+    scraper.archive = PageArchive("books.arc")       # Every page fetched is archived
+    scraper.scrape_all_books()
+
+    with PageArchive("books.arc", mode='r') as archive:
+        offline = BookScraping(transport=ArchiveTransport(archive))
+        books = offline.scrape_all_books()      # Read from the archive, without network access
+    ```
+    """
+    magic = b"PGA1"
+    codecs = {"zlib": 1, "zstd": 2}
+    header_format = struct.Struct("<4sBHIHId")       # magic, codec, status, URL length, Content-Type length, body length, timestamp
+
+    def __init__(self, filename: str, mode: Literal['a', 'r'] = 'a', compression: Literal['auto', 'zstd', 'zlib'] = 'auto', level: int = 3) -> None:
+        """
+        Opens an archive, creating it in mode 'a' if it does not exist.
+
+        Parameters:
+            filename (str): The archive file.
+            mode (Literal['a', 'r']): 'a' to append responses, 'r' to only read them. Default is 'a'.
+            compression (Literal['auto', 'zstd', 'zlib']): The codec for new records. 'auto' uses zstd when `zstandard` is installed. Default is 'auto'.
+            level (int): The compression level. Default is 3.
+
+        Raises:
+            ValueError: If `mode` or `compression` is not valid.
+            ImportError: If `compression` is 'zstd' and `zstandard` is not installed.
+            FileNotFoundError: If `mode` is 'r' and the archive does not exist.
+        """
+        if mode not in ['a', 'r']:
+            raise ValueError(Fore.RED + "mode must be 'a' to append or 'r' to read")
+        if compression not in ['auto', 'zstd', 'zlib']:
+            raise ValueError(Fore.RED + "compression must be 'auto', 'zstd' or 'zlib'")
+
+        has_zstd = importlib.util.find_spec("zstandard") is not None
+        if compression == 'zstd' and not has_zstd:
+            raise ImportError(Fore.RED + "zstd compression needs zstandard: pip install zstandard")
+
+        self.filename = filename
+        self.mode = mode
+        self.compression = 'zstd' if compression == 'auto' and has_zstd else ('zlib' if compression == 'auto' else compression)
+        self.level = level
+        self.lock = threading.Lock()
+        self.index: Dict[str, Tuple[int, int]] = dict()
+
+        self.fd = os.open(filename, os.O_RDONLY if mode == 'r' else os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self.index_file = None
+        self._load_index()
+
+        if mode == 'a':
+            self.index_file = open(filename + ".idx", "a", encoding="utf-8")
+
+    def __enter__(self) -> "PageArchive":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.index
+
+    def _load_index(self) -> None:
+        """Reads the index file, then scans the records appended after the last indexed one (for example after a crash)."""
+        end = 0
+        rewrite = False     # The index file ends with a line cut by a crash, so it is written again
+
+        if os.path.exists(self.filename + ".idx"):
+            with open(self.filename + ".idx", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        url, offset, length = json.loads(line)
+                    except ValueError:
+                        rewrite = True
+                        break       # The records after it are scanned
+                    self.index[url] = (offset, length)
+                    end = max(end, offset + length)
+
+        size = os.fstat(self.fd).st_size
+        missing: List[Tuple[str, int, int]] = []
+
+        # Records without an index line
+        while end + PageArchive.header_format.size <= size:
+            header = os.pread(self.fd, PageArchive.header_format.size, end)
+            magic, _, _, url_length, type_length, body_length, _ = PageArchive.header_format.unpack(header)
+            length = PageArchive.header_format.size + url_length + type_length + body_length
+
+            if magic != PageArchive.magic or end + length > size:
+                break       # A record cut by a crash
+
+            url = os.pread(self.fd, url_length, end + PageArchive.header_format.size).decode("utf-8")
+            self.index[url] = (end, length)
+            missing.append((url, end, length))
+            end += length
+
+        if rewrite and self.mode == 'a':
+            with open(self.filename + ".idx", "w", encoding="utf-8") as file:
+                for url, (offset, length) in sorted(self.index.items(), key=lambda item: item[1]):
+                    file.write(json.dumps([url, offset, length]) + "\n")
+        elif missing and self.mode == 'a':
+            with open(self.filename + ".idx", "a", encoding="utf-8") as file:
+                for entry in missing:
+                    file.write(json.dumps(entry) + "\n")
+
+        if end < size and self.mode == 'a':
+            os.ftruncate(self.fd, end)      # Drop a record cut by a crash, so new records follow the last complete one
+
+    def _compress(self, content: bytes) -> bytes:
+        if self.compression == 'zstd':
+            return importlib.import_module("zstandard").ZstdCompressor(level=self.level).compress(content)
+        return zlib.compress(content, self.level)
+
+    @staticmethod
+    def _decompress(codec: int, payload: bytes) -> bytes:
+        if codec == PageArchive.codecs["zstd"]:
+            if importlib.util.find_spec("zstandard") is None:
+                raise ImportError(Fore.RED + "This archive is compressed with zstd, which needs zstandard: pip install zstandard")
+            return importlib.import_module("zstandard").ZstdDecompressor().decompress(payload)
+        return zlib.decompress(payload)
+
+    def add(self, url: str, response: Any) -> None:
+        """
+        Archives a response. A URL archived again is read from its latest record.
+
+        Parameters:
+            url (str): The URL that was requested.
+            response (requests.Response | httpx.Response | ArchivedResponse): The response, with its status, headers and (decoded) body.
+
+        Raises:
+            ValueError: If the archive was opened in mode 'r'.
+        """
+        if self.mode != 'a':
+            raise ValueError(Fore.RED + "The archive was opened in mode 'r'")
+
+        url_bytes = url.encode("utf-8")
+        content_type = response.headers.get("Content-Type", "").encode("utf-8")
+        body = self._compress(response.content)
+        header = PageArchive.header_format.pack(PageArchive.magic, PageArchive.codecs[self.compression], response.status_code,
+                                                len(url_bytes), len(content_type), len(body), time.time())
+        record = header + url_bytes + content_type + body
+
+        with self.lock:
+            offset = os.lseek(self.fd, 0, os.SEEK_END)
+            os.write(self.fd, record)       # One write, so a record is never interleaved with another
+
+            self.index[url] = (offset, len(record))
+            self.index_file.write(json.dumps([url, offset, len(record)]) + "\n")
+            self.index_file.flush()
+
+    def get(self, url: str) -> Optional[ArchivedResponse]:
+        """
+        Reads the archived response of a URL.
+
+        Parameters:
+            url (str): The URL.
+
+        Returns:
+            ArchivedResponse | None: The response, or None if the URL is not archived.
+        """
+        entry = self.index.get(url)
+        if entry is None:
+            return None
+
+        offset, length = entry
+        record = os.pread(self.fd, length, offset)
+        _, codec, status, url_length, type_length, body_length, timestamp = PageArchive.header_format.unpack_from(record)
+
+        start = PageArchive.header_format.size + url_length
+        content_type = record[start:start + type_length].decode("utf-8")
+        content = PageArchive._decompress(codec, record[start + type_length:])
+
+        return ArchivedResponse(url, status, {"Content-Type": content_type}, content, timestamp)
+
+    def urls(self) -> List[str]:
+        """The archived URLs, in the order they were first archived."""
+        return list(self.index)
+
+    def close(self) -> None:
+        """Closes the archive and its index."""
+        if self.index_file is not None:
+            self.index_file.close()
+            self.index_file = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+
+class ArchiveTransport:
+    """
+    A transport that answers every request from a `PageArchive` instead of the network, with the interface of `Transport`.
+    Scrapers built with it replay a crawl offline. A URL that is not archived gets a 404 response and is recorded in `misses`,
+    so optional paths (the JSON API, the search form) fall back as they would online.
+
+    Instance Attributes:
+    ------------------------
+        archive: PageArchive
+            The archive the responses are read from.
+        misses: List[str]
+            URLs requested but not archived.
+        errors: Tuple[type, ...]
+            Exception types raised when a request fails.
+    """
+    def __init__(self, archive: PageArchive) -> None:
+        self.archive = archive
+        self.misses: List[str] = []
+        self.errors: Tuple[type, ...] = (OSError,)
+        self.session = None
+        self.timeout = 0
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> ArchivedResponse:
+        response = self.archive.get(url)
+
+        if response is None:
+            self.misses.append(url)
+            return ArchivedResponse(url, 404, {"Content-Type": "text/html; charset=utf-8"}, b"Not archived")
+        return response
+
+    def post(self, url: str, data: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> ArchivedResponse:
+        """Forms are not archived, so they are answered with a 404 response."""
+        self.misses.append(url)
+        return ArchivedResponse(url, 404, {"Content-Type": "text/html; charset=utf-8"}, b"Not archived")
+
+    @contextmanager
+    def stream(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+               chunk_size: int = 64 * 1024) -> Iterator[Tuple[ArchivedResponse, Iterator[bytes]]]:
+        """Like `Transport.stream`: the archived response and its body in chunks."""
+        response = self.get(url, headers, timeout)
+        yield response, (response.content[i:i + chunk_size] for i in range(0, len(response.content), chunk_size))
+
+    def close(self) -> None:
+        pass
+
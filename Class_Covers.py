@@ -0,0 +1,230 @@
+from Class_Scraping import BookScraping, CommonMethods, Fore
+from collections import Counter
+from typing import Dict, List, Any, Tuple, TYPE_CHECKING
+from urllib.parse import urlsplit
+import functools
+import hashlib
+import mimetypes
+import os
+import tempfile
+import threading
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+
+class CoverDownloader:
+    """
+    Downloads the cover images of books to a directory, concurrently and under the politeness limits of the scraper.
+
+    Every download is a request of the scraper's `RequestScheduler`, in the job of the scraping method that found the image,
+    so it shares the per-host limit and the `delay` of the HTML crawl. Bodies are streamed to disk in chunks of `chunk_size`
+    while their SHA-256 is computed, so no image is held in memory. Files are named by their hash (`ab/abcdef....jpg`):
+    identical images (for example a placeholder cover) are stored once, whatever their URLs.
+    A manifest (`manifest.json` in the directory) maps every downloaded URL to its file, and URLs already in it are not requested again.
+
+    Instance Attributes:
+    ------------------------
+        scraper: BookScraping
+            The scraper whose transport, headers, scheduler and delay are used.
+        directory: str
+            The directory the images and the manifest are written to.
+        chunk_size: int
+            Number of bytes read and written at a time.
+        manifest: Dict[str, Dict[str, Any]]
+            URL -> file, SHA-256, size in bytes, Content-Type and book title of every downloaded image.
+        stats: Counter
+            Number of images downloaded, skipped (already in the manifest), duplicates (same content as another image) and failed,
+            and bytes written.
+        failed: Dict[str, str]
+            The error of every URL that could not be downloaded.
+
+    Methods:
+    ----------------------------
+    - `queue`: Queues images for download, without waiting.
+    - `download`: Downloads images and waits for them.
+    - `wait`: Waits for the queued downloads and saves the manifest.
+    - `save`: Writes the manifest.
+
+    Example:
+    ----------------------------
+    ```python
+    scraper = BookScraping()
+    with CoverDownloader(scraper, "covers") as covers:
+        scraper.covers = covers
+        scraper.scrape_all_books()      # Thumbnails of every listing page are downloaded during the crawl
+    print(covers.stats)
+    ```
+    """
+    def __init__(self, scraper: BookScraping, directory: str = "covers", chunk_size: int = 64 * 1024, save_every: int = 100) -> None:
+        """
+        Initializes the downloader, reading the manifest of the directory if there is one.
+
+        Parameters:
+            scraper (BookScraping): The scraper whose transport, scheduler and politeness settings are used.
+            directory (str): The directory the images and the manifest are written to. Default is 'covers'.
+            chunk_size (int): Number of bytes read and written at a time. Default is 64 KiB.
+            save_every (int): The manifest is saved after this many new images, so an interrupted run keeps most of it. Default is 100.
+
+        Raises:
+            ValueError: If `chunk_size` or `save_every` is not a positive integer.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError(Fore.RED + "chunk_size must be a positive integer")
+        if not isinstance(save_every, int) or save_every < 1:
+            raise ValueError(Fore.RED + "save_every must be a positive integer")
+
+        self.scraper = scraper
+        self.directory = directory
+        self.chunk_size = chunk_size
+        self.save_every = save_every
+        self.manifest_file = os.path.join(directory, "manifest.json")
+        self.manifest: Dict[str, Dict[str, Any]] = dict()
+        self.stats: Counter = Counter()
+        self.failed: Dict[str, str] = dict()
+        self.lock = threading.RLock()      # Held while saving, also by a download that triggers a save
+
+        self.pending: Dict[str, Future] = dict()        # Downloads in flight, by URL. Each one is removed when it finishes
+        self.unsaved = 0        # Images added to the manifest since it was last saved
+
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.manifest_file):
+            self.manifest = CommonMethods.read_from_json(self.manifest_file).get("covers", {})
+
+    def __enter__(self) -> "CoverDownloader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wait()
+
+    def _present(self, url: str) -> bool:
+        """True if the image of a URL is in the manifest and its file exists."""
+        entry = self.manifest.get(url)
+        return entry is not None and os.path.exists(os.path.join(self.directory, entry["file"]))
+
+    def queue(self, images: Dict[str, str]) -> int:
+        """
+        Queues images for download and returns without waiting. Called from a scraping method, the downloads are part of its job.
+        Images already in the manifest (with their file) or already queued are not requested again.
+
+        Parameters:
+            images (Dict[str, str]): Book title -> image URL.
+
+        Returns:
+            int: The number of downloads queued.
+        """
+        scraper = self.scraper
+        queued = 0
+
+        with scraper.scheduler.job('bulk'):
+            for title, url in images.items():
+                with self.lock:
+                    if url in self.pending:
+                        continue
+                    if self._present(url):
+                        self.stats["skipped"] += 1
+                        continue
+
+                    future = scraper.scheduler.submit(lambda url, title=title: self._download(url, title), url,
+                                                      delay=(scraper.delay[0], scraper.delay[1]))
+                    self.pending[url] = future
+                    future.add_done_callback(functools.partial(self._finished, url))
+                queued += 1
+
+        return queued
+
+    def _download(self, url: str, title: str) -> None:
+        """Streams an image to a temporary file while hashing it, then moves it to its content-addressed name (or drops it if that exists)."""
+        scraper = self.scraper
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_name = tempfile.mkstemp(dir=self.directory, prefix=".download-", suffix=".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as file, scraper.transport.stream(url, headers=scraper.header, timeout=scraper.timeout,
+                                                                      chunk_size=self.chunk_size) as (response, chunks):
+                if response.status_code != 200:
+                    raise Exception(Fore.RED + f"Error downloading {url}: HTTP {response.status_code}")
+
+                content_type = response.headers.get("Content-Type", "")
+                for chunk in chunks:
+                    digest.update(chunk)
+                    file.write(chunk)
+                    size += len(chunk)
+
+            sha256 = digest.hexdigest()
+            extension = os.path.splitext(urlsplit(url).path)[1] or mimetypes.guess_extension(content_type.split(";")[0].strip()) or ""
+            name = f"{sha256[:2]}/{sha256}{extension}"        # The same in the manifest on every platform
+            path = os.path.join(self.directory, name)
+
+            with self.lock:
+                if os.path.exists(path):
+                    os.remove(temp_name)        # Same image as another URL
+                    self.stats["duplicates"] += 1
+                else:
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    os.replace(temp_name, path)
+                    self.stats["downloaded"] += 1
+                    self.stats["bytes"] += size
+
+                self.manifest[url] = {"file": name, "sha256": sha256, "bytes": size, "content_type": content_type, "title": title}
+                self.unsaved += 1
+                if self.unsaved >= self.save_every:
+                    self.save()
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+
+    def _finished(self, url: str, future: "Future") -> None:
+        """Removes a finished download from `pending`, recording its error in `failed` and `stats`. Only the first call for a download counts."""
+        with self.lock:
+            if self.pending.get(url) is not future:
+                return
+            del self.pending[url]
+
+            error = "Download cancelled" if future.cancelled() else future.exception()
+            if error is not None:
+                self.failed[url] = str(error)
+                self.stats["failed"] += 1
+
+    def download(self, images: Dict[str, str]) -> Counter:
+        """
+        Downloads images and waits for them.
+
+        Parameters:
+            images (Dict[str, str]): Book title -> image URL.
+
+        Returns:
+            Counter: `stats` after the downloads.
+        """
+        self.queue(images)
+        return self.wait()
+
+    def wait(self) -> Counter:
+        """
+        Waits for the downloads still in flight and saves the manifest. Failed downloads are recorded in `failed` and `stats`.
+
+        Returns:
+            Counter: `stats` after the downloads.
+        """
+        from concurrent.futures import wait as futures_wait      # Imported here, as it pulls in logging
+
+        while True:
+            with self.lock:
+                pending: List[Tuple[str, Future]] = list(self.pending.items())
+            if not pending:
+                break
+
+            for url, future in pending:
+                futures_wait([future])
+                self._finished(url, future)     # Its callback may not have run yet
+
+        self.save()
+        return self.stats
+
+    def save(self) -> None:
+        """Writes the manifest to `manifest.json` in the directory, atomically."""
+        with self.lock:
+            CommonMethods._atomic_write(self.manifest_file, CommonMethods.dumps_json({"version": 1, "covers": self.manifest}))
+            self.unsaved = 0
@@ -0,0 +1,312 @@
+from Class_Scraping import Fore
+from collections import defaultdict
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+import random
+import re
+import unicodedata
+import zlib
+
+# NumPy speeds up signatures, which are computed in pure Python without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class QuoteDeduplicator:
+    """
+    Finds near-duplicate quotes (the same quote with different punctuation, quote marks, case or whitespace) with MinHash and
+    locality-sensitive hashing (LSH), so they can be merged in the output of `scrape_all_quotes`.
+
+    Every quote is normalized and split into overlapping word shingles (pairs of words by default). Words rather than characters are used
+    so that different quotes built on the same words, like "Quote number 80." and "Quote number 81.", are not merged. Its MinHash signature keeps, for each of `num_perm`
+    random hash functions, the smallest hash of its shingles; the fraction of equal values of two signatures estimates the
+    Jaccard similarity of their shingle sets. Signatures are cut into `bands` bands, and only quotes by the same author sharing a whole band
+    are compared, so the work grows with the number of quotes instead of the number of pairs. Quotes by different authors are never merged.
+
+    Class Attributes:
+    ----------------------
+        prime: int
+            The prime modulus of the hash functions (below 2**32, so products fit in 64 bits).
+        apostrophes: re.Pattern
+            Apostrophes, removed when normalizing so "don't" and "dont" are the same word.
+        punctuation: re.Pattern
+            Characters replaced by spaces when normalizing (anything but letters, digits and spaces).
+
+    Instance Attributes:
+    ------------------------
+        threshold: float
+            Estimated Jaccard similarity above which two quotes are duplicates.
+        num_perm: int
+            Number of hash functions (length of the signatures).
+        bands: int
+            Number of LSH bands. Together with `rows`, it sets the similarity above which quotes are likely to be compared.
+        rows: int
+            Number of signature values per band.
+        shingle_size: int
+            Number of words per shingle.
+        records: List[Tuple[str, str, Tuple[str, ...]]]
+            The quotes added (text, author, tags), by id.
+        compared: int
+            Number of candidate pairs compared by the last `clusters` call.
+
+    Methods:
+    ----------------------------
+    - `normalize`: The text of a quote without quote marks, punctuation, case and extra whitespace.
+    - `add`: Adds a quote.
+    - `add_quotes`: Adds the output of `scrape_all_quotes` (author -> tag -> quotes).
+    - `clusters`: Groups of duplicate quotes.
+    - `report`: The clusters with their canonical quote and variants.
+    - `merged`: The quotes with every cluster merged into its canonical quote, in the shape of `scrape_all_quotes`.
+
+    Example:
+    ----------------------------
+    ```python
+    deduplicator = QuoteDeduplicator(threshold=0.8)
+    deduplicator.add_quotes(CommonMethods.read_from_json("quotes.json"))
+    deduplicator.add_quotes(CommonMethods.read_from_json("mirror_quotes.json"))
+
+    for cluster in deduplicator.report():
+        print(cluster["quote"], len(cluster["variants"]))
+    quotes = deduplicator.merged()
+    ```
+    """
+    prime = 4294967291
+    apostrophes = re.compile(r"['’`´]")
+    punctuation = re.compile(r"[^\w\s]|_")
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, bands: Optional[int] = None, shingle_size: int = 2, seed: int = 0) -> None:
+        """
+        Initializes an empty deduplicator.
+
+        Parameters:
+            threshold (float): Estimated Jaccard similarity above which two quotes are duplicates, between 0 and 1. Default is 0.8.
+            num_perm (int): Number of hash functions. More are slower but estimate the similarity better. Default is 128.
+            bands (int, optional): Number of LSH bands, a divisor of `num_perm`. Default is the one whose S-curve is closest to `threshold`.
+            shingle_size (int): Number of words per shingle. Default is 2.
+            seed (int): Seed of the hash functions. Default is 0.
+
+        Raises:
+            ValueError: If `threshold` is not between 0 and 1, `num_perm` or `shingle_size` is not positive,
+            or `bands` does not divide `num_perm`.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(Fore.RED + "threshold must be between 0 and 1")
+        if not isinstance(num_perm, int) or num_perm < 1:
+            raise ValueError(Fore.RED + "num_perm must be a positive integer")
+        if not isinstance(shingle_size, int) or shingle_size < 1:
+            raise ValueError(Fore.RED + "shingle_size must be a positive integer")
+        if bands is not None and (bands < 1 or num_perm % bands):
+            raise ValueError(Fore.RED + "bands must be a positive divisor of num_perm")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands or QuoteDeduplicator._optimal_bands(threshold, num_perm)
+        self.rows = num_perm // self.bands
+        self.shingle_size = shingle_size
+        self.records: List[Tuple[str, str, Tuple[str, ...]]] = []
+        self.compared = 0
+
+        generator = random.Random(seed)
+        self.hash_a = [generator.randrange(1, QuoteDeduplicator.prime) for _ in range(num_perm)]
+        self.hash_b = [generator.randrange(0, QuoteDeduplicator.prime) for _ in range(num_perm)]
+        if np is not None:
+            self.hash_arrays = (np.array(self.hash_a, dtype=np.uint64)[:, None], np.array(self.hash_b, dtype=np.uint64)[:, None])
+
+        self.signatures: List[Tuple[int, ...]] = []
+        self.keys: Dict[Tuple[str, str], int] = dict()      # (author, text) -> id, so a quote listed under several tags is one record
+        self.buckets: Dict[Tuple[str, int, Tuple[int, ...]], List[int]] = defaultdict(list)     # (normalized author, band, band values) -> ids
+        self.listings: List[Tuple[int, str]] = []       # (id, tag) in the order quotes were listed, so merging keeps that order
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @staticmethod
+    def _optimal_bands(threshold: float, num_perm: int) -> int:
+        """The divisor of `num_perm` whose LSH S-curve midpoint, (1 / bands) ** (1 / rows), is closest to the threshold."""
+        divisors = [bands for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+        return min(divisors, key=lambda bands: abs((1 / bands) ** (bands / num_perm) - threshold))
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalizes the text of a quote: Unicode compatibility forms, lowercase, no apostrophes, quote marks or punctuation, single spaces.
+
+        Parameters:
+            text (str): The text of the quote.
+
+        Returns:
+            str: The normalized text.
+        """
+        text = QuoteDeduplicator.apostrophes.sub("", unicodedata.normalize("NFKC", text).lower())
+        return " ".join(QuoteDeduplicator.punctuation.sub(" ", text).split())
+
+    def _shingles(self, text: str) -> List[int]:
+        """The 32-bit hashes of the word shingles of a normalized text (all its words if it is shorter than one shingle)."""
+        size = self.shingle_size
+        words = text.split(" ")
+        shingles = {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+        return [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+
+    def _signature(self, hashes: List[int]) -> Tuple[int, ...]:
+        """The MinHash signature of a set of shingle hashes: the smallest value of (a * x + b) mod prime for every hash function."""
+        prime = QuoteDeduplicator.prime
+
+        if np is not None:
+            values = np.array(hashes, dtype=np.uint64)
+            a, b = self.hash_arrays
+            return tuple((((a * values[None, :]) + b) % np.uint64(prime)).min(axis=1).tolist())
+
+        return tuple(min((a * value + b) % prime for value in hashes) for a, b in zip(self.hash_a, self.hash_b))
+
+    def add(self, text: str, author: str, tags: Iterable[str] = ()) -> int:
+        """
+        Adds a quote. The same text by the same author is one record, with the tags of every time it was added.
+
+        Parameters:
+            text (str): The text of the quote.
+            author (str): The author of the quote.
+            tags (Iterable[str]): The tags of the quote. Default is no tags.
+
+        Returns:
+            int: The id of the record.
+        """
+        key = (author, text)
+
+        if key in self.keys:
+            record_id = self.keys[key]
+            _, _, known = self.records[record_id]
+            new = tuple(tag for tag in dict.fromkeys(tags) if tag not in known)
+            self.records[record_id] = (text, author, known + new)
+            self.listings.extend((record_id, tag) for tag in new)
+            return record_id
+
+        record_id = len(self.records)
+        tags = tuple(dict.fromkeys(tags))
+        signature = self._signature(self._shingles(QuoteDeduplicator.normalize(text)))
+
+        self.keys[key] = record_id
+        self.records.append((text, author, tags))
+        self.listings.extend((record_id, tag) for tag in tags)
+        self.signatures.append(signature)
+
+        author_key = QuoteDeduplicator.normalize(author)        # Buckets are per author, so different authors are never compared
+        for band in range(self.bands):
+            self.buckets[author_key, band, signature[band * self.rows:(band + 1) * self.rows]].append(record_id)
+
+        return record_id
+
+    def add_quotes(self, quotes: Dict[str, Dict[str, List[str]]]) -> int:
+        """
+        Adds quotes in the shape returned by `scrape_all_quotes`, or read from `quotes.json`.
+
+        Parameters:
+            quotes (dict): Author -> tag -> list of quotes.
+
+        Returns:
+            int: The number of records afterwards.
+        """
+        for author, tags in quotes.items():
+            for tag, texts in tags.items():
+                for text in texts:
+                    self.add(text, author, [tag])
+
+        return len(self.records)
+
+    def similarity(self, first: int, second: int) -> float:
+        """
+        Estimates the Jaccard similarity of two records from their signatures.
+
+        Parameters:
+            first (int): The id of a record.
+            second (int): The id of another record.
+
+        Returns:
+            float: The fraction of equal signature values, between 0 and 1.
+        """
+        return sum(x == y for x, y in zip(self.signatures[first], self.signatures[second])) / self.num_perm
+
+    def clusters(self) -> List[List[int]]:
+        """
+        Groups duplicate records. Only records by the same author (compared normalized) sharing an LSH band are compared, and pairs above
+        `threshold` are joined (union-find), so a cluster can contain records that are similar through others, but never several authors.
+
+        Returns:
+            List[List[int]]: The ids of the records of every cluster of two or more, each cluster and the list in order of first id.
+        """
+        parent = list(range(len(self.records)))
+
+        def find(record_id: int) -> int:
+            while parent[record_id] != record_id:
+                parent[record_id] = parent[parent[record_id]]       # Path halving
+                record_id = parent[record_id]
+            return record_id
+
+        compared: set[Tuple[int, int]] = set()
+
+        for ids in self.buckets.values():
+            for i, first in enumerate(ids):
+                for second in ids[i + 1:]:
+                    if (first, second) in compared or find(first) == find(second):
+                        continue
+                    compared.add((first, second))
+
+                    if self.similarity(first, second) >= self.threshold:
+                        parent[max(find(first), find(second))] = min(find(first), find(second))
+
+        self.compared = len(compared)
+        groups: Dict[int, List[int]] = defaultdict(list)
+        for record_id in range(len(self.records)):
+            groups[find(record_id)].append(record_id)
+
+        return [ids for ids in groups.values() if len(ids) > 1]
+
+    def _canonical(self, ids: List[int]) -> int:
+        """The record a cluster is merged into: the one with the most tags, then the first added."""
+        return max(ids, key=lambda record_id: (len(self.records[record_id][2]), -record_id))
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Describes every cluster of duplicates.
+
+        Returns:
+            List[dict]: For every cluster, the canonical quote and author, the merged tags, and the variants (text and author) merged into it.
+        """
+        report = []
+
+        for ids in self.clusters():
+            canonical = self._canonical(ids)
+            text, author, _ = self.records[canonical]
+            tags = dict.fromkeys(tag for record_id in ids for tag in self.records[record_id][2])
+            variants = [{"text": self.records[record_id][0], "author": self.records[record_id][1]} for record_id in ids if record_id != canonical]
+            report.append({"quote": text, "author": author, "tags": list(tags), "variants": variants})
+
+        return report
+
+    def merged(self) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Returns the quotes with the records of every cluster merged into its canonical quote, which gets the tags of all of them.
+
+        Returns:
+            dict: Author -> tag -> list of quotes, like `scrape_all_quotes`. Authors, tags and quotes keep the order they were added in.
+        """
+        replaced: Dict[int, int] = dict()       # Id of a duplicate -> id of its canonical record
+
+        for ids in self.clusters():
+            canonical = self._canonical(ids)
+            replaced.update((record_id, canonical) for record_id in ids if record_id != canonical)
+
+        data: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        listed: set[Tuple[int, str]] = set()
+
+        # A duplicate is listed as its canonical quote, where it was listed first
+        for record_id, tag in self.listings:
+            record_id = replaced.get(record_id, record_id)
+            if (record_id, tag) in listed:
+                continue
+            listed.add((record_id, tag))
+
+            text, author, _ = self.records[record_id]
+            data[author][tag].append(text)
+
+        return {author: dict(author_tags) for author, author_tags in data.items()}
@@ -0,0 +1,366 @@
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from html import escape
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs, unquote
+import base64
+import json
+import random
+import re
+import threading
+import time
+
+
+class MockSite:
+    """
+    A local copy of quotes.toscrape.com and books.toscrape.com, with generated data and the same markup, served on two local ports.
+    It lets the scrapers be exercised (stress tests, benchmarks) without sending traffic to the real websites.
+    The sites can be much larger than the real ones (for example a million quotes, thousands of authors, 10^5 books in hundreds of genres):
+    quotes and books are indexed by tag, author and genre up front, so serving a page does not scan the data.
+
+    Instance Attributes:
+    ---------------------------
+        quotes: List[Tuple[str, str, List[str]]]
+            The quotes of the quotes website (text, author, tags).
+        books: List[Dict[str, Any]]
+            The books of the books website (title, slug, genre, price, rating, stock, UPC, and whether it has its own cover).
+        genres: List[str]
+            The genres of the books website: the names of `genres` (class attribute), then generated ones if there are more.
+        latency: float
+            Delay in seconds added to every response.
+        api: bool
+            Whether the quotes website serves the JSON API (`/api/quotes?page=N`).
+        search: bool
+            Whether the quotes website has the search form (`/search.aspx`, sent to `/filter.aspx` with a viewstate).
+        hits: Counter
+            Number of requests received for each website and path (with the query string), for example ("quotes", "/page/2/").
+        quotes_url: str
+            Base URL of the quotes website, once started.
+        books_url: str
+            Base URL of the books website, once started.
+
+    Methods:
+    ----------------------------
+    - `start`: Starts both servers in background threads.
+    - `stop`: Stops both servers.
+    - `author_slug`, `genre_slug`: URL slugs, as used on the real websites.
+    - `tag_quotes`, `author_quotes`, `genre_books`: The ground truth of a tag, an author or a genre.
+
+    Example:
+    ----------------------------
+    ```python
+    with MockSite(quote_count=100, book_count=500, latency=0.05) as site:
+        scraper = QuoteScraping(base_url=site.quotes_url)
+        print(scraper.author_list())
+        print(site.hits)
+    ```
+    """
+    tags = ["love", "life", "inspirational", "humor", "books", "reading", "friendship", "truth", "simile", "change"]
+    genres = ["Travel", "Mystery", "Historical Fiction", "Poetry", "Science", "Romance"]
+    ratings = ["One", "Two", "Three", "Four", "Five"]
+    quotes_per_page = 10
+    books_per_page = 20
+
+    def __init__(self, quote_count: int = 100, author_count: int = 20, book_count: int = 200, latency: float = 0.0, seed: int = 0,
+                 api: bool = True, search: bool = True, genre_count: Optional[int] = None) -> None:
+        """
+        Generates the data of both websites.
+
+        Parameters:
+            quote_count (int): Number of quotes. Default is 100.
+            author_count (int): Number of authors. Default is 20.
+            book_count (int): Number of books. Default is 200.
+            genre_count (int, optional): Number of genres. Default is the 6 of `genres`.
+            latency (float): Delay in seconds added to every response. Default is 0.
+            seed (int): Seed of the generated data. Default is 0.
+            api (bool): Whether the quotes website serves the JSON API. Default is True.
+            search (bool): Whether the quotes website has the search form. Default is True.
+        """
+        generator = random.Random(seed)
+        authors = [f"Author {chr(65 + i % 26)}{i:04d}" for i in range(author_count)]
+        genre_count = len(MockSite.genres) if genre_count is None else genre_count
+        self.genres = (MockSite.genres + [f"Genre {i:04d}" for i in range(len(MockSite.genres), genre_count)])[:genre_count]
+
+        self.quotes = [(f"“Quote number {i}.”", authors[i % author_count], sorted(generator.sample(MockSite.tags, 2)))
+                       for i in range(quote_count)]
+        self.books = [{"title": f"Book Title {i}", "slug": f"book-title-{i}_{i + 1}", "genre": self.genres[i % genre_count],
+                       "price": generator.randint(1000, 6000), "rating": generator.randint(1, 5), "stock": generator.randint(0, 25),
+                       "upc": f"{generator.getrandbits(64):016x}", "cover": i % 7 != 0} for i in range(book_count)]
+
+        self.authors = {MockSite.author_slug(author): author for author in authors}
+        self.books_by_slug = {book["slug"]: book for book in self.books}
+
+        # Indexes, so pages of large sites are served without scanning every quote or book
+        self.genre_slugs = {genre: genre.lower().replace(" ", "-") + f"_{i + 2}" for i, genre in enumerate(self.genres)}
+        self.genres_by_slug = {slug: genre for genre, slug in self.genre_slugs.items()}
+        self.quotes_by_tag: Dict[str, List[Tuple[str, str, List[str]]]] = {tag: [] for tag in MockSite.tags}
+        self.quotes_by_author: Dict[str, List[Tuple[str, str, List[str]]]] = {author: [] for author in authors}
+        self.books_by_genre: Dict[str, List[Dict[str, Any]]] = {genre: [] for genre in self.genres}
+        self.author_names = sorted(set(authors))
+
+        for quote in self.quotes:
+            self.quotes_by_author[quote[1]].append(quote)
+            for tag in quote[2]:
+                self.quotes_by_tag[tag].append(quote)
+        for book in self.books:
+            self.books_by_genre[book["genre"]].append(book)
+        self.latency = latency
+        self.api = api
+        self.search = search
+        self.hits: Counter = Counter()
+        self.lock = threading.Lock()
+        self.servers: List[ThreadingHTTPServer] = []
+        self.quotes_url = ""
+        self.books_url = ""
+
+    def __enter__(self) -> "MockSite":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @staticmethod
+    def author_slug(author: str) -> str:
+        return re.sub(r"[^A-Za-z0-9]+", "-", author).strip("-")
+
+    def genre_slug(self, genre: str) -> str:
+        return self.genre_slugs[genre]
+
+    def tag_quotes(self, tag: str) -> List[Tuple[str, str, List[str]]]:
+        """The quotes with a tag, in the order they are listed."""
+        return self.quotes_by_tag.get(tag, [])
+
+    def author_quotes(self, author: str) -> List[Tuple[str, str, List[str]]]:
+        """The quotes of an author, in the order they are listed."""
+        return self.quotes_by_author.get(author, [])
+
+    def genre_books(self, genre: str) -> List[Dict[str, Any]]:
+        """The books of a genre, in the order they are listed."""
+        return self.books_by_genre.get(genre, [])
+
+    def start(self) -> "MockSite":
+        """Starts the quotes and books servers on free local ports."""
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self.respond(urlsplit(self.path).query)
+
+            def do_POST(self) -> None:
+                # Form fields are read like a query string, and a form is counted as a hit of its path with its fields
+                self.respond(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+
+            def respond(self, query: str) -> None:
+                path = re.sub("/+", "/", unquote(urlsplit(self.path).path))
+
+                with site.lock:
+                    site.hits[self.server.website, path + ("?" + query if query else "")] += 1
+                if site.latency:
+                    time.sleep(site.latency)
+
+                route = site._quotes_route if self.server.website == "quotes" else site._books_route
+                status, body, content_type = route(path, parse_qs(query))
+                data = body.encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        for website in ("quotes", "books"):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+            server.daemon_threads = True
+            server.website = website
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            self.servers.append(server)
+
+        self.quotes_url = f"http://127.0.0.1:{self.servers[0].server_address[1]}/"
+        self.books_url = f"http://127.0.0.1:{self.servers[1].server_address[1]}/"
+        return self
+
+    def stop(self) -> None:
+        """Stops both servers."""
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        self.servers = []
+
+    # Quotes website
+
+    def _quote_html(self, quote: Tuple[str, str, List[str]]) -> str:
+        text, author, tags = quote
+        links = "".join(f'<a class="tag" href="/tag/{tag}/page/1/">{tag}</a>' for tag in tags)
+        return (f'<div class="quote"><span class="text">{escape(text)}</span><span>by <small class="author">{escape(author)}</small> '
+                f'<a href="/author/{MockSite.author_slug(author)}">(about)</a></span>'
+                f'<div class="tags">Tags: <meta class="keywords" content="{",".join(tags)}"/>{links}</div></div>')
+
+    def _quotes_page(self, quotes: List[Tuple[str, str, List[str]]], page: int, prefix: str, sidebar: bool) -> str:
+        size = MockSite.quotes_per_page
+        pager = '<nav><ul class="pager">'
+        if page * size < len(quotes):
+            pager += f'<li class="next"><a href="{prefix}page/{page + 1}/">Next <span aria-hidden="true">→</span></a></li>'
+        pager += "</ul></nav>"
+
+        tags_box = ""
+        if sidebar:
+            tags_box = '<div class="col-md-4 tags-box"><h2>Top Ten tags</h2>' + "".join(
+                f'<span class="tag-item"><a class="tag" href="/tag/{tag}/">{tag}</a></span>' for tag in MockSite.tags) + "</div>"
+
+        body = "".join(self._quote_html(quote) for quote in quotes[(page - 1) * size:page * size])
+        return f'<html><body><div class="row"><div class="col-md-8">{body}{pager}</div>{tags_box}</div></body></html>'
+
+    def _quotes_route(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, str, str]:
+        html = "text/html; charset=utf-8"
+
+        if path == "/":
+            return 200, self._quotes_page(self.quotes, 1, "/", True), html
+        if match := re.fullmatch(r"/page/(\d+)/?", path):
+            return 200, self._quotes_page(self.quotes, int(match[1]), "/", True), html
+        if match := re.fullmatch(r"/tag/([^/]+)/(?:page/(\d+)/?)?", path):
+            return 200, self._quotes_page(self.tag_quotes(match[1]), int(match[2] or 1), f"/tag/{match[1]}/", False), html
+        if match := re.fullmatch(r"/author/([^/]+)/?", path):
+            author = self.authors.get(match[1])
+            if author is None:
+                return 404, "Not found", html
+            return 200, (f'<html><body><div class="author-details"><h3 class="author-title">{escape(author)}</h3>'
+                         f'<p><strong>Born:</strong> <span class="author-born-date">March 14, 1879</span> '
+                         f'<span class="author-born-location">in Ulm, Germany</span></p>'
+                         f'<div class="author-description">{escape(author)} was born. One. Two. Three. Four. Five. Six.</div></div></body></html>'), html
+        if path.rstrip("/") == "/api/quotes" and self.api:
+            page = int(query.get("page", ["1"])[0])
+            size = MockSite.quotes_per_page
+            quotes = [{"author": {"name": author, "slug": MockSite.author_slug(author), "goodreads_link": ""}, "tags": tags, "text": text}
+                      for text, author, tags in self.quotes[(page - 1) * size:page * size]]
+            return 200, json.dumps({"has_next": page * size < len(self.quotes), "page": page, "quotes": quotes, "tag": None}), "application/json"
+
+        if path == "/search.aspx" and self.search:
+            return 200, self._search_page(None, []), html
+        if path == "/filter.aspx" and self.search:
+            return self._filter(query)
+
+        return 404, "Not found", html
+
+    def _search_page(self, author: Optional[str], results: List[Tuple[str, str, List[str]]], tag: Optional[str] = None) -> str:
+        """The search form, with the tags of the selected author and the quotes found."""
+        def options(values: List[str], selected: Optional[str]) -> str:
+            return "<option>----------</option>" + "".join(
+                f'<option value="{escape(value)}"{" selected" if value == selected else ""}>{escape(value)}</option>' for value in values)
+
+        tags = sorted({tag for _, _, tags in self.author_quotes(author) for tag in tags}) if author else []
+        viewstate = base64.b64encode(json.dumps({"author": author}).encode("utf-8")).decode("ascii")
+        found = "".join(f'<div class="quote"><span class="content">{escape(text)}</span><br><span class="author">{escape(name)}</span><br>'
+                        f'<span class="tag">{escape(tag or "")}</span></div>' for text, name, _ in results)
+
+        return (f'<html><body><form action="/filter.aspx" method="post" class="form-inline">'
+                f'<select id="author" name="author">{options(self.author_names, author)}</select>'
+                f'<select id="tag" name="tag">{options(tags, tag)}</select>'
+                f'<input type="submit" value="Search" class="btn btn-default submit_button" name="submit_button">'
+                f'<input type="hidden" name="__VIEWSTATE" value="{viewstate}"></form>{found}</body></html>')
+
+    def _filter(self, form: Dict[str, List[str]]) -> Tuple[int, str, str]:
+        """Answers the search form: selecting an author returns their tags, searching needs the viewstate of that author."""
+        html = "text/html; charset=utf-8"
+        author = form.get("author", [""])[0]
+        tag = form.get("tag", [""])[0]
+
+        try:
+            state = json.loads(base64.b64decode(form.get("__VIEWSTATE", [""])[0]))
+        except ValueError:
+            return 400, "Invalid viewstate", html
+        if author not in self.quotes_by_author:
+            return 400, "Unknown author", html
+
+        if "submit_button" not in form:
+            return 200, self._search_page(author, []), html
+
+        # A search is only valid with the viewstate returned when the author was selected
+        if state.get("author") != author:
+            return 400, "Invalid viewstate", html
+
+        results = [quote for quote in self.author_quotes(author) if tag in quote[2]]
+        return 200, self._search_page(author, results, tag), html
+
+    # Books website
+
+    def _books_page(self, books: List[Dict[str, Any]], page: int, root: str, next_format: str) -> str:
+        size = MockSite.books_per_page
+        pages = max(1, -(-len(books) // size))
+
+        side = (f'<ul class="nav nav-list"><li><a href="{root}catalogue/category/books_1/index.html">Books</a><ul>' + "".join(
+            f'<li><a href="{root}catalogue/category/books/{self.genre_slug(genre)}/index.html">{genre}</a></li>' for genre in self.genres)
+            + "</ul></li></ul>")
+
+        pods = "".join(
+            f'<article class="product_pod"><div class="image_container"><a href="{root}catalogue/{book["slug"]}/index.html">'
+            f'<img src="{root}media/cache/thumbs/{book["slug"]}.jpg" alt="{escape(book["title"])}" class="thumbnail"></a></div>'
+            f'<p class="star-rating {MockSite.ratings[book["rating"] - 1]}"></p>'
+            f'<h3><a href="{root}catalogue/{book["slug"]}/index.html" title="{escape(book["title"])}">{escape(book["title"][:20])}</a></h3>'
+            f'<div class="product_price"><p class="price_color">£{book["price"] // 100}.{book["price"] % 100:02d}</p></div></article>'
+            for book in books[(page - 1) * size:page * size])
+
+        pager = '<ul class="pager">'
+        if pages > 1:
+            pager += f'<li class="current">Page {page} of {pages}</li>'
+        if page < pages:
+            pager += f'<li class="next"><a href="{next_format.format(page + 1)}">next</a></li>'
+        pager += "</ul>"
+
+        return f'<html><body><div class="side_categories">{side}</div><section><ol class="row">{pods}</ol>{pager}</section></body></html>'
+
+    def _books_route(self, path: str, query: Dict[str, List[str]]) -> Tuple[int, str, str]:
+        html = "text/html; charset=utf-8"
+
+        if path in ("/", "/index.html"):
+            return 200, self._books_page(self.books, 1, "", "catalogue/page-{}.html"), html
+        if match := re.fullmatch(r"/catalogue/page-(\d+)\.html", path):
+            return 200, self._books_page(self.books, int(match[1]), "../", "page-{}.html"), html
+        if match := re.fullmatch(r"/catalogue/category/books/([^/]+)/(?:index|page-(\d+))\.html", path):
+            genre = self.genres_by_slug.get(match[1])
+            if genre is None:
+                return 404, "Not found", html
+            return 200, self._books_page(self.genre_books(genre), int(match[2] or 1), "../../../../", "page-{}.html"), html
+        if match := re.fullmatch(r"/media/cache/(thumbs/)?([^/]+)\.jpg", path):
+            # Books without a cover of their own share a placeholder image
+            book = self.books_by_slug.get(match[2])
+            if book is None:
+                return 404, "Not found", html
+            image = book["slug"] if book["cover"] else "placeholder"
+            return 200, image * (10 if match[1] else 100), "image/jpeg"
+        if match := re.fullmatch(r"/catalogue/([^/]+)/index\.html", path):
+            book = self.books_by_slug.get(match[1])
+            if book is None:
+                return 404, "Not found", html
+            return 200, (
+                f'<html><body><ul class="breadcrumb"><li><a href="../../index.html">Home</a></li>'
+                f'<li><a href="../category/books_1/index.html">Books</a></li>'
+                f'<li><a href="../category/books/{self.genre_slug(book["genre"])}/index.html">{book["genre"]}</a></li>'
+                f'<li class="active">{escape(book["title"])}</li></ul>'
+                f'<div id="product_gallery"><div class="item active"><img src="../../media/cache/{book["slug"]}.jpg" alt="{escape(book["title"])}"/></div></div>'
+                f'<div class="product_main"><h1>{escape(book["title"])}</h1><p class="price_color">£{book["price"] // 100}.{book["price"] % 100:02d}</p>'
+                f'<p class="instock availability"><i class="icon-ok"></i> In stock ({book["stock"]} available)</p>'
+                f'<p class="star-rating {MockSite.ratings[book["rating"] - 1]}"></p></div>'
+                f'<table class="table table-striped"><tr><th>UPC</th><td>{book["upc"]}</td></tr></table></body></html>'), html
+
+        return 404, "Not found", html
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serves generated copies of the quotes and books websites, of any size, on local ports.")
+    parser.add_argument("--quotes", type=int, default=100, help="Number of quotes. Default is 100.")
+    parser.add_argument("--authors", type=int, default=20, help="Number of authors. Default is 20.")
+    parser.add_argument("--books", type=int, default=200, help="Number of books. Default is 200.")
+    parser.add_argument("--genres", type=int, default=len(MockSite.genres), help=f"Number of genres. Default is {len(MockSite.genres)}.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay in seconds of every response. Default is 0.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated data. Default is 0.")
+    args = parser.parse_args()
+
+    with MockSite(args.quotes, args.authors, args.books, args.latency, args.seed, genre_count=args.genres) as site:
+        print(f"Quotes website: {site.quotes_url}")
+        print(f"Books website: {site.books_url}")
+        input("Press Enter to stop the servers...")
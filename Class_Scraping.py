@@ -1,97 +1,1253 @@
-import requests
-from bs4 import BeautifulSoup
-from collections import defaultdict
-from typing import Dict, List, Any, Tuple, Literal
+from __future__ import annotations
+from collections import defaultdict, deque, OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, List, Any, Tuple, Literal, Optional, Iterator, Callable, Union, TYPE_CHECKING
+import functools
+import itertools
 import json
+import os
+import re
+import stat
+import sys
 import random
+import tempfile
+import threading
 import time
-from colorama import Fore, init
-import difflib
+import importlib
+import importlib.util
+from urllib.parse import urljoin, urlsplit
+
+# requests, bs4, difflib and colorama are imported on first use, so importing this module (and starting the programs) stays fast
+if TYPE_CHECKING:
+    from Class_Archive import PageArchive
+    from Class_Covers import CoverDownloader
+    from bs4 import BeautifulSoup
+    from concurrent.futures import Future
+
+
+class _LazyFore:
+    """
+    Stands in for `colorama.Fore`. colorama is imported and initialised (once, with autoreset) the first time a color is used.
+    """
+    initialised = False
+
+    def __getattr__(self, name: str) -> str:
+        import colorama
+
+        if not _LazyFore.initialised:
+            colorama.init(autoreset=True)
+            _LazyFore.initialised = True
+
+        color = getattr(colorama.Fore, name)
+        setattr(self, name, color)      # Cached, so __getattr__ is only called once per color
+        return color
+
+
+Fore = _LazyFore()
+
+
+@dataclass(slots=True)
+class Quote:
+    """
+    A quote scraped from the quotes website. Tags and author names are interned, so repeated values share memory.
+
+    Attributes:
+    ---------------------------
+        text: str
+            The text of the quote.
+        author: str
+            The name of the author of the quote.
+        tags: Tuple[str, ...]
+            The tags associated with the quote.
+        author_url: str
+            The URL of the author's page.
+    """
+    text: str
+    author: str
+    tags: Tuple[str, ...] = ()
+    author_url: str = ""
+
+    def __post_init__(self) -> None:
+        self.author = sys.intern(self.author)
+        self.tags = tuple(sys.intern(tag) for tag in self.tags)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the quote as a dictionary with its text, author, author URL and list of tags."""
+        return {"text": self.text, "author": self.author, "author url": self.author_url, "tags": list(self.tags)}
+
+
+@dataclass(slots=True)
+class Author:
+    """
+    Details of an author scraped from the quotes website.
+
+    Attributes:
+    ---------------------------
+        name: str
+            The name of the author.
+        born: str
+            The birth date of the author.
+        location: str
+            The birth place of the author.
+        bio: str
+            The description of the author.
+        url: str
+            The URL of the author's page.
+    """
+    name: str
+    born: str
+    location: str
+    bio: str
+    url: str
+
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+
+    def to_dict(self) -> Dict[str, str]:
+        """Returns the author as a dictionary with birth date, location, bio and URL (the shape used by `author_details.json`)."""
+        return {"Born": self.born, "Location": self.location, "Bio": self.bio, "URL": self.url}
+
+
+@dataclass(slots=True)
+class Book:
+    """
+    Details of a book scraped from the books website. Prices are stored as integer pence, so they can be sorted and compared without parsing.
+
+    Attributes:
+    ---------------------------
+        title: str
+            The title of the book.
+        genre: str
+            The genre of the book.
+        upc: str
+            The Universal Product Code of the book.
+        price: int
+            The price of the book in pence (-1 if unknown).
+        rating: int
+            The rating of the book, from 1 to 5 (0 if unknown).
+        availability: str
+            The availability text of the book, for example "In stock (22 available)".
+        url: str
+            The URL of the book's page.
+        image_url: str
+            The URL of the full-size cover image ("" if unknown).
+    """
+    title: str
+    genre: str
+    upc: str
+    price: int
+    rating: int
+    availability: str
+    url: str
+    image_url: str = ""
+
+    def __post_init__(self) -> None:
+        self.genre = sys.intern(self.genre)
+        self.availability = sys.intern(self.availability)
+
+    @staticmethod
+    def parse_price(price: str) -> int:
+        """
+        Converts a price string such as '£51.77' to integer pence (5177).
+
+        Raises:
+            ValueError: If no price is found in the string.
+        """
+        match = re.search(r"(\d+)(?:\.(\d{1,2}))?", price.replace(",", ""))
+
+        if not match:
+            raise ValueError(Fore.RED + f"No price found in '{price}'")
+
+        pounds, pence = match.group(1), (match.group(2) or "0").ljust(2, "0")
+        return int(pounds) * 100 + int(pence)
+
+    @property
+    def price_text(self) -> str:
+        """The price formatted as on the website, for example '£51.77' ("" if unknown)."""
+        if self.price < 0:
+            return ""
+        return f"£{self.price // 100}.{self.price % 100:02d}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the book as a dictionary with genre, UPC, price, rating, availability, URL and cover image URL."""
+        return {"Genre": self.genre, "UPC": self.upc, "Price": self.price_text, "Rating": self.rating, "Availability": self.availability, "URL": self.url,
+                "Image": self.image_url}
+
+
+class Transport:
+    """
+    The HTTP layer used by the scraping classes for every request.
+    It keeps connections alive in per-host pools, asks for compressed responses, and can use HTTP/2 through httpx.
+
+    Instance Attributes:
+    ---------------------------
+        timeout: int
+            Default timeout for requests in seconds.
+        http2: bool
+            True if requests are sent with httpx over HTTP/2, False if they are sent with requests over HTTP/1.1.
+        headers: Dict[str, str]
+            Headers sent with every request (keep-alive and accepted encodings).
+        session: requests.Session | httpx.Client
+            The client of the current thread. requests sessions are per thread and share the connection pools of the transport;
+            the httpx client is shared. Pools are created (and requests or httpx imported) when the first request is sent.
+        errors: Tuple[type, ...]
+            Exception types raised by the client when a request fails.
+
+    Methods:
+    ------------------------
+    - `get`: Sends a GET request through the connection pool.
+    - `post`: Sends a form with a POST request through the connection pool.
+    - `stream`: Sends a GET request whose body is read in chunks, for large files.
+    - `close`: Closes all pooled connections.
+
+    Example:
+    ------------------------
+    ```python
+    transport = Transport(pool_maxsize=20, pool_sizes={"https://books.toscrape.com/": 50})
+    books = BookScraping(transport=transport)
+    ```
+    """
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_sizes: Optional[Dict[str, int]] = None,
+                 http2: bool = False, timeout: int = 5) -> None:
+        """
+        Initializes the transport and its connection pools.
+
+        Parameters:
+            pool_connections (int): Number of hosts whose connection pools are kept. Default is 10.
+            pool_maxsize (int): Maximum number of kept-alive connections per host. Default is 10.
+            pool_sizes (Dict[str, int], optional): Pool sizes for specific URL prefixes (for example a host), overriding `pool_maxsize`.
+            http2 (bool): If True, requests are sent with httpx over HTTP/2, which multiplexes them over one connection per host. Default is False.
+            timeout (int): Default timeout for requests in seconds. Default is 5.
+
+        Raises:
+            ImportError: If `http2` is True and httpx with HTTP/2 support is not installed.
+        """
+        self.timeout = timeout
+        self.http2 = http2
+        self.headers = {"Connection": "keep-alive", "Accept-Encoding": Transport.accept_encoding()}
+
+        if http2 and (importlib.util.find_spec("httpx") is None or importlib.util.find_spec("h2") is None):
+            raise ImportError(Fore.RED + "HTTP/2 needs httpx with HTTP/2 support: pip install 'httpx[http2]'")
+
+        # The client (and requests or httpx) is only created when the first request is sent
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_sizes = pool_sizes or {}
+        self._client: Any = None
+        self._adapters: Dict[str, Any] = dict()
+        self._errors: Tuple[type, ...] = ()
+        self._lock = threading.Lock()
+
+        # requests sessions are not thread-safe, so every thread gets its own session
+        # The sessions share the same adapters, so they share the (thread-safe) connection pools
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+
+    def _connect(self) -> None:
+        """Imports the HTTP library and creates the connection pools (the httpx client, or the requests adapters)."""
+        with self._lock:
+            if self._errors:
+                return
+
+            if self.http2:
+                import httpx
+                limits = httpx.Limits(max_connections=self._pool_connections * self._pool_maxsize, max_keepalive_connections=self._pool_maxsize)
+                self._client = httpx.Client(http2=True, limits=limits, headers=self.headers, timeout=self.timeout, follow_redirects=True)
+                self._errors = (httpx.HTTPError,)
+
+            else:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                adapter = HTTPAdapter(pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize)
+                self._adapters = {"http://": adapter, "https://": adapter}
+
+                # Separate pools for specific hosts
+                for prefix, size in self._pool_sizes.items():
+                    self._adapters[prefix] = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+
+                self._errors = (requests.exceptions.RequestException,)
+
+    @property
+    def session(self) -> Any:
+        """The client of the current thread: a requests session sharing the pools of the transport, or the shared httpx client."""
+        if not self._errors:
+            self._connect()
+        if self.http2:
+            return self._client     # httpx clients are thread-safe
+
+        session = getattr(self._local, "session", None)
+
+        if session is None:
+            import requests
+
+            session = requests.Session()
+            session.headers.update(self.headers)
+            for prefix, adapter in self._adapters.items():
+                session.mount(prefix, adapter)
+
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+    @property
+    def errors(self) -> Tuple[type, ...]:
+        """Exception types raised by the client when a request fails."""
+        if not self._errors:
+            self._connect()
+        return self._errors
+
+    @staticmethod
+    def accept_encoding() -> str:
+        """Returns the Accept-Encoding header value. Brotli is only accepted if a brotli decoder is installed."""
+        encodings = "gzip, deflate"
+
+        if importlib.util.find_spec("brotli") is not None or importlib.util.find_spec("brotlicffi") is not None:
+            encodings += ", br"
+        return encodings
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+        """
+        Sends a GET request through the connection pool.
+
+        Parameters:
+            url (str): The URL to fetch.
+            headers (Dict[str, str], optional): Extra headers for this request.
+            timeout (float, optional): Timeout in seconds. Default is the transport's timeout.
+
+        Returns:
+            requests.Response | httpx.Response: The response. Both have `text`, `content` and `status_code`.
+
+        Raises:
+            Any of `errors`: If the request fails.
+        """
+        return self.session.get(url, headers=headers, timeout=timeout or self.timeout)
+
+    def post(self, url: str, data: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+        """
+        Sends a form with a POST request through the connection pool.
+
+        Parameters:
+            url (str): The URL the form is sent to.
+            data (Dict[str, str]): The fields of the form.
+            headers (Dict[str, str], optional): Extra headers for this request.
+            timeout (float, optional): Timeout in seconds. Default is the transport's timeout.
+
+        Returns:
+            requests.Response | httpx.Response: The response.
+
+        Raises:
+            Any of `errors`: If the request fails.
+        """
+        return self.session.post(url, data=data, headers=headers, timeout=timeout or self.timeout)
+
+    @contextmanager
+    def stream(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None,
+               chunk_size: int = 64 * 1024) -> Iterator[Tuple[Any, Iterator[bytes]]]:
+        """
+        Sends a GET request through the connection pool without reading the body, which is then read in chunks.
+        The connection goes back to the pool when the block ends.
+
+        Parameters:
+            url (str): The URL to fetch.
+            headers (Dict[str, str], optional): Extra headers for this request.
+            timeout (float, optional): Timeout in seconds. Default is the transport's timeout.
+            chunk_size (int): Size of the chunks in bytes. Default is 64 KiB.
+
+        Yields:
+            tuple: The response (with `status_code` and `headers`) and an iterator over the chunks of its body.
+
+        Raises:
+            Any of `errors`: If the request fails.
+
+        Example:
+        ```python
+        with transport.stream("https://books.toscrape.com/media/cache/cover.jpg") as (response, chunks):
+            for chunk in chunks:
+                file.write(chunk)
+        ```
+        """
+        if self.http2:
+            with self.session.stream("GET", url, headers=headers, timeout=timeout or self.timeout) as response:
+                yield response, response.iter_bytes(chunk_size)
+            return
+
+        response = self.session.get(url, headers=headers, timeout=timeout or self.timeout, stream=True)
+        try:
+            yield response, response.iter_content(chunk_size)
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Closes all pooled connections."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+
+            for session in self._sessions:
+                session.close()
+            for adapter in set(self._adapters.values()):
+                adapter.close()
+
+
+class RequestScheduler:
+    """
+    Schedules the requests of all scrapers sharing it, so interactive lookups are not stuck behind bulk crawls.
+
+    Requests are grouped in jobs (one call of a scraping method), and every job belongs to a priority class.
+    - Interactive requests are always dispatched before bulk requests.
+    - Jobs of the same class take turns (round robin), so one large crawl cannot starve another.
+    - At most `per_host` requests run at the same time on a host, and `interactive_slots` of them are kept free for interactive requests.
+    - The delay between requests (politeness) is applied per job, so it only slows down the job that makes many requests.
+
+    Class Attributes:
+    ---------------------------
+        priorities: Dict[str, int]
+            The priority classes, lower values are dispatched first.
+
+    Instance Attributes:
+    ---------------------------
+        workers: int
+            Number of threads sending requests.
+        per_host: int
+            Maximum number of requests running at the same time on one host.
+        interactive_slots: int
+            Number of the per-host slots that bulk requests cannot use.
+
+    Methods:
+    ----------------------------
+    - `shared`: Returns the scheduler shared by all scrapers that are not given one.
+    - `job`: Context manager running the requests made inside it as one job of a priority class.
+    - `submit`: Queues a request and returns a future for its response.
+
+    Example:
+    ----------------------------
+    ```python
+    scheduler = RequestScheduler(workers=8, per_host=4)
+    quotes = QuoteScraping(scheduler=scheduler)
+    books = BookScraping(scheduler=scheduler)
+    ```
+    """
+    priorities = {"interactive": 0, "bulk": 1}
+    _shared: Optional["RequestScheduler"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, workers: int = 4, per_host: int = 2, interactive_slots: int = 1) -> None:
+        """
+        Initializes the scheduler and starts its worker threads.
+
+        Parameters:
+            workers (int): Number of threads sending requests. Default is 4.
+            per_host (int): Maximum number of requests running at the same time on one host. Default is 2.
+            interactive_slots (int): Number of the per-host slots reserved for interactive requests. Default is 1.
+
+        Raises:
+            ValueError: If `workers` or `per_host` is not positive, or `interactive_slots` is not smaller than `per_host`.
+        """
+        if workers < 1 or per_host < 1:
+            raise ValueError(Fore.RED + "workers and per_host must be positive")
+        if not 0 <= interactive_slots < per_host:
+            raise ValueError(Fore.RED + "interactive_slots must be at least 0 and smaller than per_host")
+
+        self.workers = workers
+        self.per_host = per_host
+        self.interactive_slots = interactive_slots
+
+        self._condition = threading.Condition()
+        self._queues: dict[int, OrderedDict[Any, deque]] = {priority: OrderedDict() for priority in sorted(RequestScheduler.priorities.values())}
+        self._running: defaultdict[str, int] = defaultdict(int)       # Host -> number of running requests
+        self._next_start: dict[Any, float] = dict()        # Job -> earliest time its next request may start
+        self._context = threading.local()       # Job of the current thread
+        self._job_ids = itertools.count()
+
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"RequestScheduler-{i}", daemon=True).start()
+
+    @classmethod
+    def shared(cls) -> "RequestScheduler":
+        """Returns the scheduler shared by all scrapers that are not given one, creating it on first use."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @contextmanager
+    def job(self, priority: Literal['interactive', 'bulk']) -> Iterator[None]:
+        """
+        Runs the requests made by the current thread inside the block as one job of the given priority class.
+        Nested jobs are part of the outer job.
+
+        Parameters:
+            priority (Literal['interactive', 'bulk']): The priority class of the job.
+
+        Raises:
+            ValueError: If `priority` is not a known priority class.
+        """
+        if priority not in RequestScheduler.priorities:
+            raise ValueError(Fore.RED + f"priority must be one of {', '.join(RequestScheduler.priorities)}")
+
+        if getattr(self._context, "job", None) is not None:     # Part of an outer job
+            yield
+            return
+
+        self._context.job = (next(self._job_ids), priority)
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._next_start.pop(self._context.job[0], None)
+            self._context.job = None
+
+    def submit(self, function: Callable[[str], Any], url: str, delay: Tuple[float, float] = (0, 0),
+               priority: Optional[Literal['interactive', 'bulk']] = None) -> Future:
+        """
+        Queues a request in the job of the current thread (or in a new interactive job) and returns a future for its result.
+
+        Parameters:
+            function (Callable[[str], Any]): The function sending the request, called with `url` by a worker thread.
+            url (str): The URL of the request, used for the per-host limit.
+            delay (Tuple[float, float]): Range of the random delay between the starts of two requests of the same job. Default is no delay.
+            priority (Literal['interactive', 'bulk'], optional): If given, the request is a job of its own in this priority class,
+                instead of a part of the job of the current thread. Default is None.
+
+        Returns:
+            Future: A future for the value returned by `function`.
+
+        Raises:
+            ValueError: If `priority` is not a known priority class.
+        """
+        if priority is not None:
+            if priority not in RequestScheduler.priorities:
+                raise ValueError(Fore.RED + f"priority must be one of {', '.join(RequestScheduler.priorities)}")
+            job = next(self._job_ids)
+        else:
+            job, priority = getattr(self._context, "job", None) or (next(self._job_ids), "interactive")
+        from concurrent.futures import Future      # Imported here, as it pulls in logging
+
+        future: Future = Future()
+
+        with self._condition:
+            queue = self._queues[RequestScheduler.priorities[priority]].setdefault(job, deque())
+            queue.append((function, url, delay, future))
+            self._condition.notify_all()
+
+        return future
+
+    def _next_task(self) -> Tuple[Any, Callable[[str], Any], str, Tuple[float, float], Future]:
+        """Waits for the next request that can start and removes it from its queue. Must be called with the lock held."""
+        while True:
+            now = time.monotonic()
+            wake_up = None      # Earliest time a job waiting for its delay may start
+
+            for priority, jobs in self._queues.items():
+                host_limit = self.per_host if priority == 0 else self.per_host - self.interactive_slots
+
+                for job, queue in jobs.items():
+                    function, url, delay, future = queue[0]
+                    host = urlsplit(url).netloc
+
+                    if self._running[host] >= host_limit:
+                        continue
+                    if self._next_start.get(job, 0) > now:
+                        wake_up = self._next_start[job] if wake_up is None else min(wake_up, self._next_start[job])
+                        continue
+
+                    queue.popleft()
+                    if queue:
+                        jobs.move_to_end(job)       # Other jobs take their turn first
+                    else:
+                        del jobs[job]
+
+                    self._running[host] += 1
+                    self._next_start[job] = now + random.uniform(delay[0], delay[1])
+                    return job, function, url, delay, future
+
+            self._condition.wait(None if wake_up is None else wake_up - now)
+
+    def _work(self) -> None:
+        """Loop of a worker thread: takes the next request that can start, runs it and releases its host slot."""
+        while True:
+            with self._condition:
+                job, function, url, delay, future = self._next_task()
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(function(url))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            with self._condition:
+                self._running[urlsplit(url).netloc] -= 1
+                self._condition.notify_all()
+
+
+def scheduled(priority: Union[Literal['interactive', 'bulk'], Callable[..., str]]) -> Callable:
+    """
+    Decorator running a scraping method as one job of the given priority class in the scraper's `RequestScheduler`.
+
+    Parameters:
+        priority (Literal['interactive', 'bulk'] | Callable): The priority class of the job, or a function choosing it per call,
+            called with the arguments of the method (including `self`).
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.scheduler.job(priority(self, *args, **kwargs) if callable(priority) else priority):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised by a lookup that has no partial result to return when its `Deadline` expires.
+    The marker to resume from is in `resume` (and in `Deadline.resume`).
+    """
+    def __init__(self, message: str, resume: Dict[str, Any]) -> None:
+        super().__init__(message)
+        self.resume = resume
+
+
+class Deadline:
+    """
+    A time budget and cancellation token for one call of a long-running scraping method.
+
+    The method checks it before every request it would send. Once the budget has run out (or `cancel` was called, for example
+    from another thread), no new request is sent: the request already in flight is finished and its page is kept, then the method
+    returns what it has scraped so far and leaves a marker in `resume`. Passing that marker as `resume` to the same method
+    scrapes the rest. So a call takes at most its budget plus one request (and the politeness delay before it).
+
+    Instance Attributes:
+    ---------------------------
+        seconds: float | None
+            The budget, counted from the creation of the deadline. None never expires, only `cancel` stops the call.
+        expires: float | None
+            The `time.monotonic()` time the budget runs out.
+        resume: Dict[str, Any] | None
+            Where the method stopped, for example {"page": 7, "url": "..."}. None if it finished.
+
+    Methods:
+    ----------------------------
+    - `cancel`: Stops the call before its next request.
+    - `expired`: Whether the budget has run out or the call was cancelled.
+    - `remaining`: Seconds left in the budget.
+    - `start`: The page a resume marker starts from.
+
+    Example:
+    ----------------------------
+    ```python
+    scraper = QuoteScraping()
+    deadline = Deadline(2.0)
+    quotes = scraper.scrape_all_quotes(deadline=deadline)
+    while deadline.resume is not None:      # Partial result
+        marker, deadline = deadline.resume, Deadline(2.0)
+        more = scraper.scrape_all_quotes(deadline=deadline, resume=marker)
+    ```
+    """
+    def __init__(self, seconds: Optional[float] = None) -> None:
+        """
+        Initializes the deadline. The budget starts now.
+
+        Parameters:
+            seconds (float, optional): The budget in seconds. Default is None (no time limit, only cancellation).
+
+        Raises:
+            ValueError: If `seconds` is negative.
+        """
+        if seconds is not None and seconds < 0:
+            raise ValueError(Fore.RED + "seconds must not be negative")
+
+        self.seconds = seconds
+        self.expires = None if seconds is None else time.monotonic() + seconds
+        self.resume: Optional[Dict[str, Any]] = None
+        self._cancelled = threading.Event()
+
+    def cancel(self) -> None:
+        """Stops the call before its next request. Safe to call from any thread."""
+        self._cancelled.set()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget has run out or the call was cancelled."""
+        return self._cancelled.is_set() or (self.expires is not None and time.monotonic() >= self.expires)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left in the budget (0 once cancelled), or None without a time limit."""
+        if self._cancelled.is_set():
+            return 0.0
+        return None if self.expires is None else max(0.0, self.expires - time.monotonic())
+
+    @staticmethod
+    def start(resume: Optional[Dict[str, Any]]) -> Optional[Tuple[int, str]]:
+        """
+        Returns the number and URL of the page a resume marker starts from.
+
+        Parameters:
+            resume (Dict[str, Any], optional): A marker left in `resume` by a scraping method.
+
+        Returns:
+            tuple: The page number and URL, or None without a marker (start from the first page).
+
+        Raises:
+            ValueError: If the marker has no page number and URL.
+        """
+        if resume is None:
+            return None
+        if not isinstance(resume.get("page"), int) or resume["page"] < 1 or not isinstance(resume.get("url"), str):
+            raise ValueError(Fore.RED + "resume must be a marker left in Deadline.resume by a listing crawl")
+        return resume["page"], resume["url"]
 
 
 class CommonMethods:
     """
     A base class for common methods used in scraping applications.
 
+    Class Attributes:
+    ---------------------------
+        json_backend: Literal['auto', 'orjson', 'msgspec', 'json']
+            The library used to serialize JSON. 'auto' uses orjson or msgspec when installed, and the standard json module otherwise.
+            Indented output is always indented with 4 spaces, so orjson (which only indents with 2) is only used for compact output.
+        parser: Literal['html.parser', 'lxml', 'html5lib']
+            The parser used by BeautifulSoup. lxml and html5lib must be installed to be selected.
+        alias_file: str | None
+            The JSON file of the `AliasCache` shared by the scrapers created afterwards. None gives every scraper its own in-memory cache.
+
     Instance Attributes:
     ---------------------------
         timeout: int 
             Timeout for requests in seconds.
+        transport: Transport
+            The transport used for every request, with its connection pools.
+        scheduler: RequestScheduler
+            The scheduler that dispatches every request by priority. It can be shared by several scrapers.
         session: requests.Session 
             A requests session for making HTTP requests. Sessions are more efficient for multiple requests.
         header: Dict[str, str] 
             Headers to mimic a browser request.
         delay: List[int] 
             Random delay between requests to avoid increasing traffic on the server.
+        auto_confirm: bool | None
+            Answer to "Did you mean ...?" questions about similar names, for scripts without a user. None asks the user.
+        prefetched: Dict[str, Future]
+            Responses requested ahead of time with `prefetch`, by URL, until they are fetched or `prefetch_ttl` has passed.
+        prefetch_ttl: float
+            Seconds after which a prefetched response that was never fetched is dropped.
+        speculative: bool
+            If True, the detail page of every author or book a lookup resolves (or suggests) is fetched and parsed in the background,
+            so the details are ready when they are asked for.
+        speculation_limit: int
+            Maximum number of speculative requests kept queued. The oldest is cancelled if it has not started.
+        archive: PageArchive | None
+            If set, every page fetched from the network is written to this archive, so it can be parsed again offline (see `Class_Archive`).
+        aliases: AliasCache
+            The names users meant when they misspelled one, consulted before any fuzzy matching.
+
+    Methods:
+    ------------------------
+    - `fetch`: Fetches a page through the transport.
+    - `post_form`: Sends a form through the transport.
+    - `prefetch`: Requests pages ahead of time, so they are fetched concurrently.
+    - `single_flight`: Shares one call between concurrent callers with the same key.
+    - `parse`: Parses a page with the selected parser.
+    - `confirm_match`: Asks the user whether a similar name is the one they meant.
+    - `confirm_alias`: Asks the same, and learns the answer in `aliases`.
+    - `write_to_json`: Writes the scraped data to a JSON file.
+    - `read_from_json`: Reads data from a JSON file.
+    - `dumps_json`: Serializes data to JSON bytes with the selected backend.
+    - `loads_json`: Parses JSON bytes with the selected backend.
+    - `to_plain`: Converts records in the scraped data to dictionaries.
+    - `write_to_text`: Writes the scraped data to a text file.
+    """
+    json_backend: Literal['auto', 'orjson', 'msgspec', 'json'] = 'auto'
+    parser: Literal['html.parser', 'lxml', 'html5lib'] = 'html.parser'
+    alias_file: Optional[str] = None
+
+    def __init__(self, transport: Optional[Transport] = None, scheduler: Optional[RequestScheduler] = None) -> None:
+        """
+        Initializes the class with a session, headers, and timeout settings.
+
+        Parameters:
+            transport (Transport, optional): The transport used for every request. It can be shared by several scrapers. Default is a new `Transport`.
+            scheduler (RequestScheduler, optional): The scheduler that dispatches every request. Default is the scheduler shared by all scrapers.
+
+        Attributes:
+            timeout (int): Timeout for requests in seconds. Recommended to keep it low to avoid long waits.
+            transport (Transport): The transport used for every request.
+            scheduler (RequestScheduler): The scheduler that dispatches every request by priority.
+            session (requests.Session): A requests session for making HTTP requests. Sessions are more efficient for multiple requests.
+            header (Dict[str, str]): Headers to mimic a browser request.
+            delay (List[int]): Random delay between requests to avoid increasing traffic on the server.
+            auto_confirm (bool | None): Answer to "Did you mean ...?" questions about similar names. None asks the user. Default is None.
+            prefetched (Dict[str, Future]): Responses requested ahead of time with `prefetch`, by URL, until they are fetched.
+            prefetch_ttl (float): Seconds after which a prefetched response that was never fetched is dropped. Default is 300.
+            speculative (bool): If True, lookups fetch and parse the detail page they resolve in the background. Default is False.
+            speculation_limit (int): Maximum number of speculative requests kept queued. Default is 4.
+            archive (PageArchive | None): The archive every fetched page is written to. Default is None (pages are not archived).
+            aliases (AliasCache): The names users meant when they misspelled one. Shared by all scrapers when `alias_file` is set.
+        """
+        self.timeout = 5
+        self.transport = transport if transport is not None else Transport(timeout=self.timeout)
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler.shared()
+        self.header = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"}      # Chrome browser string
+        self.delay = [1, 2]
+        self.auto_confirm: Optional[bool] = None
+        self.prefetched: Dict[str, Future] = dict()
+        self.prefetch_ttl = 300.0
+        self.speculative = False
+        self.speculation_limit = 4
+        self.archive: Optional[PageArchive] = None
+        self.aliases = AliasCache.shared(CommonMethods.alias_file)
+
+        # Calls in progress, by key, so concurrent callers asking for the same page share one call (see `single_flight`)
+        self._in_flight: Dict[Any, Future] = dict()
+        self._flight_lock = threading.Lock()
+
+        self._prefetch_times: Dict[str, float] = dict()        # URL -> time it was prefetched, for `prefetch_ttl`
+        self._speculations: deque = deque()        # URLs of the latest speculative requests, oldest first
+
+    @property
+    def session(self) -> Any:
+        """The session (or HTTP/2 client) of the transport, holding the connection pools."""
+        return self.transport.session
+
+    def parse(self, markup: str) -> BeautifulSoup:
+        """
+        Parses a page with BeautifulSoup and the parser selected in `parser`. bs4 is imported on the first call.
+
+        Parameters:
+            markup (str): The HTML of the page.
+
+        Returns:
+            BeautifulSoup: The parsed page.
+        """
+        from bs4 import BeautifulSoup
+        return BeautifulSoup(markup, self.parser)
+
+    def confirm_match(self, name: str) -> str:
+        """
+        Asks the user whether a similar name found on the website is the one they meant.
+
+        Parameters:
+            name (str): The similar name.
+
+        Returns:
+            str: The answer, 'y' or anything else for no. When `auto_confirm` is set, it is answered without asking.
+        """
+        if self.auto_confirm is not None:
+            return 'y' if self.auto_confirm else 'n'
+        return input(Fore.YELLOW + f"Did you mean '{name}'? (y/n): ")
+
+    def confirm_alias(self, kind: str, query: str, name: str) -> bool:
+        """
+        Asks whether a similar name is the one the user meant (see `confirm_match`).
+        A confirmed name is learned in `aliases`, so the same query resolves to it afterwards without asking again.
+
+        Parameters:
+            kind (str): What the name is, for example 'author', 'genre' or 'book'.
+            query (str): The name as the user typed it.
+            name (str): The similar name.
+
+        Returns:
+            bool: True if the user meant the similar name.
+        """
+        import difflib
+
+        if self.confirm_match(name).lower().strip() != 'y':
+            return False
+
+        confidence = difflib.SequenceMatcher(None, " ".join(query.lower().split()), name.lower()).ratio()
+        self.aliases.learn(kind, query, name, confidence)
+        return True
+
+    def fetch(self, url: str) -> Any:
+        """
+        Fetches a page through the scheduler and the transport. Every request of the scraping classes goes through this method.
+        The request belongs to the current job of the scheduler, and `delay` is applied between the requests of that job.
+
+        Parameters:
+            url (str): The URL of the page.
+
+        Returns:
+            requests.Response | httpx.Response: The response.
+
+        Raises:
+            Exception: If there is an error fetching the page.
+        """
+        def send() -> Any:
+            future = self.prefetched.pop(url, None)       # Requested ahead of time with `prefetch`
+            self._prefetch_times.pop(url, None)
+
+            if future is None or future.cancelled():
+                future = self.scheduler.submit(self._send, url, delay=(self.delay[0], self.delay[1]))
+
+            try:
+                return future.result()
+            except self.transport.errors as e:
+                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
+
+        # Threads fetching the same URL at the same time share one request
+        return self.single_flight(("fetch", url), send)
+
+    def single_flight(self, key: Any, function: Callable[[], Any]) -> Any:
+        """
+        Calls a function, unless a call with the same key is already in progress in another thread.
+        In that case, waits for that call and returns its result (or raises its exception) instead, so concurrent callers share one call.
+
+        Parameters:
+            key (Any): Identifies the work, for example ("fetch", url).
+            function (Callable[[], Any]): The work to do.
+
+        Returns:
+            Any: The value returned by the function.
+        """
+        from concurrent.futures import Future
+
+        with self._flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._flight_lock:
+                del self._in_flight[key]
+
+    def _send(self, url: str) -> Any:
+        """Sends a request through the transport with the headers and timeout of the scraper, and archives the response if `archive` is set."""
+        response = self.transport.get(url, headers=self.header, timeout=self.timeout)
+
+        if self.archive is not None:
+            self.archive.add(url, response)
+        return response
+
+    def post_form(self, url: str, data: Dict[str, str]) -> Any:
+        """
+        Sends a form through the scheduler and the transport, like `fetch` does for pages.
+        Forms are not shared between threads or prefetched, as their result depends on the fields (and the state) they carry.
+
+        Parameters:
+            url (str): The URL the form is sent to.
+            data (Dict[str, str]): The fields of the form.
+
+        Returns:
+            requests.Response | httpx.Response: The response.
+
+        Raises:
+            Exception: If there is an error sending the form.
+        """
+        future = self.scheduler.submit(lambda url: self._post(url, data), url, delay=(self.delay[0], self.delay[1]))
+
+        try:
+            return future.result()
+        except self.transport.errors as e:
+            raise Exception(Fore.RED + f"Error sending the form to {url}: {e}")
+
+    def _post(self, url: str, data: Dict[str, str]) -> Any:
+        """Sends a form through the transport with the headers and timeout of the scraper."""
+        return self.transport.post(url, data, headers=self.header, timeout=self.timeout)
+
+    def prefetch(self, urls: List[str], priority: Literal['interactive', 'bulk'] = 'bulk') -> int:
+        """
+        Requests pages ahead of time, all at once, so the scheduler can fetch them concurrently.
+        The next `fetch` of each URL returns the prefetched response instead of sending a new request.
+        URLs that are already prefetched (or repeated in `urls`) are requested once.
+
+        Parameters:
+            urls (List[str]): The URLs of the pages that will be fetched.
+            priority (Literal['interactive', 'bulk']): The priority of the requests. Default is 'bulk'.
+
+        Returns:
+            int: The number of requests sent.
+
+        Example:
+        ```python
+        scraper = BookScraping()
+        scraper.prefetch(list(scraper.plan_pages(scraper.base_url))[1:])
+        books = scraper.scrape_all_books()      # Pages are read from the prefetched responses
+        ```
+        """
+        sent = 0
+        self._expire_prefetched()
+
+        with self.scheduler.job(priority):
+            for url in urls:
+                if url not in self.prefetched:
+                    self.prefetched[url] = self.scheduler.submit(self._send, url, delay=(self.delay[0], self.delay[1]))
+                    self._prefetch_times[url] = time.monotonic()
+                    sent += 1
+
+        return sent
+
+    def _expire_prefetched(self) -> None:
+        """Drops the prefetched responses older than `prefetch_ttl` that were never fetched, cancelling their requests if they have not started."""
+        expired = time.monotonic() - self.prefetch_ttl
+
+        for url, prefetched_at in list(self._prefetch_times.items()):
+            if prefetched_at < expired:
+                future = self.prefetched.pop(url, None)
+                self._prefetch_times.pop(url, None)
+                if future is not None:
+                    future.cancel()
+
+    def _speculate(self, url: str, details: Dict[str, Any], parse: Callable[[BeautifulSoup, str], Any]) -> None:
+        """
+        Fetches and parses a detail page in the background when `speculative` is set, so it is in `details` before it is asked for.
+        The request is a 'bulk' job of its own, so it only uses the capacity lookups leave idle. Until it is parsed, it is in `prefetched`:
+        a method asking for the page meanwhile waits for that request instead of sending another one.
+        Only the latest `speculation_limit` speculative requests are kept queued. Errors are ignored: the page is fetched again,
+        and the error reported, when it is asked for.
+
+        Parameters:
+            url (str): The URL of the page.
+            details (Dict[str, Any]): The cache the parsed page is stored in, by URL, for example `author_details`.
+            parse (Callable[[BeautifulSoup, str], Any]): Extracts the details from the parsed page and its URL, for example `_parse_author`.
+        """
+        if not self.speculative or url in details or url in self.prefetched:
+            return
+
+        self._expire_prefetched()
+        future = self.scheduler.submit(self._send, url, delay=(self.delay[0], self.delay[1]), priority='bulk')
+        self.prefetched[url] = future
+        self._prefetch_times[url] = time.monotonic()
+
+        # Older speculations are less likely to be asked for than the latest ones
+        with self._flight_lock:
+            self._speculations.append(url)
+            while len(self._speculations) > self.speculation_limit:
+                oldest = self._speculations.popleft()
+                oldest_future = self.prefetched.get(oldest)
+                if oldest_future is not None and oldest_future.cancel():
+                    self.prefetched.pop(oldest, None)
+                    self._prefetch_times.pop(oldest, None)
+
+        def store(future: Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                return
+            try:
+                details.setdefault(url, parse(self.parse(future.result().text), url))
+            except Exception:
+                return
+
+            # Stored before the response is released, so a method asking for the page finds one or the other
+            if self.prefetched.get(url) is future:
+                self.prefetched.pop(url, None)
+                self._prefetch_times.pop(url, None)
+
+        future.add_done_callback(store)
+
+    @staticmethod
+    def write_to_json(data: Dict[str, Dict[str, Any]], filename: str, mode: Literal['w', 'a'], compact: bool = False) -> None:
+        """
+        Writes the scraped data to a JSON file. Intended for storing quotes of an author or author details.
+        Records (`Quote`, `Author`, `Book`) in the data are written in their dictionary form.
+        The file is written to a temporary file first and then renamed, so an interrupted write never leaves a truncated file.
+        
+        Parameters:
+            data (Dict[str, Dict[str, Any]]): The data to be written to the JSON file.
+            filename (str): The name of the file where the data will be saved.
+            mode (Literal['w', 'a']): The mode in which to open the file. 'w' for write (overwrites existing file), 'a' for append (adds to existing file).
+            compact (bool): If True, writes the JSON without indentation, which is smaller and faster. Default is False.
+
+        Raises:
+            TypeError: If `filename` is not a string.
+            ValueError: If `mode` is not 'w' or 'a'.
+            TypeError: If `data` is not a dictionary.
+
+        Example:
+        ```python
+        data = {
+            "Author 1": {"Quote 1": ["tag1", "tag2"], "Quote 2": ["tag3"]},
+            "Author 2": {"Quote 3": ["tag4"]}
+        }
+        QuoteScraping.write_to_json(data, "quotes.json", mode='w')
+        """
+        if not isinstance(data, dict):
+            raise TypeError(Fore.RED + "Data must be a dictionary")
+        if not isinstance(filename, str):
+            raise TypeError(Fore.RED + "Filename must be a string")
+        if mode not in ['w', 'a']:
+            raise ValueError(Fore.RED + "Mode must be 'w' for write or 'a' for append")
+
+        data = CommonMethods.to_plain(data)
+        
+        # For appending data to existing file, read previous data first
+        if mode == 'a' and os.path.exists(filename) and os.path.getsize(filename) != 0:
+            previous_data = CommonMethods.read_from_json(filename)
+
+            # Append current data into previous dictionary
+            for i in data:
+                if i in previous_data:
+                    previous_data[i].update(data[i])
+                else:
+                    previous_data[i] = data[i]
+
+            data = previous_data
+
+        # Write final dictionary
+        CommonMethods._atomic_write(filename, CommonMethods.dumps_json(data, compact=compact))
+
+    @staticmethod
+    def read_from_json(filename: str) -> Any:
+        """
+        Reads data from a JSON file, for example one written by `write_to_json`.
+
+        Parameters:
+            filename (str): The name of the JSON file.
+
+        Returns:
+            Any: The parsed data.
+
+        Raises:
+            TypeError: If `filename` is not a string.
+        """
+        if not isinstance(filename, str):
+            raise TypeError(Fore.RED + "Filename must be a string")
+
+        with open(file=filename, mode='rb') as f:
+            return CommonMethods.loads_json(f.read())
+
+    @staticmethod
+    def _json_backend() -> str:
+        """Returns the name of the JSON library to use, resolving 'auto' to the fastest one installed."""
+        backend = CommonMethods.json_backend
+
+        if backend == 'auto':
+            if importlib.util.find_spec("orjson") is not None:
+                return 'orjson'
+            if importlib.util.find_spec("msgspec") is not None:
+                return 'msgspec'
+            return 'json'
+
+        if backend not in ['orjson', 'msgspec', 'json']:
+            raise ValueError(Fore.RED + "json_backend must be 'auto', 'orjson', 'msgspec' or 'json'")
+        if backend != 'json' and importlib.util.find_spec(backend) is None:
+            raise ImportError(Fore.RED + f"JSON backend '{backend}' is not installed")
+        return backend
+
+    @staticmethod
+    def dumps_json(data: Any, compact: bool = False) -> bytes:
+        """
+        Serializes data to UTF-8 encoded JSON with the selected backend (see `json_backend`).
+
+        Parameters:
+            data (Any): The data to serialize. Records must be converted with `to_plain` first.
+            compact (bool): If True, no indentation is added. Default is False (indented with 4 spaces, with any backend).
+
+        Returns:
+            bytes: The JSON document.
+        """
+        backend = CommonMethods._json_backend()
 
-    Methods:
-    ------------------------
-    - `write_to_json`: Writes the scraped data to a JSON file.
-    - `write_to_text`: Writes the scraped data to a text file.
-    """
-    def __init__(self) -> None:
+        if backend == 'orjson' and compact:     # orjson only indents with 2 spaces, so indented output uses the json module
+            return importlib.import_module("orjson").dumps(data)
+
+        if backend == 'msgspec':
+            msgspec_json = importlib.import_module("msgspec.json")
+            encoded = msgspec_json.encode(data)
+            return encoded if compact else msgspec_json.format(encoded, indent=4)
+
+        if compact:
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        return json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+
+    @staticmethod
+    def loads_json(payload: bytes) -> Any:
         """
-        Initializes the class with a session, headers, and timeout settings.
+        Parses UTF-8 encoded JSON with the selected backend (see `json_backend`).
 
-        Attributes:
-            timeout (int): Timeout for requests in seconds. Recommended to keep it low to avoid long waits.
-            session (requests.Session): A requests session for making HTTP requests. Sessions are more efficient for multiple requests.
-            header (Dict[str, str]): Headers to mimic a browser request.
-            delay (List[int]): Random delay between requests to avoid increasing traffic on the server.
+        Parameters:
+            payload (bytes): The JSON document.
+
+        Returns:
+            Any: The parsed data.
         """
-        self.timeout = 5
-        self.session = requests.Session()
-        self.header = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"}      # Chrome browser string
-        self.delay = [1, 2]
+        backend = CommonMethods._json_backend()
+
+        if backend == 'orjson':
+            return importlib.import_module("orjson").loads(payload)
+        if backend == 'msgspec':
+            return importlib.import_module("msgspec.json").decode(payload)
+        return json.loads(payload)
 
     @staticmethod
-    def write_to_json(data: Dict[str, Dict[str, Any]], filename: str, mode: Literal['w', 'a']) -> None:
+    def _atomic_write(filename: str, payload: bytes) -> None:
         """
-        Writes the scraped data to a JSON file. Intended for storing quotes of an author or author details.
-        
+        Writes bytes to a file atomically: the bytes are written to a temporary file in the same directory, which then replaces the file.
+
         Parameters:
-            data (Dict[str, Dict[str, Any]]): The data to be written to the JSON file.
-            filename (str): The name of the file where the data will be saved.
-            mode (Literal['w', 'a']): The mode in which to open the file. 'w' for write (overwrites existing file), 'a' for append (adds to existing file).
+            filename (str): The name of the file.
+            payload (bytes): The content of the file.
+        """
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, temp_name = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(filename)}.", suffix=".tmp")
 
-        Raises:
-            TypeError: If `filename` is not a string.
-            ValueError: If `mode` is not 'w' or 'a'.
-            TypeError: If `data` is not a dictionary.
+        try:
+            with os.fdopen(fd, mode='wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())        # Make sure the data is on disk before renaming
+
+            CommonMethods._copy_mode(temp_name, filename)
+            os.replace(temp_name, filename)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
 
-        Example:
-        ```python
-        data = {
-            "Author 1": {"Quote 1": ["tag1", "tag2"], "Quote 2": ["tag3"]},
-            "Author 2": {"Quote 3": ["tag4"]}
-        }
-        QuoteScraping.write_to_json(data, "quotes.json", mode='w')
+    @staticmethod
+    def _copy_mode(temp_name: str, filename: str) -> None:
         """
-        if not isinstance(data, dict):
-            raise TypeError(Fore.RED + "Data must be a dictionary")
-        if not isinstance(filename, str):
-            raise TypeError(Fore.RED + "Filename must be a string")
-        if mode not in ['w', 'a']:
-            raise ValueError(Fore.RED + "Mode must be 'w' for write or 'a' for append")
-        
-        if mode == 'w':
-            with open(file=filename, mode='w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4, ensure_ascii=False)
-        
-        else:       # For appending data to existing file, read previous data first
-            with open(file=filename, mode='r', encoding='utf-8') as f:
-                previous_data = json.load(f)
-
-                # Append current data into previous dictionary
-                for i in data:
-                    if i in previous_data:
-                        previous_data[i].update(data[i])
-                    else:
-                        previous_data[i] = data[i]
-            
-            # Write final dictionary
-            with open(file=filename, mode='w', encoding='utf-8') as f:
-                json.dump(previous_data, f, indent=4, ensure_ascii=False)
+        Gives a temporary file (created with mode 0600 by `tempfile.mkstemp`) the mode `open` would give the file it replaces:
+        the mode of the existing file, or 0666 without the umask for a new one.
+        """
+        try:
+            mode = stat.S_IMODE(os.stat(filename).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~CommonMethods._umask()
+        os.chmod(temp_name, mode)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _umask() -> int:
+        """The umask of the process. It can only be read by setting it, so it is read once."""
+        umask = os.umask(0)
+        os.umask(umask)
+        return umask
+
+    @staticmethod
+    def to_plain(data: Any) -> Any:
+        """
+        Converts records (`Quote`, `Author`, `Book`) nested anywhere in the data to dictionaries, so the data can be serialized to JSON.
+
+        Parameters:
+            data (Any): The data to convert. Dictionaries, lists, tuples and sets are converted recursively.
+
+        Returns:
+            Any: The data with records replaced by their `to_dict()` form, and tuples and sets replaced by lists.
+        """
+        if isinstance(data, (Quote, Author, Book)):
+            return data.to_dict()
+        if isinstance(data, dict):
+            return {key: CommonMethods.to_plain(value) for key, value in data.items()}
+        if isinstance(data, (list, tuple, set)):
+            return [CommonMethods.to_plain(value) for value in data]
+        return data
 
     @staticmethod
     def write_to_text(data: List[str], filename: str, mode: Literal['a', 'w']) -> None:
@@ -125,6 +1281,312 @@ class CommonMethods:
                 element = str(i) + '\n'
                 f.write(element)
 
+class PageCache:
+    """
+    A store of parsed pages with least recently used (LRU) eviction.
+    Scraping methods read listing pages from it, so a page is fetched only once no matter how many methods need it.
+
+    Instance Attributes:
+    ---------------------------
+        max_pages: int
+            Maximum number of pages kept in the store. The least recently used page is evicted when it is full.
+        pages: OrderedDict[Any, Dict[str, Any]]
+            Parsed pages ordered from least to most recently used.
+        lock: threading.RLock
+            Lock held by every operation, so the store can be shared by threads.
+
+    Example:
+    ----------------------------
+    ```python
+    cache = PageCache(max_pages=2)
+    cache[1] = {"quotes": [], "next href": "/page/2/"}
+    if 1 in cache:
+        page = cache[1]
+    ```
+    """
+    def __init__(self, max_pages: int = 256) -> None:
+        """
+        Initializes an empty page store.
+
+        Parameters:
+            max_pages (int): Maximum number of pages kept in the store. Default is 256.
+
+        Raises:
+            ValueError: If `max_pages` is not a positive integer.
+        """
+        if not isinstance(max_pages, int) or max_pages < 1:
+            raise ValueError(Fore.RED + "max_pages must be a positive integer")
+
+        self.max_pages = max_pages
+        self.pages: OrderedDict[Any, Dict[str, Any]] = OrderedDict()
+        self.lock = threading.RLock()
+
+    def __contains__(self, key: Any) -> bool:
+        with self.lock:
+            return key in self.pages
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.pages)
+
+    def __getitem__(self, key: Any) -> Dict[str, Any]:
+        with self.lock:
+            page = self.pages[key]
+            self.pages.move_to_end(key)     # Mark as most recently used
+            return page
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        """Returns a page, or None if it is not in the store. Unlike checking with `in` first, a page cannot be evicted in between."""
+        with self.lock:
+            if key not in self.pages:
+                return None
+            return self[key]
+
+    def __setitem__(self, key: Any, page: Dict[str, Any]) -> None:
+        with self.lock:
+            self.pages[key] = page
+            self.pages.move_to_end(key)
+
+            # Evict least recently used pages
+            while len(self.pages) > self.max_pages:
+                self.pages.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all pages from the store."""
+        with self.lock:
+            self.pages.clear()
+
+class AliasCache:
+    """
+    A store of the names users meant when they misspelled one: (kind, query) -> canonical name, with least recently used (LRU) eviction.
+    An alias is learned when the user confirms a "Did you mean ...?" question, and resolves the same query afterwards
+    without fuzzy matching, asking again, or crawling pages to find similar names.
+
+    Instance Attributes:
+    ---------------------------
+        filename: str | None
+            The JSON file the aliases are kept in across runs. None keeps them in memory only.
+        max_entries: int
+            Maximum number of aliases kept. The least recently used alias is evicted when it is full.
+        aliases: OrderedDict[Tuple[str, str], Dict[str, Any]]
+            The canonical name, confidence (similarity of the query to the name) and number of uses of every alias,
+            ordered from least to most recently used.
+        lock: threading.RLock
+            Lock held by every operation, so the store can be shared by threads.
+
+    Methods:
+    ----------------------------
+    - `shared`: The store of a file, shared by every scraper using that file.
+    - `get`: The canonical name of a query, if it was learned.
+    - `learn`: Learns the canonical name of a query, and saves the store.
+    - `forget`: Forgets the alias of a query.
+    - `save`: Writes the store to its file.
+
+    Example:
+    ----------------------------
+    ```python
+    CommonMethods.alias_file = "aliases.json"     # Every scraper created afterwards shares this store
+    scraper = QuoteScraping()
+    scraper.get_author_url("albert einstien")      # Asks "Did you mean 'Albert Einstein'?" once, then never again
+    ```
+    """
+    _shared: Dict[str, "AliasCache"] = dict()
+    _shared_lock = threading.Lock()
+
+    def __init__(self, filename: Optional[str] = None, max_entries: int = 10_000) -> None:
+        """
+        Initializes the store, reading the aliases of `filename` if it exists.
+
+        Parameters:
+            filename (str, optional): The JSON file the aliases are kept in. Default is None (in memory only).
+            max_entries (int): Maximum number of aliases kept. Default is 10,000.
+
+        Raises:
+            ValueError: If `max_entries` is not a positive integer.
+        """
+        if not isinstance(max_entries, int) or max_entries < 1:
+            raise ValueError(Fore.RED + "max_entries must be a positive integer")
+
+        self.filename = filename
+        self.max_entries = max_entries
+        self.aliases: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+        self.lock = threading.RLock()
+
+        if filename is not None and os.path.exists(filename) and os.path.getsize(filename) != 0:
+            for kind, query, name, confidence, uses in CommonMethods.read_from_json(filename).get("aliases", []):
+                self.aliases[kind, query] = {"name": name, "confidence": confidence, "uses": uses}
+
+            while len(self.aliases) > self.max_entries:
+                self.aliases.popitem(last=False)
+
+    @classmethod
+    def shared(cls, filename: Optional[str]) -> "AliasCache":
+        """Returns the store of a file, created on first use and shared by every scraper using that file. None returns a new in-memory store."""
+        if filename is None:
+            return cls()
+
+        with cls._shared_lock:
+            key = os.path.abspath(filename)
+            if key not in cls._shared:
+                cls._shared[key] = cls(filename)
+            return cls._shared[key]
+
+    @staticmethod
+    def _key(kind: str, query: str) -> Tuple[str, str]:
+        return kind, " ".join(query.lower().split())        # Case and spacing do not matter
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.aliases)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        with self.lock:
+            return AliasCache._key(*key) in self.aliases
+
+    def get(self, kind: str, query: str) -> Optional[str]:
+        """
+        Returns the canonical name of a query, if it was learned, and marks the alias as recently used.
+
+        Parameters:
+            kind (str): What the name is, for example 'author', 'genre' or 'book'.
+            query (str): The name as the user typed it.
+
+        Returns:
+            str | None: The canonical name, or None if the query has no alias.
+        """
+        key = AliasCache._key(kind, query)
+
+        with self.lock:
+            alias = self.aliases.get(key)
+            if alias is None:
+                return None
+
+            alias["uses"] += 1
+            self.aliases.move_to_end(key)       # Mark as most recently used
+            return alias["name"]
+
+    def learn(self, kind: str, query: str, name: str, confidence: float) -> None:
+        """
+        Learns the canonical name of a query, evicting the least recently used alias if the store is full, and saves the store.
+
+        Parameters:
+            kind (str): What the name is, for example 'author', 'genre' or 'book'.
+            query (str): The name as the user typed it.
+            name (str): The name the user meant.
+            confidence (float): How similar the query is to the name, between 0 and 1.
+        """
+        key = AliasCache._key(kind, query)
+
+        with self.lock:
+            uses = self.aliases[key]["uses"] if key in self.aliases else 0
+            self.aliases[key] = {"name": name, "confidence": round(confidence, 3), "uses": uses + 1}
+            self.aliases.move_to_end(key)
+
+            while len(self.aliases) > self.max_entries:
+                self.aliases.popitem(last=False)
+
+            self.save()
+
+    def forget(self, kind: str, query: str) -> None:
+        """Forgets the alias of a query (for example a name that is no longer on the website), and saves the store."""
+        with self.lock:
+            if self.aliases.pop(AliasCache._key(kind, query), None) is not None:
+                self.save()
+
+    def save(self) -> None:
+        """Writes the aliases to the file of the store, from least to most recently used. Nothing is written for an in-memory store."""
+        if self.filename is None:
+            return
+
+        with self.lock:
+            aliases = [[kind, query, alias["name"], alias["confidence"], alias["uses"]] for (kind, query), alias in self.aliases.items()]
+            CommonMethods._atomic_write(self.filename, CommonMethods.dumps_json({"version": 1, "aliases": aliases}))
+
+class PagePlanner:
+    """
+    Learns the pagination URL scheme of a listing from one of its pages and plans the URLs of all its pages up front.
+    With the complete list of URLs, pages can be fetched in any order or all at once instead of following next buttons one by one.
+
+    Supported schemes are `page/N/` (quotes), `catalogue/page-N.html` (books catalogue) and `category/books/<slug>_<id>/page-N.html` (genres).
+    The number of pages is read from the "Page 1 of N" text of the pager.
+
+    Methods:
+    ----------------------------
+    - `learn`: Learns the URL scheme and the number of pages from a parsed page.
+    - `expand`: Builds the URLs of the remaining pages from a learned scheme.
+    - `plan`: Learns the scheme of a parsed page and returns the URLs of all pages from it.
+
+    Example:
+    ----------------------------
+    ```python
+    soup = scraper.parse(response.text)
+    urls = PagePlanner.plan("https://books.toscrape.com/", soup)
+    ```
+    """
+    pager_pattern = re.compile(r"Page\s+(\d+)\s+of\s+(\d+)", re.IGNORECASE)     # "Page 1 of 50"
+    url_pattern = re.compile(r"page[-/](\d+)(?:\.html|/)?$")       # ".../page-2.html" or ".../page/2/"
+
+    @staticmethod
+    def learn(url: str, soup: BeautifulSoup) -> Optional[Dict[str, Any]]:
+        """
+        Learns the URL scheme and the number of pages of a listing from a parsed page.
+
+        Parameters:
+            url (str): The URL of the page.
+            soup (BeautifulSoup): The parsed page.
+
+        Returns:
+            dict | None: A dictionary with the URL template (with `{}` for the page number), the number of the page and the number of the last page.
+            None if the page has a next button but the scheme or the number of pages cannot be learned.
+        """
+        next_button = soup.find("li", class_="next")
+        current = soup.find("li", class_="current")
+        pager = PagePlanner.pager_pattern.search(current.get_text(" ", strip=True)) if current else None
+
+        # Single page listing
+        if not next_button:
+            page = int(pager.group(1)) if pager else 1
+            return {"template": url, "page": page, "last page": page}
+
+        next_url = urljoin(url, next_button.find("a")["href"])
+        match = PagePlanner.url_pattern.search(next_url)
+
+        if not pager or not match:
+            return None
+
+        template = next_url[:match.start(1)] + "{}" + next_url[match.end(1):]
+        return {"template": template, "page": int(pager.group(1)), "last page": int(pager.group(2))}
+
+    @staticmethod
+    def expand(url: str, scheme: Dict[str, Any]) -> List[str]:
+        """
+        Builds the URLs of a listing from a learned scheme, starting with the page the scheme was learned from.
+
+        Parameters:
+            url (str): The URL of the page the scheme was learned from.
+            scheme (Dict[str, Any]): The scheme returned by `learn`.
+
+        Returns:
+            List[str]: The URLs of the page and of every page after it.
+        """
+        return [url] + [scheme["template"].format(page) for page in range(scheme["page"] + 1, scheme["last page"] + 1)]
+
+    @staticmethod
+    def plan(url: str, soup: BeautifulSoup) -> Optional[List[str]]:
+        """
+        Learns the URL scheme of a listing from a parsed page and returns the URLs of that page and every page after it.
+
+        Parameters:
+            url (str): The URL of the page.
+            soup (BeautifulSoup): The parsed page.
+
+        Returns:
+            List[str] | None: The planned URLs, or None if the scheme cannot be learned (pages must then be discovered with the next buttons).
+        """
+        scheme = PagePlanner.learn(url, soup)
+        return PagePlanner.expand(url, scheme) if scheme else None
+
+
 class QuoteScraping(CommonMethods):
     """ 
     A class for scraping quotes and author information from a quotes website.
@@ -132,7 +1594,7 @@ class QuoteScraping(CommonMethods):
     Class Attributes:
     ----------------------
         base_url: str
-            The base URL of the quotes website.
+            The base URL of the quotes website. It can be overridden per instance (for example to scrape a mirror or a local test server).
     
     Instance Attributes:
     ------------------------
@@ -146,53 +1608,418 @@ class QuoteScraping(CommonMethods):
             Random delay between requests to avoid increasing traffic on the server.
         author_details: Dict[str, str]
                 A dictionary to store author names and their corresponding URLs. It is used to avoid repeated scraping of the same author.
+        quote_pages: PageCache
+                A store of the parsed listing pages by page number. Every method reads listing pages from it, so each page is fetched only once.
+        quote_records: List[Quote]
+                Every quote seen by any crawl. The position of a quote in this list is its quote ID.
+        tag_index: Dict[str, Set[int]]
+                Inverted index mapping tags to quote IDs.
+        author_index: Dict[str, Set[int]]
+                Inverted index mapping author names to quote IDs.
+        source: Literal['html', 'api', 'auto']
+                Where listing pages are read from: HTML pages, the JSON API, or the JSON API with a fallback to HTML.
+        use_search: bool
+                If True, `scrape_author_quotes` asks the search form of the website instead of crawling the listing pages.
+                The form only finds quotes through their tags, so quotes without tags are missed.
  
     Methods:
     ----------------------------
     - `author_list`: Scrapes the list of authors from the quotes website.
+    - `plan_pages`: Plans the URLs of the listing pages.
     - `scrape_author_quotes`: Scrapes quotes by a specific author.
+    - `search_quotes`: Finds quotes of an author (optionally with a tag) with the search form of the website.
+    - `scrape_authors_quotes`: Scrapes quotes by several authors in a single pass over the website.
     - `scrape_author_info`: Scrapes information about a specific author.
     - `scrape_all_quotes`: Scrapes all quotes from the quotes website.
     - `scrape_all_authors`: Scrapes information about all authors from the quotes website.
+    - `top_tag_list`: Scrapes the top tags from the sidebar of the quotes website.
+    - `scrape_tag_quotes`: Scrapes quotes of specific tags from their tag pages.
+    - `find_quotes`: Finds quotes by tags and authors using the inverted index, without fetching any page.
     - `write_to_json`: Writes the scraped data to a JSON file (inherited from `CommonMethods`).
     - `write_to_text`: Writes the scraped data to a text file (inherited from `CommonMethods`).
 
-    Example:
-    ----------------------------
-    ```python
-    scraper = QuoteScraping()
-    authors = scraper.author_list()
-    print(authors)
-    ```
-    """
-    base_url = "https://quotes.toscrape.com/"
-    init(autoreset=True)
+    Example:
+    ----------------------------
+    ```python
+    scraper = QuoteScraping()
+    authors = scraper.author_list()
+    print(authors)
+    ```
+    """
+    base_url = "https://quotes.toscrape.com/"
+
+    def __init__(self, max_pages: int = 256, transport: Optional[Transport] = None, scheduler: Optional[RequestScheduler] = None,
+                 base_url: Optional[str] = None, source: Literal['html', 'api', 'auto'] = 'auto') -> None:
+        """
+        Initializes the QuoteScraping class with a session, headers, and timeout settings.
+
+        Parameters:
+            max_pages (int): Maximum number of parsed listing pages kept in `quote_pages`. Default is 256.
+            transport (Transport, optional): The transport used for every request. Default is a new `Transport`.
+            scheduler (RequestScheduler, optional): The scheduler that dispatches every request. Default is the scheduler shared by all scrapers.
+            base_url (str, optional): The base URL of the website, overriding `base_url` for this instance.
+            source (Literal['html', 'api', 'auto']): Where listing pages are read from: the HTML pages, the JSON API (`/api/quotes?page=N`),
+                or the JSON API with a fallback to HTML when the endpoint is missing. Default is 'auto'.
+
+        Attributes:
+            timeout (int): Timeout for requests in seconds. Recommended to keep it low to avoid long waits.
+            session (requests.Session): A requests session for making HTTP requests. Sessions are more efficient for multiple requests.
+            header (Dict[str, str]): Headers to mimic a browser request.
+            delay (List[int]): Random delay between requests to avoid increasing traffic on the server.
+            author_urls (Dict[str, str]): A dictionary to store author names and their URLs to avoid repeated scraping of the same author.
+            similarity_ratio (float): The minimum similarity ratio for matching author names using difflib.
+            quote_pages (PageCache): A store of parsed listing pages (quotes and next href) by page number, with LRU eviction.
+            last_page (int | None): Number of the last listing page, once it has been scraped.
+            quote_records (List[Quote]): Every quote seen by any crawl, indexed by quote ID.
+            quote_ids (Dict[str, int]): A dictionary mapping quote texts to quote IDs.
+            tag_index (Dict[str, Set[int]]): Inverted index mapping tags to quote IDs.
+            author_index (Dict[str, Set[int]]): Inverted index mapping author names to quote IDs.
+            index_lock (threading.RLock): Lock held while the inverted index is updated or read.
+            crawled_tags (Set[str]): Tags whose pages have all been scraped.
+            top_tags (List[str]): The top tags from the sidebar of the first listing page.
+            author_details (Dict[str, Author]): Details of every author scraped, by author URL.
+            source (Literal['html', 'api', 'auto']): Where listing pages are read from.
+            api_available (bool | None): Whether the JSON API answered, None until it has been tried.
+            use_search (bool): If True, `scrape_author_quotes` uses the search form instead of crawling the listing pages,
+                which misses quotes without tags. Default is False.
+            search_max_requests (int): Maximum number of searches `scrape_author_quotes` sends for an author before crawling instead. Default is 10.
+            search_available (bool | None): Whether the website has a search form, None until it has been loaded.
+            search_form (Dict[str, Any] | None): The URL the search form is sent to, its viewstate and the names of all authors.
+            author_forms (Dict[str, Dict[str, Any]]): The tags and viewstate of every author selected in the search form.
+            search_results (Dict[Tuple[str, str], List[str]]): The quotes found by every search, by author and tag.
+        """
+        super().__init__(transport, scheduler)
+
+        if base_url is not None:
+            self.base_url = base_url
+
+        # The JSON API holds the same quotes as the listing pages, and is much cheaper to parse than HTML
+        self.source = source
+        self.api_available: Optional[bool] = None
+
+        # The search form (/search.aspx) filters quotes by author and tag on the server
+        # It is loaded once (with its viewstate and the names of all authors), then every author selected in it is kept with the tags
+        # and viewstate the website returns for them, so each search afterwards is a single request
+        # The form only finds quotes through their tags, so it is not used by default: the crawl also finds quotes without tags
+        self.use_search = False
+        self.search_max_requests = 10       # The quotes website has 10 listing pages
+        self.search_available: Optional[bool] = None
+        self.search_form: Optional[Dict[str, Any]] = None
+        self.author_forms: dict[str, Dict[str, Any]] = dict()
+        self.search_results: dict[tuple[str, str], list[str]] = dict()       # (author, tag) -> quotes
+
+        # Dictionary to store author names and their URLs
+        # This is used to avoid repeated scraping of the same author
+        # Every listing page that is scraped stores the name and url of all the authors on it.
+        # When scraping for a particular author, it first checks if the author is already present in the dictionary.
+        # If present, it uses the stored URL to scrape the author's information.
+        self.author_urls: dict[str, str] = dict()
+
+        # In case the user make a typo in entering the author name, the program will try to find a similar author name using difflib.
+        # The similarity ratio is set to 0.85, meaning that the author name must be at least 85% similar to the entered name to be considered a match.
+        self.similarity_ratio = 0.85
+
+        # Parsed listing pages, keyed by page number and shared by all methods
+        # Each page stores the quotes found on it and the href of the next page (None for the last page)
+        # The least recently used pages are evicted when more than max_pages are stored
+        self.quote_pages = PageCache(max_pages)
+        self.last_page: Optional[int] = None        # Known once the page without a next button has been scraped
+
+        # Inverted index of every quote seen by any crawl
+        # Quotes are stored once in quote_records, and the indexes map tags and authors to positions (quote IDs) in that list
+        self.quote_records: list[Quote] = []
+        self.quote_ids: dict[str, int] = dict()        # Quote text -> quote ID
+        self.tag_index: defaultdict[str, set[int]] = defaultdict(set)
+        self.author_index: defaultdict[str, set[int]] = defaultdict(set)
+        self.index_lock = threading.RLock()      # Held while the index is updated or read, so the instance can be shared by threads
+
+        self.crawled_tags: set[str] = set()     # Tags whose pages have all been scraped
+
+        # Details of every author scraped, by URL, so each author page is fetched once
+        self.author_details: dict[str, Author] = dict()
+        self.top_tags: list[str] = []       # Top tags from the sidebar of the first page
+
+    def _parse_quotes(self, soup: BeautifulSoup, index: bool = True) -> Tuple[List[Quote], Optional[str]]:
+        """
+        Extracts the quotes and the next page href from a parsed listing page.
+        Every quote found is added to the inverted index, and every author to `author_urls`.
+
+        Parameters:
+            soup (BeautifulSoup): The parsed listing page (a page of all quotes or a page of a tag).
+            index (bool): If False, the quotes are not added to the index, so nothing is kept after the page is processed. Default is True.
+
+        Returns:
+            tuple: A tuple containing the list of quotes and the href of the next page (None for the last page).
+        """
+        quotes: list[Quote] = []
+
+        for quote in soup.find_all("div", class_="quote"):
+            record = Quote(
+                text=quote.find("span", class_="text").get_text(strip=True),
+                author=quote.find("small", class_="author").get_text(strip=True),
+                tags=tuple(tag.get_text(strip=True) for tag in quote.find_all("a", class_="tag")),
+                author_url=self.base_url + quote.find("a", class_=None)["href"]
+            )
+            if index:
+                record = self._keep_quote(record)
+            quotes.append(record)
+
+        # Pagination
+        next_button = soup.find("li", class_="next")
+        next_href = next_button.find("a")["href"] if next_button else None
+
+        return quotes, next_href
+
+    def _parse_api_quotes(self, payload: bytes, page: int, index: bool = True) -> Optional[Tuple[List[Quote], Optional[str]]]:
+        """
+        Extracts the quotes and the next page href from a page of the JSON API (`/api/quotes?page=N`).
+        Quotes get the same author URLs as on the HTML pages, and the next href is the one of the HTML page, so pages from both sources are interchangeable.
+
+        Parameters:
+            payload (bytes): The body of the response.
+            page (int): The number of the page.
+            index (bool): If False, the quotes are not added to the index (see `_parse_quotes`). Default is True.
+
+        Returns:
+            tuple | None: A tuple containing the list of quotes and the href of the next page (None for the last page),
+            or None if the payload is not a page of the API.
+        """
+        try:
+            data = self.loads_json(payload)
+        except Exception:
+            return None
+
+        if not isinstance(data, dict) or not isinstance(data.get("quotes"), list):
+            return None
+
+        quotes: list[Quote] = []
+
+        for quote in data["quotes"]:
+            record = Quote(
+                text=quote["text"].strip(),
+                author=quote["author"]["name"].strip(),
+                tags=tuple(quote.get("tags", ())),
+                author_url=self.base_url + f"/author/{quote['author']['slug']}"     # Same as the "/author/<slug>" links of the HTML pages
+            )
+            if index:
+                record = self._keep_quote(record)
+            quotes.append(record)
+
+        next_href = f"/page/{page + 1}/" if data.get("has_next") else None
+        return quotes, next_href
+
+    def _keep_quote(self, quote: Quote) -> Quote:
+        """Adds a quote to the inverted index and its author to `author_urls`. Returns the indexed record (the first one seen with the same text)."""
+        with self.index_lock:
+            record = self.quote_records[self._index_quote(quote)]      # Reuse the record if the quote was seen before
+            self.author_urls.setdefault(record.author, record.author_url)
+        return record
+
+    def _index_quote(self, quote: Quote) -> int:
+        """
+        Adds a quote to the inverted index (`tag_index` and `author_index`) if it is not already present.
+        Must be called with `index_lock` held.
+
+        Parameters:
+            quote (Quote): The quote to add.
+
+        Returns:
+            int: The ID of the quote, i.e. its position in `quote_records`.
+        """
+        if quote.text in self.quote_ids:
+            return self.quote_ids[quote.text]
+
+        quote_id = len(self.quote_records)
+        self.quote_ids[quote.text] = quote_id
+        self.quote_records.append(quote)
+
+        self.author_index[quote.author].add(quote_id)
+        for tag in quote.tags:
+            self.tag_index[tag].add(quote_id)
+
+        return quote_id
+
+    def _scrape_quote_page(self, page: int, url: str, keep: bool = True) -> Dict[str, Any]:
+        """
+        Scrapes a single listing page of the quotes website, or returns it from `quote_pages` if it was scraped before.
+        The top tags sidebar is scraped from the first page in the same request.
+        Depending on `source`, the page is read from the JSON API instead, which has no sidebar and no "Page 1 of N" pager.
+        With 'auto', the first page is still read as HTML for its sidebar, and the API is used from the second page on.
+
+        Parameters:
+            page (int): The number of the page (starting from 1). Used as the key in `quote_pages`.
+            url (str): The URL of the page.
+            keep (bool): If False, a page that has to be fetched is neither stored in `quote_pages` nor indexed. Default is True.
+
+        Returns:
+            dict: A dictionary with the quotes of the page (text, author, author URL and tags of each quote), the href of the next page
+            and the pagination scheme learned by `PagePlanner` (None if it cannot be learned).
+
+        Raises:
+            Exception: If there is an error fetching the page.
+        """
+        quote_page = self.quote_pages.get(page)
+        if quote_page is not None:
+            return quote_page
+
+        def scrape() -> Dict[str, Any]:
+            quote_page = self.quote_pages.get(page)
+            if quote_page is not None:
+                return quote_page       # Stored by another thread meanwhile
+
+            if self._use_api(page):
+                parsed = self._parse_api_quotes(self.fetch(self.base_url + f"api/quotes?page={page}").content, page, index=keep)
+
+                if parsed is not None:
+                    self.api_available = True
+                    quotes, next_href = parsed
+
+                    if next_href is None:
+                        self.last_page = page
+
+                    quote_page = {"quotes": quotes, "next href": next_href, "scheme": None}
+                    if keep:
+                        self.quote_pages[page] = quote_page
+                    return quote_page
+
+                # The endpoint is not there, so HTML pages are used from now on
+                if self.source == 'api':
+                    raise Exception(Fore.RED + f"The JSON API is not available at {self.base_url}api/quotes")
+                self.api_available = False
+                print(Fore.YELLOW + "The JSON API is not available, reading the HTML pages instead.")
+
+            response = self.fetch(url)
+
+            soup = self.parse(response.text)
+            quotes, next_href = self._parse_quotes(soup, index=keep)
+
+            # Top tags are shown in the sidebar of the first page
+            if page == 1:
+                self.top_tags = [tag.get_text(strip=True) for tag in soup.select("div.tags-box span.tag-item a.tag")]
+
+            if next_href is None:
+                self.last_page = page
+
+            quote_page = {"quotes": quotes, "next href": next_href, "scheme": PagePlanner.learn(url, soup)}
+            if keep:
+                self.quote_pages[page] = quote_page
+            return quote_page
+
+        if not keep:
+            return scrape()
+
+        # Threads asking for the same page at the same time share one request and one parse
+        return self.single_flight(("quote page", page), scrape)
+
+    def _use_api(self, page: int) -> bool:
+        """
+        Whether a listing page is read from the JSON API: always with 'api', and with 'auto' until the API turns out to be missing,
+        except for the first page, whose sidebar (the top tags) is only in the HTML.
+        """
+        if self.source not in ['html', 'api', 'auto']:
+            raise ValueError(Fore.RED + "source must be 'html', 'api' or 'auto'")
+        return self.source == 'api' or (self.source == 'auto' and self.api_available is not False and page > 1)
 
-    def __init__(self) -> None:
+    def _iter_quote_pages(self, keep: bool = True, start: Optional[Tuple[int, str]] = None,
+                          deadline: Optional[Deadline] = None) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
         """
-        Initializes the QuoteScraping class with a session, headers, and timeout settings.
+        Iterates over the listing pages of the quotes website, starting from the first page.
+        The URLs of all pages are planned from the first page when its pager shows the number of pages, and discovered with the next buttons otherwise.
+        Pages are read from `quote_pages` when available, so the delay between requests is only paid for pages that have to be fetched.
+        With a `deadline`, no page is fetched once it has expired: the iteration stops and the page to resume from is left in `deadline.resume`.
 
-        Attributes:
-            timeout (int): Timeout for requests in seconds. Recommended to keep it low to avoid long waits.
-            session (requests.Session): A requests session for making HTTP requests. Sessions are more efficient for multiple requests.
-            header (Dict[str, str]): Headers to mimic a browser request.
-            delay (List[int]): Random delay between requests to avoid increasing traffic on the server.
-            author_urls (Dict[str, str]): A dictionary to store author names and their URLs to avoid repeated scraping of the same author.
-            similarity_ratio (float): The minimum similarity ratio for matching author names using difflib.
+        Parameters:
+            keep (bool): If False, fetched pages are neither stored in `quote_pages` nor indexed (see `_scrape_quote_page`). Default is True.
+            start (Tuple[int, str], optional): The number and URL of the page to start from (see `Deadline.start`). Default is the first page.
+            deadline (Deadline, optional): The deadline of the crawl. Default is None (no limit).
+
+        Yields:
+            tuple: A tuple containing the page number, its URL and the parsed page (quotes and next href).
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        if deadline is not None:
+            deadline.resume = None
+            if deadline.expired:
+                page, url = start if start is not None else (1, self.base_url)
+                deadline.resume = {"page": page, "url": url}
+                return
+
+        for page, url, quote_page in self._plan_quote_pages(keep, start, deadline):
+            if quote_page is None:
+                quote_page = self.quote_pages.get(page)
+
+            if quote_page is None:
+                if deadline is not None and deadline.expired:
+                    deadline.resume = {"page": page, "url": url}
+                    return
+                quote_page = self._scrape_quote_page(page, url, keep)
+
+            yield page, url, quote_page
+
+    def plan_pages(self) -> Iterator[str]:
         """
-        super().__init__()
+        Plans the URLs of the listing pages of the quotes website.
+        If the first page shows the number of pages, every URL is known up front and the pages can be fetched in any order.
+        Otherwise the URLs are discovered one by one with the next buttons.
 
-        # Dictionary to store author names and their URLs
-        # This is used to avoid repeated scraping of the same author
-        # When scraping for the info of a particular author, the function stores the author name and url of all the authors that come before it.
-        # When scraping for a particular author, it first checks if the author is already present in the dictionary.
-        # If present, it uses the stored URL to scrape the author's information.
-        self.author_urls: dict[str, str] = dict()
+        Yields:
+            str: The URL of each listing page, in order.
 
-        # In case the user make a typo in entering the author name, the program will try to find a similar author name using difflib.
-        # The similarity ratio is set to 0.85, meaning that the author name must be at least 85% similar to the entered name to be considered a match.
-        self.similarity_ratio = 0.85
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        for _, url, _ in self._plan_quote_pages():
+            yield url
+
+    def _plan_quote_pages(self, keep: bool = True, start: Optional[Tuple[int, str]] = None,
+                          deadline: Optional[Deadline] = None) -> Iterator[Tuple[int, str, Optional[Dict[str, Any]]]]:
+        """
+        Plans the URLs of the listing pages of the quotes website (see `plan_pages`).
+        Following next buttons scrapes every page while planning, so the parsed page is yielded with its URL and is not fetched twice.
+
+        Parameters:
+            keep (bool): If False, pages scraped while planning (the first page included) are neither stored nor indexed (see `_scrape_quote_page`).
+                Default is True.
+            start (Tuple[int, str], optional): The number and URL of the first page to yield. Default is the first page.
+                The first page is still scraped to learn the pagination, but it is usually in `quote_pages`.
+            deadline (Deadline, optional): Once it has expired, the next page to follow is yielded without being scraped (None) and planning stops.
+
+        Yields:
+            tuple: The number and URL of each listing page, in order, and the parsed page if it was scraped while planning (None otherwise).
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        first_page = self._scrape_quote_page(1, self.base_url, keep)
+        page, url = start if start is not None else (1, self.base_url)
+
+        if first_page["scheme"] is not None:
+            for planned_page, planned_url in enumerate(PagePlanner.expand(self.base_url, first_page["scheme"]), start=1):
+                if planned_page >= page:
+                    yield planned_page, planned_url, first_page if planned_page == 1 else None
+            return
+
+        # Pagination with next buttons
+        quote_page = first_page if page == 1 else None
+
+        while True:
+            if quote_page is None:
+                if deadline is not None and deadline.expired:
+                    yield page, url, None       # Left to the caller, which stops here
+                    return
+                quote_page = self._scrape_quote_page(page, url, keep)
+            yield page, url, quote_page
+
+            if not quote_page["next href"]:
+                break
+
+            url = self.base_url + quote_page["next href"]
+            page += 1
+            quote_page = None
 
+    @scheduled("bulk")
     def author_list(self) -> List[str]:
         """
         Scrapes the list of authors from the quotes website.
@@ -205,73 +2032,24 @@ class QuoteScraping(CommonMethods):
         """
         author_set = set()      # To avoid duplicate entries
 
-        # If author_urls is empty, start scraping from the first page
-        if len(self.author_urls) == 0:      
-            url = QuoteScraping.base_url
-            next_href = ""
-            page_count = 0
-
-        # If author_urls is not empty, use the start scraping after the last page that was fully scraped and next href from the dictionary
-        else:
-
-            # Store all author names currently in self.author_urls in a set to avoid duplicates
-            for name in self.author_urls:
-                if name in ["last page", "next href"]:
-                    continue
-                author_set.add(name)
-
-            # If next href is None, it means that all authors have been scraped and we can return the list
-            if self.author_urls["next href"] is None:
-                return list(author_set)
-            else:
-                next_href = self.author_urls["next href"]
-                url = QuoteScraping.base_url + next_href
-                page_count = self.author_urls["last page"]
-
-        while url:
-            try:
-                response = self.session.get(url, timeout=self.timeout, headers=self.header)
-            except requests.exceptions.RequestException as e:
-                raise Exception(f"Error fetching {url}: {e}")
-            
-            self.author_urls["last page"] = page_count      # Last page that was fully scraped
-            self.author_urls["next href"] = next_href       # href for this page (not fully scraped yet)
-
-            page_count += 1
-            print(Fore.CYAN + f"Scraping page {page_count}...")
-            soup = BeautifulSoup(response.text, "html.parser")
-            authors = soup.select("small.author")
+        for page, _, quote_page in self._iter_quote_pages():
+            print(Fore.CYAN + f"Scraping page {page}...")
 
             # Scrape all authors in current page
-            for author in authors:
-                name = author.get_text(strip=True)
-                author_set.add(name)
-
-                # If author is not already in the dictionary, scrape the author URL and add it to the dictionary
-                if name not in self.author_urls:
-                    about_href = author.find_parent("div", class_="quote").find("a", class_=None)["href"]
-                    author_url = QuoteScraping.base_url + about_href
-
-                    self.author_urls[name] = author_url
-            
-            # Pagination
-            next_button = soup.find("li", class_="next")
+            for quote in quote_page["quotes"]:
+                author_set.add(quote.author)
 
-            if next_button:
-                next_href = next_button.find("a")["href"]
-                url = QuoteScraping.base_url + next_href
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))
-            else:
-                self.author_urls["next href"] = None        # End of scraping
-                break
-        
         print()
         print(Fore.GREEN + "Successfully scraped the list of authors")
         return list(author_set)
-            
+
+    @scheduled("interactive")
     def scrape_author_quotes(self, author: str, print_quotes: bool = True) -> Dict[str, List[str]]:
         """
         Scrapes quotes by a specific author from the quotes website.
+        With `use_search`, the search form of the website finds the quotes (see `search_quotes`), and the listing pages are only
+        crawled if the website has no search form, they have all been scraped before, or the author has more tags than `search_max_requests`.
+        The form misses quotes without tags, so `use_search` is off by default.
         
         Parameters:
             author (str): The name of the author whose quotes are to be scraped.
@@ -292,45 +2070,61 @@ class QuoteScraping(CommonMethods):
         scraper.scrape_author_quotes("Albert Einstein")
         ```
         """
+        import difflib
+
         if not isinstance(author, str):
             raise TypeError(Fore.RED + "Author name must be a string.")
         if not isinstance(print_quotes, bool):
             raise TypeError(Fore.RED + "print_quotes must be a boolean value.")
+
+        query = author
+        alias = self.aliases.get("author", author)      # A misspelling confirmed before resolves without matching or asking
+        known = alias is not None       # Once the name is known, similar names are not offered
+        author = alias or author
+
+        # The search form filters the quotes on the server, so the listing pages are only crawled without it
+        # Once every listing page has been scraped, the crawl is answered from `quote_pages` without requests, so it is used instead
+        if self.use_search and self.last_page is None and self._search_form() is not None:
+            name = self._search_author(author)
+            tags = self._author_form(name)["tags"]
+
+            # An author with many tags needs one search per tag, which can take more requests than the crawl
+            if sum((name, tag) not in self.search_results for tag in tags) <= self.search_max_requests:
+                author_quotes = self._search_quotes(name, tags, print_quotes)
+                if author_quotes:
+                    return author_quotes
+            author = name       # Already confirmed, so the crawl matches it exactly
+            known = True
         
         author_quotes: dict[str, list[str]] = dict()      # Quotes as keys and a list of tags as values
         author = author.lower().strip()
-        url = QuoteScraping.base_url
-        page_count = 0
-
-        while url:
-            try:
-                response = self.session.get(url, timeout=self.timeout, headers=self.header)
-            except requests.exceptions.RequestException as e:
-                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
+        rejected: set[str] = set()      # Similar names the user declined
 
-            page_count += 1
-            print(Fore.GREEN + f"Searching page {page_count}...")
+        for page, _, quote_page in self._iter_quote_pages():
+            print(Fore.GREEN + f"Searching page {page}...")
             print()
-            soup = BeautifulSoup(response.text, "html.parser")
-            authors = soup.find_all("small", class_="author")   # All authors in current page
 
-            for auth in authors:
-                name = auth.get_text(strip=True)
+            for quote in quote_page["quotes"]:
+                name = quote.author
 
                 if name.lower() == author:      # If name matches exactly
                     match = True
 
+                elif name in rejected or known:
+                    continue
+
                 else:
                     similarity = difflib.SequenceMatcher(None, name.lower(), author, autojunk=True).ratio()
 
                     # If name is similar, ask whether the user meant this author
                     if similarity >= self.similarity_ratio:
-                        ask = input(Fore.YELLOW + f"Did you mean '{name}'? (y/n): ").strip().lower()
+                        confirmed = self.confirm_alias("author", query, name)
                         print()
 
-                        if ask == 'y':      # If user confirms the match
+                        if confirmed:      # If user confirms the match
                             match = True
                         else:
+                            rejected.add(name)
                             match = False
                     
                     # Neither an exact or similar match
@@ -340,38 +2134,306 @@ class QuoteScraping(CommonMethods):
                 # Scrape author quotes if there is a match
                 if match:
                     author = name.lower()
-                    quote = auth.find_parent("div", class_="quote")
-                    text = quote.select_one("span.text").get_text(strip=True)
-                    tags = [tag.get_text(strip=True) for tag in quote.select("a.tag")]
+                    known = True
 
                     if print_quotes:
-                        print(Fore.MAGENTA + f"📜 Quote: {text}")
-                        print(Fore.CYAN + f"🏷️  Tags: {', '.join(tags)}")
+                        print(Fore.MAGENTA + f"📜 Quote: {quote.text}")
+                        print(Fore.CYAN + f"🏷️  Tags: {', '.join(quote.tags)}")
                         print("-" * 60)
 
-                    author_quotes[text] = tags
+                    author_quotes[quote.text] = list(quote.tags)
             
             print()
 
-            # Pagination
-            next_button = soup.find("li", class_="next")
-
-            if next_button:
-                next_href = next_button.find("a")["href"]
-                url = QuoteScraping.base_url + next_href
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))
-            else:
-                break
-        
         # If no quotes are found for the author
         if len(author_quotes) == 0:
             raise ValueError(Fore.RED + f"No quotes found for author {author}.")
-        
+
         return author_quotes
-        
+
+    @scheduled("interactive")
+    def search_quotes(self, author: str, tag: Optional[str] = None, print_quotes: bool = False) -> Dict[str, List[str]]:
+        """
+        Finds the quotes of an author, optionally only those with a tag, with the search form of the quotes website (`/search.aspx`).
+        The website filters the quotes, so no listing page is crawled. The form is loaded once per instance, and the first search
+        of an author selects them in the form (one request), after which every search of that author and a tag is one request.
+        Without a tag, every tag of the author is searched, one request each.
+        The form only finds quotes through their tags, so quotes without tags are only found by crawling (`use_search = False`).
+
+        Parameters:
+            author (str): The name of the author. Similar names are offered as with `scrape_author_quotes`.
+            tag (str, optional): A tag the quotes must have. Default is None (all quotes of the author).
+            print_quotes (bool): If True, prints the quotes and their tags to the console. Default is False.
+
+        Returns:
+            dict: A dictionary where keys are quotes and values are lists of the tags they were found with.
+
+        Raises:
+            TypeError: If the author name or the tag is not a string.
+            ValueError: If the website has no search form, or no quotes are found for the author (and tag).
+            Exception: If there is an error sending the form.
+
+        Example:
+        ```python
+        scraper = QuoteScraping()
+        quotes = scraper.search_quotes("Albert Einstein", tag="life")
+        ```
+        """
+        if not isinstance(author, str):
+            raise TypeError(Fore.RED + "Author name must be a string.")
+        if tag is not None and not isinstance(tag, str):
+            raise TypeError(Fore.RED + "Tag must be a string.")
+        if not isinstance(print_quotes, bool):
+            raise TypeError(Fore.RED + "print_quotes must be a boolean value.")
+
+        if self._search_form() is None:
+            raise ValueError(Fore.RED + f"There is no search form at {self.base_url}search.aspx")
+
+        name = self._search_author(author)
+        tags = self._author_form(name)["tags"]
+        if tag is not None:
+            tags = [option for option in tags if option.lower() == tag.lower().strip()]
+
+        author_quotes = self._search_quotes(name, tags, print_quotes)
+        if len(author_quotes) == 0:
+            raise ValueError(Fore.RED + f"No quotes found for author {author}" + (f" and tag {tag}." if tag is not None else "."))
+
+        return author_quotes
+
+    def _search_author(self, author: str) -> str:
+        """
+        Matches an author name against the authors listed in the search form. Similar names are offered as with `scrape_author_quotes`:
+        from the most similar, until the user accepts one.
+
+        Parameters:
+            author (str): The name of the author.
+
+        Returns:
+            str: The name of the author, as listed in the form.
+
+        Raises:
+            ValueError: If no listed author matches the name.
+        """
+        import difflib
+
+        # The form lists every author, so the name is matched against all of them at once
+        names = self.search_form["authors"]
+        lower_names = [name.lower() for name in names]
+        wanted = author.lower().strip()
+
+        if wanted in lower_names:
+            return names[lower_names.index(wanted)]
+
+        # If the user declines a similar name, the next one is offered
+        for match in difflib.get_close_matches(wanted, lower_names, n=len(lower_names), cutoff=self.similarity_ratio):
+            name = names[lower_names.index(match)]
+            if self.confirm_alias("author", author, name):
+                return name
+            print()
+
+        raise ValueError(Fore.RED + f"No quotes found for author {author}.")
+
+    def _search_quotes(self, author: str, tags: List[str], print_quotes: bool) -> Dict[str, List[str]]:
+        """Searches the quotes of an author with each of the given tags, and merges them into quotes and the tags they were found with."""
+        author_quotes: dict[str, list[str]] = dict()      # Quotes as keys and a list of tags as values
+
+        for tag in tags:
+            for text in self._search(author, tag):
+                author_quotes.setdefault(text, []).append(tag)
+
+        if print_quotes:
+            for text, quote_tags in author_quotes.items():
+                print(Fore.MAGENTA + f"📜 Quote: {text}")
+                print(Fore.CYAN + f"🏷️  Tags: {', '.join(quote_tags)}")
+                print("-" * 60)
+
+        return author_quotes
+
+    def _search_form(self) -> Optional[Dict[str, Any]]:
+        """
+        Loads the search form once: the URL it is sent to, its viewstate and the names of all authors.
+
+        Returns:
+            dict | None: The form, or None if the website has no search form.
+
+        Raises:
+            Exception: If there is an error fetching the page.
+        """
+        if self.search_form is not None or self.search_available is False:
+            return self.search_form
+
+        def load() -> Optional[Dict[str, Any]]:
+            url = self.base_url + "search.aspx"
+            response = self.fetch(url)
+
+            soup = self.parse(response.text)
+            form = soup.find("form")
+            viewstate = soup.find("input", attrs={"name": "__VIEWSTATE"})
+            authors = [option.get("value", option.get_text()).strip() for option in soup.select("select#author option")]
+            authors = [name for name in authors if name and not name.startswith("---")]     # "----------" is the empty choice
+
+            if response.status_code != 200 or form is None or viewstate is None or not authors:
+                self.search_available = False
+                return None
+
+            self.search_form = {"url": urljoin(url, form.get("action") or "filter.aspx"), "viewstate": viewstate.get("value", ""), "authors": authors}
+            self.search_available = True
+            return self.search_form
+
+        return self.single_flight(("search form",), load)
+
+    def _author_form(self, author: str) -> Dict[str, Any]:
+        """
+        Selects an author in the search form, once per author. The website answers with the tags of the author and a viewstate to search them with.
+
+        Parameters:
+            author (str): The name of the author, as listed in the form.
+
+        Returns:
+            dict: The tags of the author and the viewstate.
+
+        Raises:
+            Exception: If there is an error sending the form, or the website does not accept it.
+        """
+        if author in self.author_forms:
+            return self.author_forms[author]
+
+        def select() -> Dict[str, Any]:
+            response = self.post_form(self.search_form["url"], {"author": author, "tag": "----------", "__VIEWSTATE": self.search_form["viewstate"]})
+
+            soup = self.parse(response.text)
+            viewstate = soup.find("input", attrs={"name": "__VIEWSTATE"})
+            if response.status_code != 200 or viewstate is None:
+                raise Exception(Fore.RED + f"The search form did not accept author {author} (status {response.status_code}).")
+
+            tags = [option.get("value", option.get_text()).strip() for option in soup.select("select#tag option")]
+            author_form = {"viewstate": viewstate.get("value", ""), "tags": [tag for tag in tags if tag and not tag.startswith("---")]}
+            self.author_forms[author] = author_form
+            return author_form
+
+        return self.single_flight(("author form", author), select)
+
+    def _search(self, author: str, tag: str) -> List[str]:
+        """
+        Searches the quotes of an author with a tag, once per author and tag.
+
+        Parameters:
+            author (str): The name of the author, as listed in the form.
+            tag (str): The tag, as listed in the form for the author.
+
+        Returns:
+            List[str]: The quotes found.
+
+        Raises:
+            Exception: If there is an error sending the form, or the website does not accept it.
+        """
+        if (author, tag) in self.search_results:
+            return self.search_results[author, tag]
+
+        def search() -> List[str]:
+            author_form = self._author_form(author)
+            data = {"author": author, "tag": tag, "submit_button": "Search", "__VIEWSTATE": author_form["viewstate"]}
+            response = self.post_form(self.search_form["url"], data)
+
+            if response.status_code != 200:
+                raise Exception(Fore.RED + f"The search form did not accept author {author} and tag {tag} (status {response.status_code}).")
+
+            soup = self.parse(response.text)
+            quotes = [quote.select_one("span.content, span.text").get_text(strip=True) for quote in soup.select("div.quote")]
+            self.search_results[author, tag] = quotes
+            return quotes
+
+        return self.single_flight(("search", author, tag), search)
+
+    @scheduled("bulk")
+    def scrape_authors_quotes(self, authors: List[str], print_quotes: bool = False) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Scrapes quotes by several authors in a single pass over the listing pages of the quotes website.
+        Pages already scraped by this instance are read from `quote_pages` instead of being fetched again.
+
+        Parameters:
+            authors (List[str]): The names of the authors whose quotes are to be scraped. Similar names are matched after confirmation.
+            print_quotes (bool): If True, prints the quotes and their tags to the console. Default is False.
+
+        Returns:
+            dict: A dictionary where keys are author names (as found on the site) and values are dictionaries with quotes as keys and lists of tags as values.
+
+        Raises:
+            TypeError: If `authors` is not a list of strings.
+            TypeError: If `print_quotes` is not a boolean.
+            ValueError: If no quotes are found for any of the authors.
+            Exception: If there is an error fetching the page.
+
+        Example:
+        ```python
+        scraper = QuoteScraping()
+        quotes = scraper.scrape_authors_quotes(["Albert Einstein", "Jane Austen", "Mark Twain"])
+        ```
+        """
+        import difflib
+
+        if not isinstance(authors, list) or not all(isinstance(author, str) for author in authors):
+            raise TypeError(Fore.RED + "authors must be a list of strings.")
+        if not isinstance(print_quotes, bool):
+            raise TypeError(Fore.RED + "print_quotes must be a boolean value.")
+
+        # Misspellings confirmed before resolve to their names, which are then only matched exactly
+        aliases = {author: self.aliases.get("author", author) for author in authors}
+        pending = {(aliases[author] or author).lower().strip() for author in authors}     # Normalized names not resolved yet
+        exact = {alias.lower() for alias in aliases.values() if alias is not None}
+        resolved: dict[str, str] = dict()       # Name on the site (lowercase) -> name on the site
+        rejected: set[tuple[str, str]] = set()      # (name entered, name on the site) pairs the user declined
+        authors_quotes: dict[str, dict[str, list[str]]] = defaultdict(dict)
+
+        for page, _, quote_page in self._iter_quote_pages():
+            print(Fore.GREEN + f"Searching page {page}...")
+
+            for quote in quote_page["quotes"]:
+                name = quote.author
+                normalised_name = name.lower()
+
+                # Match the author of the quote against the names that are not resolved yet
+                if normalised_name not in resolved:
+                    for author in list(pending):
+                        if author == normalised_name:       # If name matches exactly
+                            match = True
+                        elif (author, normalised_name) in rejected or author in exact:
+                            continue
+                        elif difflib.SequenceMatcher(None, normalised_name, author).ratio() >= self.similarity_ratio:
+                            match = self.confirm_alias("author", author, name)
+                            print()
+                        else:
+                            continue
+
+                        if match:
+                            pending.discard(author)
+                            resolved[normalised_name] = name
+                        else:
+                            rejected.add((author, normalised_name))
+
+                if normalised_name in resolved:
+                    if print_quotes:
+                        print(Fore.MAGENTA + f"📜 Quote by {name}: {quote.text}")
+                        print(Fore.CYAN + f"🏷️  Tags: {', '.join(quote.tags)}")
+                        print("-" * 60)
+
+                    authors_quotes[name][quote.text] = list(quote.tags)
+
+        print()
+        if len(authors_quotes) == 0:
+            raise ValueError(Fore.RED + f"No quotes found for authors {', '.join(authors)}.")
+
+        for author in pending:
+            print(Fore.RED + f"No quotes found for author {author}.")
+
+        print(Fore.GREEN + f"Successfully scraped quotes of {len(authors_quotes)} authors")
+        return dict(authors_quotes)
+
+    @scheduled("interactive")
     def get_author_url(self, author: str) -> str:
         """
         Gets the URL of a specific author from the quotes website.
+        With `speculative`, the page of the author found (or suggested) is scraped in the background, for `scrape_author_info`.
 
         Parameters:
             author (str): The name of the author whose URL is to be fetched.
@@ -390,122 +2452,71 @@ class QuoteScraping(CommonMethods):
         author_url = scraper.get_author_url("Albert Einstein")
         print(author_url)
         """
+        import difflib
+
         if not isinstance(author, str):
             raise TypeError(Fore.RED + "author must be a string")
         
-        author = author.lower().strip()      # Normalizing author name
+        query = author
+        alias = self.aliases.get("author", author)      # A misspelling confirmed before resolves without matching or asking
+        author = (alias or author).lower().strip()      # Normalizing author name
 
-        # If author_url is empty, search for author from the beginning
-        if len(self.author_urls) == 0:
-            page_count = 0
-            next_href = ""
-            url = QuoteScraping.base_url
-        
-        # If author_url is not empty
-        else:
-            names = list(self.author_urls.keys())
-            names.remove("last page")
-            names.remove("next href")
-            lower_names = list(map(lambda x: x.lower(), names))     # List for checking author names
-
-            # If there is an exact match, return the author url
-            if author in lower_names:       
-                name = names[lower_names.index(author)]
-                return self.author_urls[name]
-            
-            match = difflib.get_close_matches(author, lower_names, n=1, cutoff=self.similarity_ratio)
+        # Check the authors that are already known first
+        names = list(self.author_urls.keys())
+        lower_names = list(map(lambda x: x.lower(), names))     # List for checking author names
 
-            # If author name is similar, ask whether user meant this
-            if match:       
-                name = names[lower_names.index(match[0])]
-                ask = input(Fore.YELLOW + f"Did you mean '{name}'? (y/n): ").lower().strip()
+        # If there is an exact match, return the author url
+        if author in lower_names:
+            name = names[lower_names.index(author)]
+            self._speculate(self.author_urls[name], self.author_details, QuoteScraping._parse_author)
+            return self.author_urls[name]
 
-                if ask == 'y':      # User confirms he meant the match
-                    is_match = True
-                else:
-                    is_match = False
-            
-            # Neither an exact match nor a similar one
-            else:
-                is_match = False
+        match = difflib.get_close_matches(author, lower_names, n=1, cutoff=self.similarity_ratio) if alias is None else []
 
-            # If there is a similar/exact match, return author_url
-            if is_match:
-                author_url = self.author_urls[name]
-                return author_url
+        # If author name is similar, ask whether user meant this
+        if match:
+            name = names[lower_names.index(match[0])]
+            self._speculate(self.author_urls[name], self.author_details, QuoteScraping._parse_author)        # Fetched while the user answers
 
-            # If author_url is not present
-            else:
-                if self.author_urls["next href"] is None:       # All pages have been scraped
-                    raise ValueError(Fore.RED + f"Author '{author} not found")
-                
-                # Start scraping from the where it was left off
-                else:
-                    page_count = self.author_urls["last page"]      # Last page that was fully scraped
-                    next_href = self.author_urls["next href"]       # href for next page
-                    url = QuoteScraping.base_url + next_href
-
-        if page_count == 1:
-            print(f"Author not found in page 1")
-        elif page_count == 0:
-            pass
-        else:
-            print(f"Author not found in pages 1-{page_count}")
-        
-        # Scraping Pages one by one
-        while url:
-            try:
-                response = self.session.get(url, timeout=self.timeout, headers=self.header)
-            except requests.exceptions.RequestException as e:
-                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
-            
-            self.author_urls["last page"] = page_count      # Updating last page
-            self.author_urls["next href"] = next_href       # Updating next href
+            if self.confirm_alias("author", query, name):      # User confirms he meant the match
+                return self.author_urls[name]
 
-            page_count += 1
-            print(Fore.CYAN + f"Searching page {page_count}...")
-            soup = BeautifulSoup(response.text, "html.parser")          
-            authors = soup.find_all("small", class_="author")       # All authors in current page
+        # All pages have been scraped, so every author is already known
+        if self.last_page is not None:
+            raise ValueError(Fore.RED + f"Author '{author}' not found.")
 
-            for auth in authors:
-                name = auth.get_text(strip=True)
-                normalised_name = name.lower()      # Normalizing author name
+        checked = set(names)        # Authors that have already been compared
 
-                quote = auth.find_parent("div", class_="quote")
-                about_href = quote.find("a", class_=None)["href"]
-                author_url = QuoteScraping.base_url + about_href    # Scraping author_url
+        # Scraping Pages one by one
+        for page, _, quote_page in self._iter_quote_pages():
+            print(Fore.CYAN + f"Searching page {page}...")
+
+            for quote in quote_page["quotes"]:
+                name = quote.author
+
+                if name in checked:
+                    continue
+                checked.add(name)
 
-                self.author_urls[name] = author_url   # Storing author name and url, even if it does not match, for later use
-                
                 # If there is an exact match, return author_url
-                if author == normalised_name:
-                    return author_url
+                if author == name.lower():
+                    self._speculate(quote.author_url, self.author_details, QuoteScraping._parse_author)
+                    return quote.author_url
+                if alias is not None:
+                    continue        # Only the name confirmed before is looked for
                 
-                similarity = difflib.SequenceMatcher(isjunk=None, a=normalised_name, b=author).ratio()
+                similarity = difflib.SequenceMatcher(isjunk=None, a=name.lower(), b=author).ratio()
 
                 # If author name is similar, ask user whether he meant this
-                if similarity >= self.similarity_ratio:      
-                    ask = input(Fore.YELLOW + f"Did you mean '{name}'? (y/n): ").lower().strip()
-
-                    if ask == 'y':      # Return author_url if user meant this
-                        return author_url
-            
-            # Pagination
-            next_button = soup.find("li", class_="next")
-
-            if next_button:
-                next_href = next_button.find("a")["href"]
-                url = QuoteScraping.base_url + next_href
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))    # Reduce traffic on website
-            else:
-                self.author_urls["last page"] = page_count
-                self.author_urls["next href"] = None
-                break       # End of scraping
+                if similarity >= self.similarity_ratio:
+                    self._speculate(quote.author_url, self.author_details, QuoteScraping._parse_author)
+                    if self.confirm_alias("author", query, name):      # Return author_url if user meant this
+                        return quote.author_url
         
         # If author was not found, raise error
         raise ValueError(Fore.RED + f"Author '{author}' not found.")
 
-    def scrape_author_info(self, author_url: str, print_info: bool = True) -> Dict[str, str]:
+    def scrape_author_info(self, author_url: str, print_info: bool = True) -> Author:
         """
         Scrapes information about a specific author from their URL.
         
@@ -514,7 +2525,7 @@ class QuoteScraping(CommonMethods):
             print_info (bool): If True, prints the author's information to the console. Default is True.
         
         Returns:
-            dict: A dictionary containing the author's birth date, location, and a brief bio.
+            Author: The author's name, birth date, location, a brief bio and URL. Use `to_dict()` for a dictionary.
         
         Raises:
             TypeError: If the author_url is not a string.
@@ -532,95 +2543,176 @@ class QuoteScraping(CommonMethods):
         if not isinstance(print_info, bool):
             raise TypeError(Fore.RED + "print_info must be a boolean value.")
 
-        try:
-            author_response = self.session.get(author_url, timeout=self.timeout, headers=self.header)
-        except requests.exceptions.RequestException as e:
-            raise Exception(Fore.RED + f"Error fetching {author_url}: {e}")
-        
-        author_soup = BeautifulSoup(author_response.text, "html.parser")
-
-        name = author_soup.select_one("h3.author-title").get_text(strip=True)      # Author name
-        born = author_soup.select_one("span.author-born-date").get_text(strip=True)
-        location = author_soup.select_one("span.author-born-location").get_text(strip=True)
-        description = author_soup.select_one("div.author-description").get_text(strip=True)
-        description = ".".join(description.split('.', maxsplit=6)[:5])      # Display only part of the description to keep it short
+        author = self._author(author_url)
+        author = replace(author, bio=".".join(author.bio.split('.', maxsplit=6)[:5]))      # Display only part of the description to keep it short
         
         print()
-        print(Fore.GREEN + f"Successfully scraped details of author {name}")
+        print(Fore.GREEN + f"Successfully scraped details of author {author.name}")
         if print_info:
             print()
-            print(f"👤 Author: {name}")
-            print(f"🎂 Born: {born}")
-            print(f"📍 Location: {location}")
-            print(f"📝 Bio: {description}")
+            print(f"👤 Author: {author.name}")
+            print(f"🎂 Born: {author.born}")
+            print(f"📍 Location: {author.location}")
+            print(f"📝 Bio: {author.bio}")
             print(Fore.LIGHTBLUE_EX + f"URL: {author_url}")
 
-            print("-" * 60)
+            print("-" * 60)
+
+        return author
+
+    def _author(self, author_url: str) -> Author:
+        """
+        Returns the details of an author from `author_details`, or scrapes them once.
+        Threads asking for the same author at the same time share one request and one parse.
+
+        Parameters:
+            author_url (str): The URL of the author's page.
+
+        Returns:
+            Author: The details of the author, with the full description.
+
+        Raises:
+            Exception: If there is an error fetching the page.
+        """
+        if author_url in self.author_details:
+            return self.author_details[author_url]
+
+        def scrape() -> Author:
+            if author_url in self.author_details:
+                return self.author_details[author_url]      # Stored by another thread meanwhile
+
+            author_response = self.fetch(author_url)
+            author_soup = self.parse(author_response.text)
+            self.author_details[author_url] = QuoteScraping._parse_author(author_soup, author_url)
+            return self.author_details[author_url]
+
+        return self.single_flight(("author", author_url), scrape)
+
+    @staticmethod
+    def _parse_author(author_soup: BeautifulSoup, author_url: str) -> Author:
+        """
+        Extracts the details of an author from their parsed page.
+
+        Parameters:
+            author_soup (BeautifulSoup): The parsed page of the author.
+            author_url (str): The URL of the page.
+
+        Returns:
+            Author: The name, birth date, birth place, full description and URL of the author.
+        """
+        name = author_soup.select_one("h3.author-title").get_text(strip=True)      # Author name
+        born = author_soup.select_one("span.author-born-date").get_text(strip=True)
+        location = author_soup.select_one("span.author-born-location").get_text(strip=True)
+        description = author_soup.select_one("div.author-description").get_text(strip=True)
+
+        if location.startswith("in "):     # Location is shown as "in <place>"
+            location = location[3:]
 
-        author_info = {"Born": born, "Location": location, "Bio": description, "URL": author_url}
-        return author_info
+        return Author(name=name, born=born, location=location, bio=description, url=author_url)
 
-    def scrape_all_quotes(self) -> Dict[str, Dict[str, List[str]]]:
+    @scheduled("bulk")
+    def scrape_all_quotes(self, output: Optional[str] = None, memory_limit: int = 64 * 2**20, deduplicate: bool = False,
+                          deadline: Optional[Deadline] = None,
+                          resume: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Dict[str, List[str]]], int]:
         """
         Scrapes all quotes from the quotes website.
+        With `deduplicate`, near-duplicate quotes (different punctuation, quote marks or whitespace) are merged with a `QuoteDeduplicator`.
+        With a `deadline`, the crawl stops before the first page it would fetch after the deadline expired, and returns the quotes
+        of the pages scraped so far. `deadline.resume` is then the marker to pass as `resume` to scrape the remaining pages.
+
+        With `output`, the quotes are written to a JSON file in the same shape instead of being returned, for sites too large for memory:
+        they are collected in a `SpillStore` that spills sorted runs to disk above `memory_limit`, then merged into the file.
+        Pages fetched by such a crawl are neither cached nor indexed, so memory stays bounded however many pages there are.
         
+        Parameters:
+            output (str, optional): JSON file to stream the quotes to. Default is None (the quotes are returned).
+            memory_limit (int): Estimated memory in bytes of the quotes held before spilling to disk, with `output`. Default is 64 MiB.
+            deduplicate (bool): If True, near-duplicate quotes are merged into one, with the tags of all of them. Default is False.
+            deadline (Deadline, optional): The time budget (or cancellation token) of the crawl. Default is None (no limit).
+            resume (Dict[str, Any], optional): The `Deadline.resume` marker of an earlier call, to scrape only the pages it did not reach.
+
         Returns:
             dict: A dictionary where keys are author names and values are dictionaries with tags as keys and lists of quotes as values.
+            With `output`, the number of authors written instead (authors and tags are in sorted order in the file).
         
         Raises:
+            ValueError: If both `output` and `deduplicate` are given (run `QuoteDeduplicator` on the file instead), or `resume` is not a marker.
             Exception: If there is an error fetching the page.
         
         Example:
         ```python
         scraper = QuoteScraping()
         all_quotes = scraper.scrape_all_quotes()
+        scraper.scrape_all_quotes(output="quotes.json", memory_limit=256 * 2**20)
+        first_pages = scraper.scrape_all_quotes(deadline=Deadline(2.0))
         ```
         """
-        data = defaultdict(lambda: defaultdict(list))       # Quote data is stored here
-        page_count = 0
-        url = QuoteScraping.base_url
+        if output is not None and deduplicate:
+            raise ValueError(Fore.RED + "deduplicate needs the quotes in memory, so it cannot be used with output")
+        start = Deadline.start(resume)
 
-        while url:
-            try:
-                response = self.session.get(url, timeout=self.timeout, headers=self.header)     # Getting response from website
-            except requests.exceptions.RequestException as e:
-                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
+        if output is not None:
+            from Class_Spill import SpillStore
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            quotes = soup.find_all("div", class_="quote")       # Find all quotes in 1 page
+            with SpillStore(depth=2, leaf='list', memory_limit=memory_limit) as store:
+                for page, _, quote_page in self._iter_quote_pages(keep=False, start=start, deadline=deadline):
+                    print(Fore.CYAN + f"Scraping page {page}...")
 
-            page_count += 1
-            print(Fore.CYAN + f"Scraping page {page_count}...")
+                    for quote in quote_page["quotes"]:
+                        for tag in quote.tags:
+                            store.add((quote.author, tag), quote.text)
 
-            for quote in quotes:
-                text = quote.find("span", class_="text").get_text(strip=True)       # quote_text
-                author = quote.find("small", class_="author").get_text(strip=True)      # author
-                tags = [tag.get_text(strip=True) for tag in quote.find_all("a", class_="tag")]      # tags associated with the quote
+                written = store.write_json(output)
 
-                for tag in tags:
-                    data[author][tag].append(text)      # Listing all quotes by author and tag
+            print()
+            if deadline is not None and deadline.resume is not None:
+                print(Fore.YELLOW + f"Deadline expired: quotes before page {deadline.resume['page']} written to {output}")
+            else:
+                print(Fore.GREEN + f"Successfully scraped all quotes to {output}")
+            return written
 
-            next_button = soup.find("li", class_="next")        # Next button at the end of page for author_details
+        data = defaultdict(lambda: defaultdict(list))       # Quote data is stored here
 
-            if next_button:     # If next_buuton is availbale
-                next_href = next_button.find("a")["href"]
-                url = QuoteScraping.base_url + next_href      # url for next page
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))        # Delay requests to reduce traffic on website for next_page
-            else:
-                url = None
+        for page, _, quote_page in self._iter_quote_pages(start=start, deadline=deadline):
+            print(Fore.CYAN + f"Scraping page {page}...")
+
+            for quote in quote_page["quotes"]:
+                for tag in quote.tags:
+                    data[quote.author][tag].append(quote.text)      # Listing all quotes by author and tag
 
         print()
-        print(Fore.GREEN + "Successfully scraped all quotes")
+        if deadline is not None and deadline.resume is not None:
+            print(Fore.YELLOW + f"Deadline expired: stopped before page {deadline.resume['page']}")
+        else:
+            print(Fore.GREEN + "Successfully scraped all quotes")
+
+        if deduplicate:
+            from Class_Dedup import QuoteDeduplicator
+
+            deduplicator = QuoteDeduplicator()
+            deduplicator.add_quotes(data)
+            clusters = deduplicator.clusters()
+            print(Fore.CYAN + f"Merged {sum(len(ids) - 1 for ids in clusters)} near-duplicate quotes in {len(clusters)} groups")
+            return deduplicator.merged()
+
         return dict(data)
 
-    def scrape_all_authors(self) -> Dict[str, str]:
+    @scheduled("bulk")
+    def scrape_all_authors(self, deadline: Optional[Deadline] = None, resume: Optional[Dict[str, Any]] = None) -> Dict[str, Author]:
         """
         Scrapes information about all authors from the quotes website.
+        With a `deadline`, the crawl stops before the first listing or author page it would fetch after the deadline expired,
+        and returns the authors scraped so far. `deadline.resume` is then the marker to pass as `resume` to scrape the others.
+
+        Parameters:
+            deadline (Deadline, optional): The time budget (or cancellation token) of the crawl. Default is None (no limit).
+            resume (Dict[str, Any], optional): The `Deadline.resume` marker of an earlier call, to scrape only the authors it did not reach.
         
         Returns:
-            dict: A dictionary where keys are author names and values are dictionaries with their birth date, location, and bio.
+            dict: A dictionary where keys are author names and values are `Author` records with their birth date, location, bio and URL.
         
         Raises:
+            ValueError: If `resume` is not a marker.
             Exception: If there is an error fetching the page.
         
         Example:
@@ -629,87 +2721,203 @@ class QuoteScraping(CommonMethods):
         all_authors = scraper.scrape_all_authors()
         ```
         """
-        author_details: dict[str, dict[str, str]] = dict()      # Name as keys and data (dictionary) as values
+        author_details: dict[str, Author] = dict()      # Name as keys and data (Author) as values
+        start = Deadline.start(resume)
+        skip = resume.get("quote", 0) if resume is not None else 0     # Quotes of the first page whose authors were read before
+
+        for page, url, quote_page in self._iter_quote_pages(start=start, deadline=deadline):
+            print(Fore.CYAN + f"Scraping page {page}...")
+            print(Fore.LIGHTBLUE_EX + "Reading authors: ")
 
-        # If author_url is empty, scrape from beginning
-        if len(self.author_urls) == 0:
-            page_count = 0
-            next_href = ""
-            url = QuoteScraping.base_url
+            for position, quote in enumerate(quote_page["quotes"]):
+                name = quote.author      # author name
 
-        # If author_url has data, include that data in author_details and scrape after that
-        else:
-            for name in self.author_urls:
-                if name in ["last page", "next_href"]:
+                if start is not None and page == start[0] and position < skip:
                     continue
 
-                author_url = self.author_urls[name]
-                author_details[name] = self.scrape_author_info(author_url, print_info=False)        # Scrape data from author_url
-            
-            # If all pages have been scraped
-            if self.author_urls["next href"] is None:
-                return author_details 
-            
-            # Start scraping from where it was left off
-            else:
-                next_href = self.author_urls["next href"]
-                url = QuoteScraping.base_url + next_href
-                page_count = self.author_urls["last page"]
+                if name not in author_details:        # Scraping author details if not scraped
+                    if deadline is not None and deadline.expired and quote.author_url not in self.author_details:
+                        deadline.resume = {"page": page, "url": url, "quote": position}
+                        break
 
-        while url:
-            try:
-                response = requests.get(url, timeout=5, headers=self.header)     # Getting response from website
-            except requests.exceptions.RequestException as e:
-                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
+                    print(name)
+                    author_details[name] = self._author(quote.author_url)     # Authors scraped before are not fetched again
             
-            self.author_urls["last page"] = page_count      # Updating last page
-            self.author_urls["next href"] = next_href       # Updating next href
+            print()
+            if deadline is not None and deadline.resume is not None:
+                break
+        
+        print()
+        if deadline is not None and deadline.resume is not None:
+            print(Fore.YELLOW + f"Deadline expired: stopped at page {deadline.resume['page']}")
+        else:
+            print(Fore.GREEN + "Successfully scraped all author details")
+        return author_details
 
-            page_count += 1
-            soup = BeautifulSoup(response.text, "html.parser")
-            authors = soup.select("small.author")
-            
-            print(Fore.CYAN + f"Scraping page {page_count}...")
-            print(Fore.LIGHTBLUE_EX + "Reading authors: ")
+    @scheduled("interactive")
+    def top_tag_list(self) -> List[str]:
+        """
+        Scrapes the top tags shown in the sidebar of the quotes website.
+        The sidebar is read from the first listing page, so no extra request is made if that page was already scraped.
 
-            for auth in authors:
-                name = auth.get_text(strip=True)      # author name
+        Returns:
+            List[str]: A list of the top tags, most popular first.
 
-                if name not in author_details:        # Scraping author details if not scraped
-                    print(name)
-                    quote = auth.find_parent("div", class_="quote") 
-                    about_href = quote.find("a", class_=None)["href"]
-                    author_url = QuoteScraping.base_url + about_href
+        Raises:
+            Exception: If there is an error fetching the page.
+
+        Example:
+        ```python
+        scraper = QuoteScraping()
+        tags = scraper.top_tag_list()
+        print(tags)
+        ```
+        """
+        if 1 not in self.quote_pages:
+            self._scrape_quote_page(1, self.base_url)
 
-                    self.author_urls[name] = author_url     # Updating author_url with author_url to avoid re-scraping next time
+        # With source 'api', the first page has no sidebar, so the top tags come from the HTML page
+        if not self.top_tags:
+            soup = self.parse(self.fetch(self.base_url).text)
+            self.top_tags = [tag.get_text(strip=True) for tag in soup.select("div.tags-box span.tag-item a.tag")]
 
-                    author_response = requests.get(author_url)
-                    author_soup = BeautifulSoup(author_response.text, "html.parser")
+        return list(self.top_tags)
 
-                    born = author_soup.find("span", class_="author-born-date").get_text(strip=True)
-                    location = author_soup.find("span", class_="author-born-location").get_text(strip=True)[3:]
-                    description = author_soup.select_one("div.author-description").get_text(strip=True)
-                    author_details[name] = {"Born": born, "Location": location, "Bio": description, "URL": author_url}
+    @scheduled("interactive")
+    def scrape_tag_quotes(self, tags: List[str], print_quotes: bool = False) -> Dict[str, Dict[str, str]]:
+        """
+        Scrapes quotes of specific tags from the tag pages of the quotes website (`/tag/<name>/page/N/`).
+        Tags that were fully scraped before are answered from the inverted index without fetching any page.
 
-                    time.sleep(random.uniform(self.delay[0], self.delay[1]))        # Delay requests to reduce traffic on website
-            
-            print()
+        Parameters:
+            tags (List[str]): The tags whose quotes are to be scraped.
+            print_quotes (bool): If True, prints the quotes and their authors to the console. Default is False.
 
-            # Pagination
-            next_button = soup.find("li", class_="next")        # Next button at the end of page for author_details
-            
-            if next_button:     # If next_buuton is availbale
-                next_href = next_button.find("a")["href"]
-                url = QuoteScraping.base_url + next_href      # url for next page
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))        # Delay requests to reduce traffic on website
-            else:
-                self.author_urls["last page"] = page_count
-                self.author_urls["next href"] = None
-                break       # End of scraping
-        
-        print()
-        print(Fore.GREEN + "Successfully scraped all author details")
-        return author_details
+        Returns:
+            dict: A dictionary where keys are tags and values are dictionaries with quotes as keys and their authors as values.
+
+        Raises:
+            TypeError: If `tags` is not a list of strings.
+            TypeError: If `print_quotes` is not a boolean.
+            ValueError: If no quotes are found for any of the tags.
+            Exception: If there is an error fetching the page.
+
+        Example:
+        ```python
+        scraper = QuoteScraping()
+        quotes = scraper.scrape_tag_quotes(["love", "humor"])
+        ```
+        """
+        if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+            raise TypeError(Fore.RED + "tags must be a list of strings.")
+        if not isinstance(print_quotes, bool):
+            raise TypeError(Fore.RED + "print_quotes must be a boolean value.")
+
+        tag_quotes: dict[str, dict[str, str]] = dict()
+
+        for tag in tags:
+            tag = tag.lower().strip()       # Tags on the site are lowercase
+
+            # Scrape the pages of the tag if it has not been fully scraped before
+            def crawl(tag: str = tag) -> None:
+                if tag in self.crawled_tags:
+                    return      # Crawled by another thread meanwhile
+
+                url = self.base_url + f"tag/{tag}/"
+                page_count = 0
+
+                while url:
+                    response = self.fetch(url)
+
+                    page_count += 1
+                    print(Fore.CYAN + f"Scraping page {page_count} of tag '{tag}'...")
+                    soup = self.parse(response.text)
+                    _, next_href = self._parse_quotes(soup)     # Quotes are added to the inverted index
+
+                    # Pagination
+                    if next_href:
+                        url = self.base_url + next_href
+                    else:
+                        break
+
+                self.crawled_tags.add(tag)
+
+            if tag not in self.crawled_tags:
+                self.single_flight(("tag", tag), crawl)     # Threads asking for the same tag share one crawl
+
+            with self.index_lock:
+                quotes = [self.quote_records[quote_id] for quote_id in sorted(self.tag_index.get(tag, ()))]
+
+            if len(quotes) == 0:
+                print(Fore.RED + f"No quotes found for tag '{tag}'.")
+                continue
+
+            tag_quotes[tag] = dict()
+
+            for quote in quotes:
+                tag_quotes[tag][quote.text] = quote.author
+
+                if print_quotes:
+                    print(Fore.MAGENTA + f"📜 Quote: {quote.text}")
+                    print(Fore.CYAN + f"👤 Author: {quote.author}")
+                    print("-" * 60)
+
+        if len(tag_quotes) == 0:
+            raise ValueError(Fore.RED + f"No quotes found for tags {', '.join(tags)}.")
+
+        return tag_quotes
+
+    def find_quotes(self, tags: Optional[List[str]] = None, authors: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Finds quotes having all the given tags and written by any of the given authors, using the inverted index.
+        No page is fetched, so only quotes seen by previous crawls of this instance are considered.
+
+        Parameters:
+            tags (List[str], optional): Tags that every quote must have.
+            authors (List[str], optional): Authors of the quotes (case-insensitive). A quote matches if it is by any of them.
+
+        Returns:
+            dict: A dictionary where keys are quotes and values are dictionaries with the author and the tags of the quote.
+
+        Raises:
+            ValueError: If neither `tags` nor `authors` is given.
+
+        Example:
+        ```python
+        scraper = QuoteScraping()
+        scraper.scrape_tag_quotes(["love", "life"])
+        quotes = scraper.find_quotes(tags=["love", "life"])
+        ```
+        """
+        if not tags and not authors:
+            raise ValueError(Fore.RED + "At least one tag or author must be given.")
+
+        # The index is read under its lock, as other threads may be adding quotes
+        with self.index_lock:
+            quote_ids: Optional[set[int]] = None
+
+            # Quotes must have every tag
+            for tag in tags or []:
+                ids = self.tag_index.get(tag.lower().strip(), set())
+                quote_ids = set(ids) if quote_ids is None else quote_ids & ids
+
+            # Quotes can be by any of the authors
+            if authors:
+                wanted = {author.lower().strip() for author in authors}
+                ids = set()
+
+                for name in self.author_index:
+                    if name.lower() in wanted:
+                        ids |= self.author_index[name]
+
+                quote_ids = ids if quote_ids is None else quote_ids & ids
+
+            found = dict()
+            for quote_id in sorted(quote_ids):
+                quote = self.quote_records[quote_id]
+                found[quote.text] = {"Author": quote.author, "Tags": list(quote.tags)}
+
+        return found
 
 
 
@@ -720,7 +2928,7 @@ class BookScraping(CommonMethods):
     Class Attributes:
     -----------------------------
         base_url: str
-            The base URL of the books website.
+            The base URL of the books website. It can be overridden per instance (for example to scrape a mirror or a local test server).
         rating_map: Dict[str, int]
             A dictionary mapping rating text to numerical values.
 
@@ -734,10 +2942,20 @@ class BookScraping(CommonMethods):
             Headers to mimic a browser request.
         delay: List[int] 
             Random delay between requests to avoid increasing traffic on the server.
+        book_urls: Dict[str, Dict[str, str]]
+            A dictionary to store genres, book titles and their URLs. It is used to avoid repeated scraping of the same genre.
+        book_pages: PageCache
+            A store of the parsed listing pages by URL. Every method reads listing pages from it, so each page is fetched only once.
+        book_details: Dict[str, Book]
+            Details of every book scraped, by URL.
+        covers: CoverDownloader | None
+            If set, the cover thumbnails of the listing pages read by `scrape_all_books` and the full-size cover of every book
+            read by `scrape_book_info` are downloaded with it (see `Class_Covers`).
 
     Methods:
     ----------------------------
     - `genre_list`: Scrapes the list of genres from the books website.
+    - `plan_pages`: Plans the URLs of the pages of a listing (the catalogue or a genre).
     - `scrape_books_from_genre`: Scrapes books from a specific genre on the books website.
     - `scrape_book_info`: Scrapes information about a specific book from its URL.
     - `scrape_all_books`: Scrapes all books from the books website.
@@ -754,23 +2972,206 @@ class BookScraping(CommonMethods):
     """
     base_url = "https://books.toscrape.com/"
     rating_map = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5}
-    init(autoreset=True)
     
-    def __init__(self) -> None:
+    def __init__(self, max_pages: int = 256, transport: Optional[Transport] = None, scheduler: Optional[RequestScheduler] = None,
+                 base_url: Optional[str] = None) -> None:
         """
         Initializes the BookScraping class with a session, headers, and timeout settings.
 
+        Parameters:
+            max_pages (int): Maximum number of parsed listing pages kept in `book_pages`. Default is 256.
+            transport (Transport, optional): The transport used for every request. Default is a new `Transport`.
+            scheduler (RequestScheduler, optional): The scheduler that dispatches every request. Default is the scheduler shared by all scrapers.
+            base_url (str, optional): The base URL of the website, overriding `base_url` for this instance.
+
         Attributes:
             timeout (int): Timeout for requests in seconds. Recommended to keep it low to avoid long
             session (requests.Session): A requests session for making HTTP requests. Sessions are more efficient for multiple requests.
             header (Dict[str, str]): Headers to mimic a browser request.
             delay (List[int]): Random delay between requests to avoid increasing traffic on the server.
-            book_urls (Dict[str, Dict[str, Any]]): A dictionary to store genres, book titles and their URLs. It is used to avoid repeated scraping of the same book.
+            book_urls (Dict[str, Dict[str, str]]): A dictionary to store genres, book titles and their URLs. It is used to avoid repeated scraping of the same book.
+            genre_urls (Dict[str, str]): A dictionary to store genre names and the URLs of their first pages.
+            book_pages (PageCache): A store of parsed listing pages (books and next url) by URL, with LRU eviction.
+            book_details (Dict[str, Book]): Details of every book scraped, by book URL.
+            covers (CoverDownloader | None): The downloader of the cover images. Default is None (covers are not downloaded).
         """
-        super().__init__()
-        self.book_urls: dict[str, dict[str, Any]] = dict()
+        super().__init__(transport, scheduler)
+
+        if base_url is not None:
+            self.base_url = base_url
+        self.book_urls: dict[str, dict[str, str]] = dict()
+        self.genre_urls: dict[str, str] = dict()
         self.similarity_ratio = 0.8
 
+        # Parsed listing pages (catalogue and genre pages), keyed by URL and shared by all methods
+        self.book_pages = PageCache(max_pages)
+
+        # Details of every book scraped, by URL, so each book page is fetched once
+        self.book_details: dict[str, Book] = dict()
+        self.covers: Optional[CoverDownloader] = None
+
+    def _scrape_book_page(self, url: str, keep: bool = True) -> Dict[str, Any]:
+        """
+        Scrapes a single listing page of the books website, or returns it from `book_pages` if it was scraped before.
+        The genres in the side panel are stored in `genre_urls`.
+
+        Parameters:
+            url (str): The URL of the page (a catalogue page or a genre page).
+            keep (bool): If False, a page that has to be fetched is not stored in `book_pages`. Default is True.
+
+        Returns:
+            dict: A dictionary with the book titles and URLs of the page, their cover thumbnails, the URL of the next page
+            (None for the last page) and the pagination scheme learned by `PagePlanner` (None if it cannot be learned).
+
+        Raises:
+            Exception: If there is an error fetching the page.
+        """
+        book_page = self.book_pages.get(url)
+        if book_page is not None:
+            return book_page
+
+        def scrape() -> Dict[str, Any]:
+            book_page = self.book_pages.get(url)
+            if book_page is not None:
+                return book_page        # Stored by another thread meanwhile
+
+            response = self.fetch(url)
+
+            soup = self.parse(response.text)
+
+            # Genres in the side panel
+            # genre_urls is replaced instead of updated in place, so other threads never see a partial list
+            sidebar = {genre.get_text(strip=True): urljoin(url, genre["href"]) for genre in soup.select("ul.nav-list ul li a")}
+            if not sidebar.keys() <= self.genre_urls.keys():
+                self.genre_urls = {**sidebar, **self.genre_urls}
+
+            # Scraping book title, URL and cover thumbnail
+            books: dict[str, str] = dict()
+            covers: dict[str, str] = dict()
+            for book in soup.select("article.product_pod"):
+                link = book.h3.select_one("a")
+                books[link["title"]] = urljoin(url, link["href"])
+
+                thumbnail = book.select_one("img")
+                if thumbnail is not None and thumbnail.get("src"):
+                    covers[link["title"]] = urljoin(url, thumbnail["src"])
+
+            # Pagination
+            next_button = soup.find("li", class_="next")
+            next_url = urljoin(url, next_button.find("a")["href"]) if next_button else None
+
+            book_page = {"books": books, "covers": covers, "next url": next_url, "scheme": PagePlanner.learn(url, soup)}
+            if keep:
+                self.book_pages[url] = book_page
+            return book_page
+
+        if not keep:
+            return scrape()
+
+        # Threads asking for the same page at the same time (for example `genre_list`) share one request and one parse
+        return self.single_flight(("book page", url), scrape)
+
+    def _iter_book_pages(self, url: str, keep: bool = True, start: Optional[Tuple[int, str]] = None,
+                         deadline: Optional[Deadline] = None) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """
+        Iterates over listing pages of the books website, starting from the given page.
+        The URLs of all pages are planned from the first page (see `plan_pages`), so no page waits for the next button of the one before it.
+        Pages are read from `book_pages` when available, so the delay between requests is only paid for pages that have to be fetched.
+        With a `deadline`, no page is fetched once it has expired: the iteration stops and the page to resume from is left in `deadline.resume`.
+
+        Parameters:
+            url (str): The URL of the first page.
+            keep (bool): If False, fetched pages are not stored in `book_pages` (see `_scrape_book_page`). Default is True.
+            start (Tuple[int, str], optional): The number and URL of the page to start from (see `Deadline.start`). Default is the first page.
+            deadline (Deadline, optional): The deadline of the crawl. Default is None (no limit).
+
+        Yields:
+            tuple: A tuple containing the page number, its URL and the parsed page (books and next url).
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        if deadline is not None:
+            deadline.resume = None
+            if deadline.expired:
+                page, page_url = start if start is not None else (1, url)
+                deadline.resume = {"page": page, "url": page_url}
+                return
+
+        for page, page_url, book_page in self._plan_book_pages(url, keep, start, deadline):
+            if book_page is None:
+                book_page = self.book_pages.get(page_url)
+
+            if book_page is None:
+                if deadline is not None and deadline.expired:
+                    deadline.resume = {"page": page, "url": page_url}
+                    return
+                book_page = self._scrape_book_page(page_url, keep)
+
+            yield page, page_url, book_page
+
+    def plan_pages(self, url: str) -> Iterator[str]:
+        """
+        Plans the URLs of a listing of the books website (the catalogue or a genre) from its first page.
+        The "Page 1 of N" pager gives every URL up front, so the pages can be fetched in any order.
+        If the scheme cannot be learned, the URLs are discovered one by one with the next buttons.
+
+        Parameters:
+            url (str): The URL of the first page of the listing.
+
+        Yields:
+            str: The URL of each page of the listing, in order.
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        for _, page_url, _ in self._plan_book_pages(url):
+            yield page_url
+
+    def _plan_book_pages(self, url: str, keep: bool = True, start: Optional[Tuple[int, str]] = None,
+                         deadline: Optional[Deadline] = None) -> Iterator[Tuple[int, str, Optional[Dict[str, Any]]]]:
+        """
+        Plans the URLs of a listing of the books website (see `plan_pages`).
+        Following next buttons scrapes every page while planning, so the parsed page is yielded with its URL and is not fetched twice.
+
+        Parameters:
+            url (str): The URL of the first page of the listing.
+            keep (bool): If False, pages scraped while planning (the first page included) are not stored (see `_scrape_book_page`). Default is True.
+            start (Tuple[int, str], optional): The number and URL of the first page to yield. Default is the first page.
+                The first page is still scraped to learn the pagination, but it is usually in `book_pages`.
+            deadline (Deadline, optional): Once it has expired, the next page to follow is yielded without being scraped (None) and planning stops.
+
+        Yields:
+            tuple: The number and URL of each page of the listing, in order, and the parsed page if it was scraped while planning (None otherwise).
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        first_page = self._scrape_book_page(url, keep)
+        page, page_url = start if start is not None else (1, url)
+
+        if first_page["scheme"] is not None:
+            for planned_page, planned_url in enumerate(PagePlanner.expand(url, first_page["scheme"]), start=1):
+                if planned_page >= page:
+                    yield planned_page, planned_url, first_page if planned_page == 1 else None
+            return
+
+        # Pagination with next buttons
+        book_page = first_page if page == 1 else None
+
+        while page_url:
+            if book_page is None:
+                if deadline is not None and deadline.expired:
+                    yield page, page_url, None      # Left to the caller, which stops here
+                    return
+                book_page = self._scrape_book_page(page_url, keep)
+            yield page, page_url, book_page
+
+            page_url = book_page["next url"]
+            page += 1
+            book_page = None
+
+    @scheduled("interactive")
     def genre_list(self) -> List[str]:
         """
         Scrapes the list of genres from the books website.
@@ -788,28 +3189,29 @@ class BookScraping(CommonMethods):
         print(genres)
         ```
         """
-        try:
-            response = self.session.get(url=BookScraping.base_url, timeout=self.timeout, headers=self.header)
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Error fetching {BookScraping.base_url}: {e}")
-        
-        soup = BeautifulSoup(response.text, "html.parser")
-        side_panel = soup.find("ul", class_="nav nav-list")
-        genres = side_panel.select("ul ul li")
+        if len(self.genre_urls) == 0:
+            self._scrape_book_page(self.base_url)
 
-        genre_list = [genre.find("a").get_text(strip=True) for genre in genres]
-        return genre_list
+        return list(self.genre_urls.keys())
     
-    def validate_name(self, name: str, options: List[str]) -> Tuple[str, bool]:
+    def validate_name(self, name: str, options: List[str], kind: str = "name",
+                      suggested: Optional[Callable[[str], None]] = None) -> Tuple[str, bool]:
         """
         Validates if the given genre is present in the list of genres and corrects it if necessary.
+        A misspelling confirmed before (see `aliases`) is corrected without fuzzy matching or asking again.
         
         Parameters:
             genre (str): The genre to validate.
+            options (List[str]): The valid names.
+            kind (str): What the name is, for example 'genre' or 'book', so aliases of different kinds do not mix. Default is 'name'.
+            suggested (Callable[[str], None], optional): Called with a similar name before the user is asked about it,
+                for example to fetch its page meanwhile. Default is None.
         
         Returns:
             tuple: A tuple containing the genre (corrected if necessary) and a boolean indicating if the genre is valid.
         """
+        import difflib
+
         if not isinstance(name, str):
             raise TypeError(Fore.RED + "Name to be validated must be a string")
         
@@ -821,16 +3223,22 @@ class BookScraping(CommonMethods):
             name = options[options_lower.index(normal_name)]
             return (name, True)
 
+        # If the user confirmed what they meant before, only that name is valid
+        alias = self.aliases.get(kind, name)
+        if alias is not None:
+            return (alias, True) if alias in options else (name, False)
+
         # If name is not an exact match, find a similar one
         else:
             match = difflib.get_close_matches(normal_name, options_lower, n=1, cutoff=self.similarity_ratio)
 
             # If there is a match, ask whether the user meant this name
             if match:
-                match_name = options[options_lower.index(normal_name)]
-                ask = input(Fore.YELLOW + f"Did you mean '{match_name}'? (y/n): ").lower().strip()
+                match_name = options[options_lower.index(match[0])]
+                if suggested is not None:
+                    suggested(match_name)
 
-                if ask == 'y':      # User confirms the match
+                if self.confirm_alias(kind, name, match_name):      # User confirms the match
                     return (match_name, True)
                 else:
                     return (name, False)
@@ -839,119 +3247,70 @@ class BookScraping(CommonMethods):
             else:
                 return (name, False)
             
-    def scrape_books_from_genre(self, genre: str, print_books: bool = True) -> List[str]:
+    @scheduled("interactive")
+    def scrape_books_from_genre(self, genre: str, print_books: bool = True, deadline: Optional[Deadline] = None,
+                                resume: Optional[Dict[str, Any]] = None) -> List[str]:
         """ 
         Scrapes books from a specific genre on the books website.
+        With a `deadline`, the crawl stops before the first page it would fetch after the deadline expired, and returns the books
+        of the pages scraped so far. `deadline.resume` is then the marker to pass as `resume` to scrape the remaining pages.
+        Only a genre scraped from its first page to its last is stored in `book_urls`.
         
         Parameters:
             genre (str): The name of the genre to scrape books from
+            print_books (bool): If True, prints the book titles to the console. Default is True.
+            deadline (Deadline, optional): The time budget (or cancellation token) of the crawl. Default is None (no limit).
+            resume (Dict[str, Any], optional): The `Deadline.resume` marker of an earlier call, to scrape only the pages it did not reach.
         
         Returns:
-            tuple: A tuple containing two lists:
-            - A list of book titles in the specified genre.
-            - A list of corresponding book URLs.
+            List[str]: A list of book titles in the specified genre. Their URLs are stored in `book_urls`.
         
         Raises:
             TypeError: If `genre` is not a string.
-            ValueError: If `genre` is not present in the list of genres.
+            ValueError: If `genre` is not present in the list of genres, or `resume` is not a marker.
             Exception: If there is an error fetching the page.
         
         Example:
         ```python
         scraper = BookScraping()
-        books, urls = scraper.scrape_books_from_genre("science")
+        books = scraper.scrape_books_from_genre("science")
         print(books)
-        print(urls)
         ```
         """
         genres = self.genre_list()
 
         # True if genre is present in the list of genres, False otherwise
-        genre, is_present = self.validate_name(genre, genres)       
+        genre, is_present = self.validate_name(genre, genres, kind='genre')       
         
         if not is_present:
             raise ValueError(Fore.RED + f"genre '{genre}' not present")
 
-        genre_index = genres.index(genre) + 2
-        base_url = BookScraping.base_url + f"catalogue/category/books/{genre}_{genre_index}/index.html"        # URL for starting page of the genre
+        start = Deadline.start(resume)
 
-        # If genre is not present in book_urls, start scraping from the first page
-        if genre not in self.book_urls:
-            self.book_urls[genre] = dict()
-            book_list = []
-            url = base_url
-            page_count = 0
-        
-        # If genre is present in book_urls
-        else:
-            genre_books = self.book_urls[genre]
-            book_list = list(genre_books.keys())
-            book_list.remove("next url")
-            book_list.remove("last page")
-
-            # next href = None means that all books in the genre have been scraped
-            if genre_books["next url"] is None:
-                print(Fore.GREEN + "All pages have been scraped")
-
-                # Printing books if print_book is True
-                if print_books:
-                    print(Fore.CYAN + "Books found: ")
-                    print()
-
-                    for book in book_list:
-                        print(book)
-
-                return book_list
-            
-            # If next href is not None, continue scraping from the next page
-            else:
-                next_url = genre_books["next url"]
-                url = next_url
-                page_count = genre_books["last page"]
-                print(Fore.CYAN + f"Continuing to scrape from page {page_count + 1}...")
-                print()
+        # If all books of the genre have been scraped before
+        if genre in self.book_urls and start is None:
+            print(Fore.GREEN + "All pages have been scraped")
+            book_list = list(self.book_urls[genre].keys())
+            if deadline is not None:
+                deadline.resume = None
 
         # Scraping a Genre
-        while url:
-            try:
-                response = self.session.get(url=url, timeout=self.timeout, headers=self.header)
-            except requests.exceptions.RequestException as e:
-                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
-            
-            self.book_urls[genre]["last page"] = page_count
-            self.book_urls[genre]["next url"] = url
-
-            page_count += 1
-            print(Fore.CYAN + f"Scraping page {page_count}...")
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # All the books in the current page of the genre
-            books = soup.select("article.product_pod")
-
-            for book in books:
-                title = book.h3.select_one("a")["title"]
-
-                if title not in book_list:
-                    href = book.h3.select_one("a")["href"]
-                    url = BookScraping.base_url + "catalogue/" + href[9:]
+        else:
+            genre_books: dict[str, str] = dict()
 
-                    self.book_urls[genre][title] = url
-                    book_list.append(title)
+            for page, _, book_page in self._iter_book_pages(self.genre_urls[genre], start=start, deadline=deadline):
+                print(Fore.CYAN + f"Scraping page {page}...")
+                genre_books.update(book_page["books"])
 
-            # Looking for next button in the same genre (Pagination)
-            next_button = soup.find("li", class_="next")
+            book_list = list(genre_books.keys())
+            print()
 
-            if next_button:
-                next_href = next_button.find("a")["href"]
-                url = base_url.replace("index.html", next_href)
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))
+            if deadline is not None and deadline.resume is not None:
+                print(Fore.YELLOW + f"Deadline expired: stopped before page {deadline.resume['page']}")
             else:
-                self.book_urls[genre]["last page"] = page_count
-                self.book_urls[genre]["next url"] = None
-                break
-        
-        print()
-        print(Fore.GREEN + "Successfully scraped all pages")
+                if start is None:       # Every page of the genre
+                    self.book_urls[genre] = genre_books
+                print(Fore.GREEN + "Successfully scraped all pages")
         print()
 
         # Printing books if print_book is True
@@ -964,64 +3323,110 @@ class BookScraping(CommonMethods):
 
         return book_list
     
-    def get_book_url(self, book_name: str, genre: str = "") -> str:
+    # A title in a known genre is an interactive lookup, a title without a genre crawls every genre
+    @scheduled(lambda self, book_name, genre="", *args, **kwargs: "bulk" if genre == "" else "interactive")
+    def get_book_url(self, book_name: str, genre: str = "", deadline: Optional[Deadline] = None,
+                     resume: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Finds the URL of a book, in the genres scraped before, then in `genre` or in every genre.
+        With a `deadline`, the search stops before the first page it would fetch after the deadline expired. The pages and genres
+        scraped so far are kept, so calling again on the same scraper goes on from there; `deadline.resume` lists the genres searched,
+        so `resume` skips them on another scraper too.
+        With `speculative`, the page of the book found (or suggested) is scraped in the background, for `scrape_book_info`.
+
+        Parameters:
+            book_name (str): The title of the book. Similar titles are suggested if there is no exact match.
+            genre (str): The genre of the book. Default is '' (search every genre).
+            deadline (Deadline, optional): The time budget (or cancellation token) of the search. Default is None (no limit).
+            resume (Dict[str, Any], optional): The `Deadline.resume` marker of an earlier call, to skip the genres it searched.
+
+        Returns:
+            str: The URL of the book.
+
+        Raises:
+            TypeError: If `book_name` or `genre` is not a string.
+            ValueError: If the genre or the book is not found.
+            DeadlineExceeded: If the deadline expired before the book was found.
+            Exception: If there is an error fetching a page.
+        """
         if not isinstance(book_name, str):
             raise TypeError(Fore.RED + "book_name must be a string")
         if not isinstance(genre, str):
             raise TypeError(Fore.RED + "genre must be a string")
+
+        def found(genre_name: str, book: str) -> str:
+            self._speculate(self.book_urls[genre_name][book], self.book_details, BookScraping._parse_book)
+            return self.book_urls[genre_name][book]
+
+        def suggest(genre_name: str) -> Callable[[str], None]:
+            return lambda book: self._speculate(self.book_urls[genre_name][book], self.book_details, BookScraping._parse_book)     # Fetched while the user answers
         
         # Searching if book is present in book_urls
-        for genre in self.book_urls:
-            genre_books = list(self.book_urls[genre].keys())
-            genre_books.remove("last page")
-            genre_books.remove("next url")
+        for genre_name in list(self.book_urls):        # Copy, as other threads may add genres
+            genre_books = list(self.book_urls[genre_name].keys())
 
             # Finding exact/similar match for book_name in genre_books and correcting book_name if necessary
-            book, is_present = self.validate_name(book_name, genre_books)
+            book, is_present = self.validate_name(book_name, genre_books, kind='book', suggested=suggest(genre_name))
 
             if is_present:      # Return book URL if it is present
-                return self.book_urls[genre][book]
+                return found(genre_name, book)
+
+        searched = list(resume.get("genres", [])) if resume is not None else []     # Genres searched by an earlier call
+
+        def stop() -> None:
+            deadline.resume = {"genres": searched}
+            raise DeadlineExceeded(Fore.RED + f"Deadline expired while looking for '{book_name}'", deadline.resume)
 
         # If no genre is specified, search in all genres
         if genre == "":
             genres = self.genre_list()
 
             for genre_name in genres:
-                genre_books = self.scrape_books_from_genre(genre_name, print_books=False)
-                book, is_present = self.validate_name(book_name, genre_books)
+                if genre_name in self.book_urls or genre_name in searched:     # Already searched
+                    continue
+
+                genre_books = self.scrape_books_from_genre(genre_name, print_books=False, deadline=deadline)
+                if deadline is not None and deadline.resume is not None:        # Only part of the genre was scraped
+                    stop()
+
+                searched.append(genre_name)
+                book, is_present = self.validate_name(book_name, genre_books, kind='book', suggested=suggest(genre_name))
 
                 if is_present:
-                    return self.book_urls[genre_name][book]
+                    return found(genre_name, book)
 
         # If genre is specified, search in that genre 
         else:
             genres = self.genre_list()
-            genre, is_present = self.validate_name(genre, genres)
+            genre, is_present = self.validate_name(genre, genres, kind='genre')
 
             # Checking if genre_name is valid
             if not is_present:
                 raise ValueError(Fore.RED + f"genre '{genre}' not present")
 
-            genre_books = self.scrape_books_from_genre(genre)
-            book, is_present = self.validate_name(book, genre_books)
+            genre_books = self.scrape_books_from_genre(genre, print_books=False, deadline=deadline)
+            if deadline is not None and deadline.resume is not None:
+                stop()
+            book, is_present = self.validate_name(book_name, genre_books, kind='book', suggested=suggest(genre))
 
             # Checking if book is present in the specified genre
             if is_present:
-                return self.book_urls[genre][book]
+                return found(genre, book)
             
         # If book is not found in any genre, raise error
         raise ValueError(Fore.RED + f"Book '{book_name}' not found in any genre.")
 
-    def scrape_book_info(self, book_url: str, print_info: bool = True) -> Dict[str, str]:
+    def scrape_book_info(self, book_url: str, print_info: bool = True) -> Book:
         """
         Scrapes information about a specific book from its URL.
+        If `covers` is set, the full-size cover of the book is queued for download.
         
         Parameters:
             book_url (str): The URL of the book to scrape information from.
             print_info (bool): If True, prints the book's information to the console. Default is True.
         
         Returns:
-            dict: A dictionary containing the book's UPC, price, rating, availability, and URL.
+            Book: The book's title, genre, UPC, price (in pence), rating, availability, and URL. Use `to_dict()` for a dictionary.
         
         Raises:
             TypeError: If `book_url` is not a string.
@@ -1039,18 +3444,69 @@ class BookScraping(CommonMethods):
         if not isinstance(print_info, bool):
             raise TypeError(Fore.RED + "print_info must be a boolean value")
         
-        try:
-            response = self.session.get(url=book_url, timeout=self.timeout, headers=self.header)
-        except requests.exceptions.RequestException as e:
-            raise Exception(Fore.RED + f"Error fetching {book_url}: {e}")
+        book = self._book(book_url)
+
+        if self.covers is not None and book.image_url:
+            self.covers.queue({book.title: book.image_url})
         
-        soup = BeautifulSoup(response.text, "html.parser")
+        if print_info:
+            print(Fore.MAGENTA + f"Genre: {book.genre}")
+            print(Fore.YELLOW + f"📦 UPC: {book.upc}")
+            print(Fore.GREEN + f"💰 Price: {book.price_text}")
+            print(Fore.BLUE + f"⭐ Rating: {book.rating} out of 5")
+            print(Fore.LIGHTYELLOW_EX + f"📍 Availability: {book.availability}")
+            print(Fore.CYAN + f"🔗 URL: {book_url}")
+
+        return book
+
+    def _book(self, book_url: str) -> Book:
+        """
+        Returns the details of a book from `book_details`, or scrapes them once.
+        Threads asking for the same book at the same time share one request and one parse.
+
+        Parameters:
+            book_url (str): The URL of the book's page.
+
+        Returns:
+            Book: The details of the book.
+
+        Raises:
+            Exception: If there is an error fetching the page.
+        """
+        book = self.book_details.get(book_url)
+        if book is not None:
+            return book
+
+        def scrape() -> Book:
+            book = self.book_details.get(book_url)
+            if book is not None:
+                return book     # Stored by another thread meanwhile
+
+            response = self.fetch(book_url)
+            soup = self.parse(response.text)
+            self.book_details[book_url] = BookScraping._parse_book(soup, book_url)
+            return self.book_details[book_url]
+
+        return self.single_flight(("book", book_url), scrape)
 
-        availability = soup.select_one("p", class_="instock availability").get_text(strip=True)      # availability
-        price = soup.select_one("p.price_color").get_text(strip=True)       # price
+    @staticmethod
+    def _parse_book(soup: BeautifulSoup, book_url: str) -> Book:
+        """
+        Extracts the details of a book from its parsed page.
+
+        Parameters:
+            soup (BeautifulSoup): The parsed page of the book.
+            book_url (str): The URL of the page.
+
+        Returns:
+            Book: The title, genre, UPC, price, rating, availability, URL and cover image URL of the book.
+        """
+        title = soup.select_one("div.product_main h1").get_text(strip=True)        # title
+        availability = soup.select_one("p.instock.availability").get_text(strip=True)      # availability
+        price = Book.parse_price(soup.select_one("p.price_color").get_text(strip=True))       # price
         rating_text = soup.select_one("p.star-rating")["class"][-1].lower()
-        rating = BookScraping.rating_map[rating_text]       # rating
-        breadcrumbs = soup.select("ul.breadcrum li a")
+        rating = BookScraping.rating_map.get(rating_text, 0)       # rating
+        breadcrumbs = soup.select("ul.breadcrumb li a")
 
         if len(breadcrumbs) >= 3:
             genre = breadcrumbs[2].get_text(strip=True)     # genre
@@ -1059,80 +3515,84 @@ class BookScraping(CommonMethods):
 
         table = soup.find("table", class_="table table-striped")
         rows = table.select("tr")
+        upc = ""
 
         for row in rows:
             if row.select_one("th").get_text(strip=True) == 'UPC':
                 upc = row.select_one("td").get_text(strip=True)     # UPC
-        
-        if print_info:
-            print(Fore.MAGENTA + f"Genre: {genre}")
-            print(Fore.YELLOW + f"📦 UPC: {upc}")
-            print(Fore.GREEN + f"💰 Price: {price}")
-            print(Fore.BLUE + f"⭐ Rating: {rating} out of 5")
-            print(Fore.LIGHTYELLOW_EX + f"📍 Availability: {availability}")
-            print(Fore.CYAN + f"🔗 URL: {book_url}")
 
-        book_info = {"Genre": {genre}, "UPC": upc, "Price": price, "Rating": rating, "Availability": availability, "URL": book_url}     # Recording data
-        return book_info
-        
-    def scrape_all_books(self) -> Dict[str, str]:
+        image = soup.select_one("#product_gallery img")
+        image_url = urljoin(book_url, image["src"]) if image is not None and image.get("src") else ""      # full-size cover
+
+        return Book(title=title, genre=genre, upc=upc, price=price, rating=rating, availability=availability, url=book_url, image_url=image_url)
+
+
+    @scheduled("bulk")
+    def scrape_all_books(self, output: Optional[str] = None, memory_limit: int = 64 * 2**20, deadline: Optional[Deadline] = None,
+                         resume: Optional[Dict[str, Any]] = None) -> Union[Dict[str, str], int]:
         """
         Scrapes all books from the books website.
+        With a `deadline`, the crawl stops before the first page it would fetch after the deadline expired, and returns the books
+        of the pages scraped so far. `deadline.resume` is then the marker to pass as `resume` to scrape the remaining pages.
+
+        With `output`, the books are written to a JSON file in the same shape instead of being returned, for sites too large for memory:
+        they are collected in a `SpillStore` that spills sorted runs to disk above `memory_limit`, then merged into the file.
+        Pages fetched by such a crawl are not cached, so memory stays bounded however many pages there are.
+        If `covers` is set, the cover thumbnails of every page are queued for download (call `covers.wait()` to wait for them).
+
+        Parameters:
+            output (str, optional): JSON file to stream the books to. Default is None (the books are returned).
+            memory_limit (int): Estimated memory in bytes of the books held before spilling to disk, with `output`. Default is 64 MiB.
+            deadline (Deadline, optional): The time budget (or cancellation token) of the crawl. Default is None (no limit).
+            resume (Dict[str, Any], optional): The `Deadline.resume` marker of an earlier call, to scrape only the pages it did not reach.
         
         Returns:
-            tuple: A tuple containing two lists:
-            - A list of book titles.
-            - A list of corresponding book URLs.
+            dict: A dictionary where keys are book titles and values are their URLs.
+            With `output`, the number of books written instead (titles are in sorted order in the file).
         
         Raises:
+            ValueError: If `resume` is not a marker.
             Exception: If there is an error fetching the page.
 
         Example:
         ```python
         scraper = BookScraping()
-        books, urls = scraper.scrape_all_books()
+        books = scraper.scrape_all_books()
         print(books)
-        print(urls)
+        scraper.scrape_all_books(output="books.json")
         """
-        url = BookScraping.base_url
-        book_list: dict[str, str] = dict()
-        page_count = 0
-
-        # Scraping a page
-        while url:
-            page_count += 1
+        start = Deadline.start(resume)
 
-            try:
-                response = self.session.get(url=url, timeout=self.timeout, headers=self.header)
-            except requests.exceptions.RequestException as e:
-                raise Exception(Fore.RED + f"Error fetching {url}: {e}")
-            
-            print(Fore.CYAN + f"Scraping page {page_count}...")
-            soup = BeautifulSoup(response.text, "html.parser")
+        if output is not None:
+            from Class_Spill import SpillStore
 
-            books = soup.select("article.product_pod")
+            with SpillStore(depth=1, leaf='value', memory_limit=memory_limit) as store:
+                for page, _, book_page in self._iter_book_pages(self.base_url, keep=False, start=start, deadline=deadline):
+                    print(Fore.CYAN + f"Scraping page {page}...")
 
-            # Scraping book title and URL
-            for book in books:
-                title = book.h3.select_one("a")["title"]
-                href = book.h3.select_one("a")["href"]
-                url = (BookScraping.base_url + "catalogue/" + href[9:])
+                    for title, url in book_page["books"].items():
+                        store.add((title,), url)        # A title seen twice keeps its last URL, as with the dictionary
+                    if self.covers is not None:
+                        self.covers.queue(book_page["covers"])
 
-                book_list[title] = url
+                written = store.write_json(output)
 
-            # Looking for next button in the same genre (Pagination)
-            next_button = soup.find("li", class_="next")
+            if deadline is not None and deadline.resume is not None:
+                print(Fore.YELLOW + f"Deadline expired: books before page {deadline.resume['page']} written to {output}")
+            else:
+                print(Fore.GREEN + f"Successfully scraped all books to {output}")
+            return written
 
-            if next_button:
-                next_href = next_button.find("a")["href"]
+        book_list: dict[str, str] = dict()
 
-                if page_count == 1:
-                    url = url + next_href
-                else:
-                    url = BookScraping.base_url + "catalogue/" + next_href
+        # Scraping a page
+        for page, _, book_page in self._iter_book_pages(self.base_url, start=start, deadline=deadline):
+            print(Fore.CYAN + f"Scraping page {page}...")
+            book_list.update(book_page["books"])
+            if self.covers is not None:
+                self.covers.queue(book_page["covers"])      # Downloaded in the background, between the requests of the crawl
+
+        if deadline is not None and deadline.resume is not None:
+            print(Fore.YELLOW + f"Deadline expired: stopped before page {deadline.resume['page']}")
+        return book_list
 
-                time.sleep(random.uniform(self.delay[0], self.delay[1]))
-            else:
-                break
-        
-        return book_list
\ No newline at end of file
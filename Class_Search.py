@@ -0,0 +1,359 @@
+from Class_Scraping import Author, QuoteScraping, CommonMethods, Fore
+from dataclasses import dataclass
+from typing import Dict, List, Any, Iterable, Literal, Optional, Tuple, Union
+import heapq
+import math
+import os
+import re
+import threading
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """
+    A quote or an author found by `SearchIndex.search`.
+
+    Attributes:
+    ---------------------------
+        score: float
+            The BM25 score of the document for the query (higher is more relevant).
+        kind: str
+            'quote' or 'author'.
+        name: str
+            The text of the quote, or the name of the author.
+        author: str
+            The author of the quote, or the name of the author.
+        tags: Tuple[str, ...]
+            The tags of the quote (empty for authors).
+    """
+    score: float
+    kind: str
+    name: str
+    author: str
+    tags: Tuple[str, ...] = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the hit as a dictionary with its score, kind, name, author and list of tags."""
+        return {"score": round(self.score, 4), "kind": self.kind, "name": self.name, "author": self.author, "tags": list(self.tags)}
+
+
+class SearchIndex:
+    """
+    A full-text search index over quotes (text, author and tags) and author bios, ranked with BM25.
+
+    The index is an inverted index: every term maps to the documents containing it and the (field-weighted) number of times it appears.
+    Documents are added incrementally from the result structures of `QuoteScraping` (author -> tag -> quotes, and the name -> `Author`
+    output of `scrape_all_authors`), so it can be fed page by page or author by author as results come in.
+    A quote listed under several tags is one document with all its tags. A search only reads the postings of the terms of the query,
+    so it takes milliseconds whatever the number of documents.
+
+    Class Attributes:
+    ----------------------
+        field_weights: Dict[str, float]
+            How many times a term counts when it appears in each field. Tags and names are short, so they count more.
+        token_pattern: re.Pattern
+            Pattern of the terms of a text (words, with inner apostrophes kept).
+        version: int
+            The version of the file format of `save`.
+
+    Instance Attributes:
+    ------------------------
+        k1: float
+            BM25 term frequency saturation. Higher values let repeated terms count more.
+        b: float
+            BM25 length normalization, from 0 (none) to 1 (full).
+        documents: List[Optional[Dict[str, Any]]]
+            The documents, by id (None for a document replaced by a newer version). Authors keep their location and bio.
+        postings: Dict[str, Dict[int, float]]
+            Term -> document id -> weighted term frequency.
+
+    Methods:
+    ----------------------------
+    - `add_quote`: Adds a quote, merging its tags with the quote if it was added before.
+    - `add_quotes`: Adds the output of `scrape_all_quotes` or `scrape_authors_quotes` (author -> tag -> quotes).
+    - `add_authors`: Adds the output of `scrape_all_authors` (name -> `Author`, or the dictionaries of `author_details.json`).
+    - `from_scraper`: Builds an index of all quotes and authors of the quotes website.
+    - `search`: The documents matching a query, best first.
+    - `save`: Writes the index to a file.
+    - `load`: Reads an index written with `save`.
+
+    Example:
+    ----------------------------
+    ```python
+    scraper = QuoteScraping()
+    index = SearchIndex()
+    index.add_quotes(scraper.scrape_all_quotes())
+    index.add_authors(scraper.scrape_all_authors())
+    index.save("search.json")
+
+    for hit in SearchIndex.load("search.json").search("imagination knowledge", limit=5):
+        print(f"{hit.score:.2f} {hit.name} ({hit.author})")
+    ```
+    """
+    field_weights = {"text": 1.0, "author": 2.0, "tags": 2.0, "name": 3.0, "location": 1.0, "bio": 1.0}
+    token_pattern = re.compile(r"[^\W_]+(?:['’][^\W_]+)*")
+    version = 1
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        """
+        Initializes an empty index.
+
+        Parameters:
+            k1 (float): BM25 term frequency saturation. Default is 1.2.
+            b (float): BM25 length normalization, between 0 and 1. Default is 0.75.
+
+        Raises:
+            ValueError: If `k1` is negative or `b` is not between 0 and 1.
+        """
+        if k1 < 0:
+            raise ValueError(Fore.RED + "k1 must not be negative")
+        if not 0 <= b <= 1:
+            raise ValueError(Fore.RED + "b must be between 0 and 1")
+
+        self.k1 = k1
+        self.b = b
+        self.documents: List[Optional[Dict[str, Any]]] = []
+        self.postings: Dict[str, Dict[int, float]] = dict()
+        self.lock = threading.RLock()
+
+        self.keys: Dict[Tuple[str, str, str], int] = dict()       # (kind, author, name) -> id of the current document
+        self.total_length = 0.0     # Sum of the weighted lengths of the current documents
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        """
+        Splits a text into lowercase terms.
+
+        Parameters:
+            text (str): The text.
+
+        Returns:
+            List[str]: The terms, in order.
+        """
+        return [term.replace("’", "'") for term in SearchIndex.token_pattern.findall(text.lower())]
+
+    @staticmethod
+    def _fields(document: Dict[str, Any]) -> Dict[str, str]:
+        """The indexed fields of a document and their text."""
+        if document["kind"] == "quote":
+            return {"text": document["name"], "author": document["author"], "tags": " ".join(document["tags"])}
+        return {"name": document["name"], "location": document["location"], "bio": document["bio"]}
+
+    def _add(self, document: Dict[str, Any]) -> None:
+        """Indexes a document, replacing the previous version of the same quote or author."""
+        key = (document["kind"], document["author"], document["name"])
+        frequencies: Dict[str, float] = dict()
+
+        for field, text in SearchIndex._fields(document).items():
+            weight = SearchIndex.field_weights[field]
+            for term in SearchIndex.tokenize(text):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+
+        length = sum(frequencies.values())
+
+        with self.lock:
+            self._remove(key)
+
+            doc_id = len(self.documents)
+            self.documents.append({**document, "length": length})
+            self.keys[key] = doc_id
+            self.total_length += length
+
+            for term, frequency in frequencies.items():
+                self.postings.setdefault(term, dict())[doc_id] = frequency
+
+    def _remove(self, key: Tuple[str, str, str]) -> None:
+        """Removes the current document of a key from the postings, if there is one."""
+        doc_id = self.keys.pop(key, None)
+        if doc_id is None:
+            return
+
+        document = self.documents[doc_id]
+        self.documents[doc_id] = None
+        self.total_length -= document["length"]
+
+        for term in set(SearchIndex.tokenize(" ".join(SearchIndex._fields(document).values()))):
+            postings = self.postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self.postings[term]
+
+    def add_quote(self, text: str, author: str, tags: Iterable[str] = ()) -> None:
+        """
+        Adds a quote. If the same quote by the same author was added before, its tags are merged and it is indexed again.
+
+        Parameters:
+            text (str): The text of the quote.
+            author (str): The author of the quote.
+            tags (Iterable[str]): The tags of the quote. Default is no tags.
+        """
+        with self.lock:
+            doc_id = self.keys.get(("quote", author, text))
+            known = self.documents[doc_id]["tags"] if doc_id is not None else []
+            new = [tag for tag in tags if tag not in known]
+
+            if doc_id is not None and not new:
+                return      # Nothing new, the quote stays as it is
+
+            self._add({"kind": "quote", "name": text, "author": author, "tags": known + list(dict.fromkeys(new))})
+
+    def add_quotes(self, quotes: Dict[str, Dict[str, List[str]]]) -> int:
+        """
+        Adds quotes in the shape returned by `scrape_all_quotes` and `scrape_authors_quotes`, or read from `quotes.json`.
+
+        Parameters:
+            quotes (dict): Author -> tag -> list of quotes.
+
+        Returns:
+            int: The number of quotes in the index afterwards.
+
+        Example:
+        ```python
+        index.add_quotes(scraper.scrape_authors_quotes(["Albert Einstein", "Jane Austen"]))
+        ```
+        """
+        for author, tags in quotes.items():
+            for tag, texts in tags.items():
+                for text in texts:
+                    self.add_quote(text, author, [tag])
+
+        with self.lock:
+            return sum(1 for kind, _, _ in self.keys if kind == "quote")
+
+    def add_authors(self, authors: Dict[str, Union[Author, Dict[str, str]]]) -> int:
+        """
+        Adds authors in the shape returned by `scrape_all_authors`, or read from `author_details.json`. Authors added before are replaced.
+
+        Parameters:
+            authors (dict): Name -> `Author`, or name -> dictionary with "Born", "Location", "Bio" and "URL".
+
+        Returns:
+            int: The number of authors in the index afterwards.
+        """
+        for name, author in authors.items():
+            if isinstance(author, Author):
+                author = author.to_dict()
+
+            self._add({"kind": "author", "name": name, "author": name, "tags": [], "location": author.get("Location", ""), "bio": author.get("Bio", "")})
+
+        with self.lock:
+            return sum(1 for kind, _, _ in self.keys if kind == "author")
+
+    @classmethod
+    def from_scraper(cls, scraper: QuoteScraping, authors: bool = True, **options: float) -> "SearchIndex":
+        """
+        Builds an index of all quotes (and authors) of the quotes website.
+
+        Parameters:
+            scraper (QuoteScraping): The scraper used to scrape the quotes and the authors.
+            authors (bool): If True, the bios of all authors are scraped and indexed too. Default is True.
+            **options (float): `k1` and `b` of the index.
+
+        Returns:
+            SearchIndex: The index.
+
+        Raises:
+            Exception: If there is an error fetching a page.
+        """
+        index = cls(**options)
+        index.add_quotes(scraper.scrape_all_quotes())
+        if authors:
+            index.add_authors(scraper.scrape_all_authors())
+        return index
+
+    def search(self, query: str, limit: int = 10, kind: Optional[Literal['quote', 'author']] = None) -> List[SearchHit]:
+        """
+        Finds the documents matching any term of a query, ranked with BM25.
+
+        Parameters:
+            query (str): The words to search for.
+            limit (int): Maximum number of hits. Default is 10.
+            kind (Literal['quote', 'author'], optional): Only return quotes or only authors. Default is both.
+
+        Returns:
+            List[SearchHit]: The hits, best first. Equal scores are in the order the documents were added.
+
+        Raises:
+            ValueError: If `kind` is not 'quote', 'author' or None.
+        """
+        if kind not in [None, 'quote', 'author']:
+            raise ValueError(Fore.RED + "kind must be 'quote', 'author' or None")
+
+        with self.lock:
+            count = len(self.keys)
+            if count == 0:
+                return []
+
+            average = self.total_length / count or 1.0
+            scores: Dict[int, float] = dict()
+
+            for term in dict.fromkeys(SearchIndex.tokenize(query)):
+                postings = self.postings.get(term)
+                if not postings:
+                    continue
+
+                idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+
+                for doc_id, frequency in postings.items():
+                    length = self.documents[doc_id]["length"]
+                    norm = self.k1 * (1 - self.b + self.b * length / average)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+            if kind is not None:
+                scores = {doc_id: score for doc_id, score in scores.items() if self.documents[doc_id]["kind"] == kind}
+
+            best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+            documents = [(self.documents[doc_id], score) for doc_id, score in best]
+
+        return [SearchHit(score, document["kind"], document["name"], document["author"], tuple(document["tags"])) for document, score in documents]
+
+    def save(self, filename: str) -> None:
+        """
+        Writes the index to a JSON file, postings included, so loading it does not tokenize anything. The file is replaced atomically.
+        Replaced documents are dropped and the remaining ones numbered again.
+
+        Parameters:
+            filename (str): The name of the file.
+        """
+        with self.lock:
+            ids = {doc_id: number for number, doc_id in enumerate(sorted(self.keys.values()))}
+            documents = [self.documents[doc_id] for doc_id in sorted(ids)]
+            postings = {term: [[ids[doc_id], frequency] for doc_id, frequency in entries.items()] for term, entries in self.postings.items()}
+            payload = {"version": SearchIndex.version, "k1": self.k1, "b": self.b, "documents": documents, "postings": postings}
+            CommonMethods._atomic_write(filename, CommonMethods.dumps_json(payload, compact=True))
+
+    @classmethod
+    def load(cls, filename: str) -> "SearchIndex":
+        """
+        Reads an index written with `save`. More documents can be added to it afterwards.
+
+        Parameters:
+            filename (str): The name of the file.
+
+        Returns:
+            SearchIndex: The index.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If the file is not a search index of a supported version.
+        """
+        if not os.path.exists(filename):
+            raise FileNotFoundError(Fore.RED + f"Search index {filename} not found")
+
+        data = CommonMethods.read_from_json(filename)
+        if not isinstance(data, dict) or data.get("version") != SearchIndex.version:
+            raise ValueError(Fore.RED + f"{filename} is not a search index of version {SearchIndex.version}")
+
+        index = cls(data["k1"], data["b"])
+        index.documents = data["documents"]
+        index.postings = {term: {doc_id: frequency for doc_id, frequency in entries} for term, entries in data["postings"].items()}
+
+        for doc_id, document in enumerate(index.documents):
+            index.keys[(document["kind"], document["author"], document["name"])] = doc_id
+            index.total_length += document["length"]
+
+        return index
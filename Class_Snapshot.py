@@ -0,0 +1,427 @@
+from Class_Scraping import Author, Book, CommonMethods, Fore
+from typing import Dict, List, Any, Tuple, Optional, Union
+from collections import defaultdict
+import bisect
+import mmap
+import struct
+
+
+class Snapshot:
+    """
+    A read-only, memory-mapped snapshot of scraped quotes, authors and books.
+
+    The file holds a string table, fixed-size records and sorted lookup indexes, all addressed by offsets.
+    Opening a snapshot only reads the header, so start-up takes the same time whatever the size of the dataset;
+    every lookup then reads just the index entries and strings it needs from the mapped file.
+
+    File layout:
+    ----------------------
+        - Header: magic, version and number of sections.
+        - Section directory: name, offset and length of every section.
+        - `strings.offsets` / `strings.data`: UTF-8 strings, string `i` spans `offsets[i]:offsets[i + 1]`.
+        - `quotes`, `quote.tags`, `authors`, `books`: records made of string ids (and integers for prices and ratings).
+        - `index.*`: entries (key string id, postings start, postings count) sorted by key, followed by the record ids.
+
+    Class Attributes:
+    ----------------------
+        magic: bytes
+            The first bytes of every snapshot file.
+        version: int
+            The version of the file format.
+        record_formats: Dict[str, struct.Struct]
+            The layout of a record of each section.
+
+    Instance Attributes:
+    ------------------------
+        filename: str
+            The snapshot file.
+        sections: Dict[str, Tuple[int, int]]
+            Offset and length of every section of the file.
+
+    Methods:
+    ----------------------------
+    - `write`: Writes the output of `scrape_all_quotes`, `scrape_all_authors` and/or `scrape_all_books` to a snapshot.
+    - `from_json`: Converts JSON files written with `write_to_json` to a snapshot.
+    - `author`: Details of an author.
+    - `author_quotes`: Quotes of an author, grouped by tag.
+    - `tag_quotes`: Quotes with a tag.
+    - `book`: A book by title.
+    - `book_by_upc`: A book by UPC.
+    - `close`: Unmaps the file.
+
+    Example:
+    ----------------------------
+    ```python
+    scraper = QuoteScraping()
+    Snapshot.write("quotes.snap", quotes=scraper.scrape_all_quotes(), authors=scraper.scrape_all_authors())
+
+    with Snapshot("quotes.snap") as snapshot:
+        print(snapshot.author("Albert Einstein"))
+        print(snapshot.tag_quotes("love"))
+    ```
+    """
+    magic = b"QBSNAP\x00\x00"
+    version = 1
+    header_format = struct.Struct("<8sII")
+    directory_format = struct.Struct("<24sQQ")
+    index_format = struct.Struct("<III")
+    record_formats = {
+        "quotes": struct.Struct("<IIII"),        # text, author, tags start, tags count
+        "authors": struct.Struct("<IIIII"),      # name, born, location, bio, URL
+        "books": struct.Struct("<IIIiiII"),      # title, genre, UPC, price in pence (-1 if unknown), rating, availability, URL
+    }
+
+    def __init__(self, filename: str) -> None:
+        """
+        Opens and memory-maps a snapshot. Only the header and section directory are read.
+
+        Parameters:
+            filename (str): The snapshot file.
+
+        Raises:
+            ValueError: If the file is empty, truncated, not a snapshot, or has an unsupported version.
+        """
+        self.filename = filename
+        self._file = open(filename, "rb")
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:      # Raised by mmap for an empty file
+            self._file.close()
+            raise ValueError(Fore.RED + f"{filename} is empty, not a snapshot file")
+        except BaseException:
+            self._file.close()
+            raise
+
+        try:
+            self._view = memoryview(self._map)
+            self._read_directory()
+        except struct.error:        # The header or the section directory runs past the end of the file
+            self.close()
+            raise ValueError(Fore.RED + f"{filename} is truncated, not a complete snapshot file")
+        except BaseException:
+            self.close()
+            raise
+
+        self._string_offsets = self._section("strings.offsets")
+        self._string_data = self._section("strings.data")
+
+    def _read_directory(self) -> None:
+        """
+        Reads the header and the section directory into `sections`.
+
+        Raises:
+            ValueError: If the file is not a snapshot, has an unsupported version, or a section runs past the end of the file.
+            struct.error: If the header or the directory is cut off.
+        """
+        magic, version, count = Snapshot.header_format.unpack_from(self._view, 0)
+
+        if magic != Snapshot.magic:
+            raise ValueError(Fore.RED + f"{self.filename} is not a snapshot file")
+        if version != Snapshot.version:
+            raise ValueError(Fore.RED + f"Unsupported snapshot version {version} in {self.filename}")
+
+        self.sections: Dict[str, Tuple[int, int]] = dict()
+        position = Snapshot.header_format.size
+
+        for _ in range(count):
+            name, offset, length = Snapshot.directory_format.unpack_from(self._view, position)
+            if offset + length > len(self._view):
+                raise ValueError(Fore.RED + f"{self.filename} is truncated, not a complete snapshot file")
+
+            self.sections[name.rstrip(b"\x00").decode()] = (offset, length)
+            position += Snapshot.directory_format.size
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Releases the memory map and the file."""
+        for name in ("_string_offsets", "_string_data", "_view"):
+            view = getattr(self, name, None)
+            if view is not None:
+                view.release()
+                setattr(self, name, None)
+
+        self._map.close()
+        self._file.close()
+
+    @staticmethod
+    def write(filename: str, quotes: Optional[Dict[str, Dict[str, List[str]]]] = None,
+              authors: Optional[Dict[str, Union[Author, Dict[str, str]]]] = None,
+              books: Optional[Dict[str, Union[Book, Dict[str, Any], str]]] = None) -> None:
+        """
+        Writes scraped data to a snapshot file. The file is replaced atomically.
+
+        Parameters:
+            filename (str): The snapshot file.
+            quotes (dict, optional): Output of `scrape_all_quotes` (author -> tag -> list of quotes).
+            authors (dict, optional): Output of `scrape_all_authors` (name -> `Author`, or the dictionaries of `author_details.json`).
+            books (dict, optional): Output of `scrape_all_books` (title -> URL), or title -> `Book` / `Book.to_dict()` for full details.
+
+        Example:
+        ```python
+        Snapshot.write("books.snap", books=BookScraping().scrape_all_books())
+        ```
+        """
+        strings: Dict[str, int] = dict()        # String -> id, so repeated authors, tags and genres are stored once
+
+        def string_id(text: str) -> int:
+            if text not in strings:
+                strings[text] = len(strings)
+            return strings[text]
+
+        sections: Dict[str, bytes] = dict()
+        indexes: Dict[str, Dict[int, List[int]]] = dict()
+
+        # Quotes: a quote listed under several tags becomes one record with all its tags
+        quote_tags: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for author, tags in (quotes or {}).items():
+            for tag, texts in tags.items():
+                for text in texts:
+                    quote_tags[(author, text)].append(tag)
+
+        quote_records, tag_ids = bytearray(), []
+        by_author, by_tag = defaultdict(list), defaultdict(list)
+
+        for number, ((author, text), tags) in enumerate(quote_tags.items()):
+            quote_records += Snapshot.record_formats["quotes"].pack(string_id(text), string_id(author), len(tag_ids), len(tags))
+            tag_ids.extend(string_id(tag) for tag in tags)
+            by_author[string_id(author)].append(number)
+            for tag in tags:
+                by_tag[string_id(tag)].append(number)
+
+        sections["quotes"] = bytes(quote_records)
+        sections["quote.tags"] = struct.pack(f"<{len(tag_ids)}I", *tag_ids)
+        indexes["index.quote.author"] = by_author
+        indexes["index.quote.tag"] = by_tag
+
+        # Authors
+        author_records, by_name = bytearray(), defaultdict(list)
+
+        for number, (name, author) in enumerate((authors or {}).items()):
+            if isinstance(author, Author):
+                author = author.to_dict()
+            author_records += Snapshot.record_formats["authors"].pack(
+                string_id(name), string_id(author.get("Born", "")), string_id(author.get("Location", "")),
+                string_id(author.get("Bio", "")), string_id(author.get("URL", "")))
+            by_name[string_id(name)].append(number)
+
+        sections["authors"] = bytes(author_records)
+        indexes["index.author.name"] = by_name
+
+        # Books: `scrape_all_books` only gives URLs, so details are optional
+        book_records, by_title, by_upc = bytearray(), defaultdict(list), defaultdict(list)
+
+        for number, (title, book) in enumerate((books or {}).items()):
+            if isinstance(book, str):
+                book = Book(title, "", "", -1, 0, "", book)
+            elif isinstance(book, dict):
+                price = book.get("Price", "")
+                book = Book(title, book.get("Genre", ""), book.get("UPC", ""), Book.parse_price(price) if price else -1,
+                            book.get("Rating", 0), book.get("Availability", ""), book.get("URL", ""))
+
+            book_records += Snapshot.record_formats["books"].pack(
+                string_id(title), string_id(book.genre), string_id(book.upc), book.price, book.rating,
+                string_id(book.availability), string_id(book.url))
+            by_title[string_id(title)].append(number)
+            if book.upc:
+                by_upc[string_id(book.upc)].append(number)
+
+        sections["books"] = bytes(book_records)
+        indexes["index.book.title"] = by_title
+        indexes["index.book.upc"] = by_upc
+
+        # String table
+        encoded = [text.encode("utf-8") for text in strings]
+        offsets = [0]
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+
+        sections["strings.offsets"] = struct.pack(f"<{len(offsets)}I", *offsets)
+        sections["strings.data"] = b"".join(encoded)
+
+        # Indexes are sorted by the UTF-8 bytes of their keys, so the reader can binary search them
+        for name, index in indexes.items():
+            keys = sorted(index, key=lambda key: encoded[key])
+            entries, postings = bytearray(), []
+
+            for key in keys:
+                entries += Snapshot.index_format.pack(key, len(postings), len(index[key]))
+                postings.extend(index[key])
+
+            sections[name] = struct.pack("<I", len(keys)) + bytes(entries) + struct.pack(f"<{len(postings)}I", *postings)
+
+        # Header, section directory, then the sections aligned to 8 bytes
+        position = Snapshot.header_format.size + Snapshot.directory_format.size * len(sections)
+        directory, body = bytearray(), bytearray()
+
+        for name, data in sections.items():
+            padding = -(position + len(body)) % 8
+            body += b"\x00" * padding
+            directory += Snapshot.directory_format.pack(name.encode(), position + len(body), len(data))
+            body += data
+
+        header = Snapshot.header_format.pack(Snapshot.magic, Snapshot.version, len(sections))
+        CommonMethods._atomic_write(filename, header + bytes(directory) + bytes(body))
+
+    @staticmethod
+    def from_json(filename: str, quotes_file: Optional[str] = None, authors_file: Optional[str] = None,
+                  books_file: Optional[str] = None) -> None:
+        """
+        Converts JSON files written with `write_to_json` (for example `quotes.json` and `author_details.json`) to a snapshot.
+
+        Parameters:
+            filename (str): The snapshot file.
+            quotes_file (str, optional): JSON file with the output of `scrape_all_quotes`.
+            authors_file (str, optional): JSON file with the output of `scrape_all_authors`.
+            books_file (str, optional): JSON file with the output of `scrape_all_books`.
+        """
+        Snapshot.write(filename,
+                       quotes=CommonMethods.read_from_json(quotes_file) if quotes_file else None,
+                       authors=CommonMethods.read_from_json(authors_file) if authors_file else None,
+                       books=CommonMethods.read_from_json(books_file) if books_file else None)
+
+    def _section(self, name: str) -> memoryview:
+        """Returns a view of a section of the file (empty if the section is missing)."""
+        offset, length = self.sections.get(name, (0, 0))
+        return self._view[offset:offset + length]
+
+    def _string(self, string_id: int) -> str:
+        """Reads a string from the string table."""
+        start, end = struct.unpack_from("<II", self._string_offsets, string_id * 4)
+        return str(self._string_data[start:end], "utf-8")
+
+    def _record(self, section: str, number: int) -> Tuple[int, ...]:
+        """Reads a record of a section."""
+        record_format = Snapshot.record_formats[section]
+        return record_format.unpack_from(self._section(section), number * record_format.size)
+
+    def _lookup(self, index: str, key: str) -> List[int]:
+        """Binary searches an index and returns the record numbers stored for a key."""
+        view = self._section(index)
+        if not view:
+            return []
+
+        count = struct.unpack_from("<I", view, 0)[0]
+        entry_size = Snapshot.index_format.size
+        wanted = key.encode("utf-8")
+
+        def key_at(position: int) -> bytes:
+            start, end = struct.unpack_from("<II", self._string_offsets, Snapshot.index_format.unpack_from(view, 4 + position * entry_size)[0] * 4)
+            return bytes(self._string_data[start:end])
+
+        # bisect over a lazy sequence, so only O(log n) keys are read
+        position = bisect.bisect_left(_LazyKeys(key_at, count), wanted)
+
+        if position == count or key_at(position) != wanted:
+            return []
+
+        _, start, length = Snapshot.index_format.unpack_from(view, 4 + position * entry_size)
+        postings = 4 + count * entry_size + start * 4
+        return list(struct.unpack_from(f"<{length}I", view, postings))
+
+    def author(self, name: str) -> Optional[Author]:
+        """
+        Details of an author.
+
+        Parameters:
+            name (str): The name of the author, as scraped.
+
+        Returns:
+            Author: The author, or None if the author is not in the snapshot.
+        """
+        numbers = self._lookup("index.author.name", name)
+        if not numbers:
+            return None
+
+        name_id, born, location, bio, url = self._record("authors", numbers[0])
+        return Author(self._string(name_id), self._string(born), self._string(location), self._string(bio), self._string(url))
+
+    def author_quotes(self, name: str) -> Dict[str, List[str]]:
+        """
+        Quotes of an author, in the shape of `scrape_author_quotes`.
+
+        Parameters:
+            name (str): The name of the author, as scraped.
+
+        Returns:
+            dict: Tags as keys and lists of quotes as values (empty if the author has no quotes in the snapshot).
+        """
+        quotes = defaultdict(list)
+        tags_view = self._section("quote.tags")
+
+        for number in self._lookup("index.quote.author", name):
+            text, _, tags_start, tags_count = self._record("quotes", number)
+            text = self._string(text)
+
+            for tag in struct.unpack_from(f"<{tags_count}I", tags_view, tags_start * 4):
+                quotes[self._string(tag)].append(text)
+
+        return dict(quotes)
+
+    def tag_quotes(self, tag: str) -> Dict[str, str]:
+        """
+        Quotes with a tag, in the shape of one tag of `scrape_tag_quotes`.
+
+        Parameters:
+            tag (str): The tag.
+
+        Returns:
+            dict: Quotes as keys and their authors as values.
+        """
+        quotes = dict()
+
+        for number in self._lookup("index.quote.tag", tag):
+            text, author, _, _ = self._record("quotes", number)
+            quotes[self._string(text)] = self._string(author)
+
+        return quotes
+
+    def _book(self, number: int) -> Book:
+        """Reads a book record."""
+        title, genre, upc, price, rating, availability, url = self._record("books", number)
+        return Book(self._string(title), self._string(genre), self._string(upc), price, rating, self._string(availability), self._string(url))
+
+    def book(self, title: str) -> Optional[Book]:
+        """
+        A book by title. Books written from `scrape_all_books` only have a title and URL (price -1, other fields empty).
+
+        Parameters:
+            title (str): The title of the book.
+
+        Returns:
+            Book: The book, or None if the title is not in the snapshot.
+        """
+        numbers = self._lookup("index.book.title", title)
+        return self._book(numbers[0]) if numbers else None
+
+    def book_by_upc(self, upc: str) -> Optional[Book]:
+        """
+        A book by Universal Product Code.
+
+        Parameters:
+            upc (str): The UPC of the book.
+
+        Returns:
+            Book: The book, or None if the UPC is not in the snapshot.
+        """
+        numbers = self._lookup("index.book.upc", upc)
+        return self._book(numbers[0]) if numbers else None
+
+
+class _LazyKeys:
+    """A sequence reading index keys on access, so `bisect` can search an index without loading it."""
+
+    def __init__(self, key_at, count: int) -> None:
+        self.key_at = key_at
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, position: int) -> bytes:
+        return self.key_at(position)
@@ -0,0 +1,292 @@
+from Class_Scraping import CommonMethods, Fore
+from typing import Any, BinaryIO, Iterator, List, Literal, Optional, Tuple
+import heapq
+import itertools
+import os
+import tempfile
+
+
+class SpillStore:
+    """
+    Collects nested results (for example author -> tag -> quotes) in bounded memory.
+
+    Entries are buffered until their estimated size reaches `memory_limit`, then the buffer is sorted by key and written to a run file
+    in a temporary directory. Reading the store merges the sorted runs and the buffer (an external merge sort), so the nested output
+    is produced while only one entry per run is in memory. Keys come out in sorted order; values of equal keys keep the order they were added in.
+
+    Class Attributes:
+    ----------------------
+        entry_overhead: int
+            Estimated memory of a buffered entry in bytes, on top of its keys and serialized value.
+        max_runs: int
+            Maximum number of run files. When it is reached, the runs are merged into one, which bounds the open files of a merge.
+
+    Instance Attributes:
+    ------------------------
+        depth: int
+            Number of keys of every entry (2 for author -> tag -> quotes, 1 for title -> URL).
+        leaf: Literal['list', 'value']
+            'list' collects the values of equal keys in a list, 'value' keeps the last value of each key.
+        memory_limit: int
+            Estimated size of the buffer in bytes above which it is spilled to disk.
+        count: int
+            Number of entries added.
+        runs: List[str]
+            The run files written so far.
+        spilled: int
+            Number of times the buffer was spilled to disk.
+
+    Methods:
+    ----------------------------
+    - `add`: Adds a value under a path of keys.
+    - `items`: Iterates over the top-level keys and their nested values, in key order.
+    - `to_dict`: The whole nested result in memory.
+    - `write_json`: Streams the nested result to a JSON file.
+    - `close`: Removes the run files.
+
+    Example:
+    ----------------------------
+    ```python
+    with SpillStore(depth=2, memory_limit=16 * 2**20) as store:
+        store.add(("Albert Einstein", "life"), "“Life is like riding a bicycle.”")
+        store.write_json("quotes.json")
+    ```
+    """
+    entry_overhead = 160
+    max_runs = 64
+
+    def __init__(self, depth: int, leaf: Literal['list', 'value'] = 'list', memory_limit: int = 64 * 2**20, directory: Optional[str] = None) -> None:
+        """
+        Initializes an empty store.
+
+        Parameters:
+            depth (int): Number of keys of every entry.
+            leaf (Literal['list', 'value']): 'list' to collect the values of equal keys, 'value' to keep the last one. Default is 'list'.
+            memory_limit (int): Estimated size of the buffer in bytes above which it is spilled to disk. Default is 64 MiB.
+            directory (str, optional): Directory of the temporary run files. Default is the system temporary directory.
+
+        Raises:
+            ValueError: If `depth` or `memory_limit` is not a positive integer, or `leaf` is not 'list' or 'value'.
+        """
+        if not isinstance(depth, int) or depth < 1:
+            raise ValueError(Fore.RED + "depth must be a positive integer")
+        if leaf not in ['list', 'value']:
+            raise ValueError(Fore.RED + "leaf must be 'list' or 'value'")
+        if not isinstance(memory_limit, int) or memory_limit < 1:
+            raise ValueError(Fore.RED + "memory_limit must be a positive integer")
+
+        self.depth = depth
+        self.leaf = leaf
+        self.memory_limit = memory_limit
+        self.directory = directory
+        self.count = 0
+        self.runs: List[str] = []
+        self.spilled = 0
+
+        self.buffer: List[Tuple[Tuple[str, ...], bytes]] = []      # Keys and serialized value of every entry
+        self.buffered = 0       # Estimated size of the buffer in bytes
+        self.temp_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "SpillStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, keys: Tuple[str, ...], value: Any) -> None:
+        """
+        Adds a value under a path of keys. The buffer is spilled to disk if it grows above `memory_limit`.
+
+        Parameters:
+            keys (Tuple[str, ...]): The keys of the value, `depth` of them.
+            value (Any): The value. Records are converted with `to_plain`.
+
+        Raises:
+            ValueError: If the number of keys is not `depth`.
+        """
+        if len(keys) != self.depth:
+            raise ValueError(Fore.RED + f"Expected {self.depth} keys, got {len(keys)}")
+
+        keys = tuple(str(key) for key in keys)
+        payload = CommonMethods.dumps_json(CommonMethods.to_plain(value), compact=True)
+
+        self.buffer.append((keys, payload))
+        self.buffered += len(payload) + sum(len(key) for key in keys) + SpillStore.entry_overhead
+        self.count += 1
+
+        if self.buffered >= self.memory_limit:
+            self._spill()
+
+    def _spill(self) -> None:
+        """Sorts the buffer and writes it to a new run file, one entry per line (keys as a JSON array, a tab, then the value)."""
+        if not self.buffer:
+            return
+
+        if self.temp_dir is None:
+            self.temp_dir = tempfile.TemporaryDirectory(prefix="spill-", dir=self.directory)
+
+        self.buffer.sort(key=lambda entry: entry[0])        # Stable, so equal keys keep the order they were added in
+        self._write_run(iter(self.buffer))
+
+        self.buffer = []
+        self.buffered = 0
+        self.spilled += 1
+
+        # Too many runs would need too many open files to merge, so they are merged into one first
+        if len(self.runs) >= SpillStore.max_runs:
+            files = [open(run, "rb") for run in self.runs]
+            try:
+                old_runs = self.runs
+                self.runs = []
+                self._write_run(heapq.merge(*(SpillStore._read_run(file) for file in files), key=lambda entry: entry[0]))
+            finally:
+                for file in files:
+                    file.close()
+
+            for run in old_runs:
+                os.remove(run)
+
+    def _write_run(self, entries: Iterator[Tuple[Tuple[str, ...], bytes]]) -> None:
+        """Writes sorted entries to a new run file."""
+        name = os.path.join(self.temp_dir.name, f"run-{self.spilled:06d}-{len(self.runs):03d}.jsonl")
+
+        with open(name, "wb") as file:
+            for keys, payload in entries:
+                # Compact JSON escapes tabs and newlines inside strings, so they only appear as separators
+                file.write(CommonMethods.dumps_json(list(keys), compact=True) + b"\t" + payload + b"\n")
+
+        self.runs.append(name)
+
+    @staticmethod
+    def _read_run(file: BinaryIO) -> Iterator[Tuple[Tuple[str, ...], bytes]]:
+        """Reads the entries of a run file, one line at a time."""
+        for line in file:
+            keys, payload = line.rstrip(b"\n").split(b"\t", 1)
+            yield tuple(CommonMethods.loads_json(keys)), payload
+
+    def _merged(self, files: List[BinaryIO]) -> Iterator[Tuple[Tuple[str, ...], bytes]]:
+        """Merges the runs (oldest first) and the sorted buffer. Entries with equal keys come out in the order they were added."""
+        self.buffer.sort(key=lambda entry: entry[0])
+        sources = [SpillStore._read_run(file) for file in files] + [iter(self.buffer)]
+        return heapq.merge(*sources, key=lambda entry: entry[0])
+
+    def _open_runs(self) -> List[BinaryIO]:
+        return [open(run, "rb") for run in self.runs]
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterates over the top-level keys and their nested values, in key order. Only one top-level value is held in memory at a time.
+
+        Yields:
+            tuple: A top-level key and its value (nested dictionaries down to the leaves).
+        """
+        files = self._open_runs()
+
+        try:
+            for key, group in itertools.groupby(self._merged(files), key=lambda entry: entry[0][0]):
+                yield key, self._build(group, 1)
+        finally:
+            for file in files:
+                file.close()
+
+    def _build(self, entries: Iterator[Tuple[Tuple[str, ...], bytes]], level: int) -> Any:
+        """Builds the nested value of entries sharing their first `level` keys."""
+        if level == self.depth:
+            values = [CommonMethods.loads_json(payload) for _, payload in entries]
+            return values if self.leaf == 'list' else values[-1]
+
+        return {key: self._build(group, level + 1) for key, group in itertools.groupby(entries, key=lambda entry: entry[0][level])}
+
+    def to_dict(self) -> dict:
+        """
+        Returns the whole nested result as dictionaries. This needs the memory the store avoids, so it is meant for small results.
+
+        Returns:
+            dict: The nested result, in key order.
+        """
+        return dict(self.items())
+
+    def write_json(self, filename: str, compact: bool = False) -> int:
+        """
+        Streams the nested result to a JSON file, in key order, without building it in memory.
+        Like `write_to_json`, the file is written to a temporary file first and then renamed.
+
+        Parameters:
+            filename (str): The name of the JSON file.
+            compact (bool): If True, no newlines are added. Otherwise every top-level key starts a new line. Default is False.
+
+        Returns:
+            int: The number of top-level keys written.
+
+        Raises:
+            TypeError: If `filename` is not a string.
+        """
+        if not isinstance(filename, str):
+            raise TypeError(Fore.RED + "Filename must be a string")
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        fd, temp_name = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(filename)}.", suffix=".tmp")
+        newline = b"" if compact else b"\n"
+        written = 0
+        files = self._open_runs()
+
+        try:
+            with os.fdopen(fd, mode="wb") as out:
+                out.write(b"{" + newline)
+
+                for key, group in itertools.groupby(self._merged(files), key=lambda entry: entry[0][0]):
+                    if written:
+                        out.write(b"," + newline)
+                    out.write(CommonMethods.dumps_json(key, compact=True) + b":")
+                    self._write_level(out, group, 1)
+                    written += 1
+
+                out.write(newline + b"}" + newline)
+                out.flush()
+                os.fsync(out.fileno())
+
+            CommonMethods._copy_mode(temp_name, filename)
+            os.replace(temp_name, filename)
+        except BaseException:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+        finally:
+            for file in files:
+                file.close()
+
+        return written
+
+    def _write_level(self, out: BinaryIO, entries: Iterator[Tuple[Tuple[str, ...], bytes]], level: int) -> None:
+        """Writes the nested value of entries sharing their first `level` keys. Serialized values are copied as they are."""
+        if level == self.depth:
+            if self.leaf == 'value':
+                *_, (_, payload) = entries
+                out.write(payload)
+                return
+
+            out.write(b"[")
+            for i, (_, payload) in enumerate(entries):
+                out.write(b"," + payload if i else payload)
+            out.write(b"]")
+            return
+
+        out.write(b"{")
+        for i, (key, group) in enumerate(itertools.groupby(entries, key=lambda entry: entry[0][level])):
+            out.write((b"," if i else b"") + CommonMethods.dumps_json(key, compact=True) + b":")
+            self._write_level(out, group, level + 1)
+        out.write(b"}")
+
+    def close(self) -> None:
+        """Removes the run files and empties the store."""
+        if self.temp_dir is not None:
+            self.temp_dir.cleanup()
+            self.temp_dir = None
+
+        self.runs = []
+        self.buffer = []
+        self.buffered = 0
+        self.count = 0
@@ -0,0 +1,367 @@
+from Class_Archive import PageArchive
+from Class_Covers import CoverDownloader
+from Class_Scraping import QuoteScraping, BookScraping, CommonMethods, Transport, Fore
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from typing import Dict, List, Any, Tuple, Optional, TextIO
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+
+# Operations of a job file, with their required fields
+OPERATIONS = {
+    "author_quotes": ["author"],
+    "author_info": ["author"],
+    "tag_quotes": ["tag"],
+    "genre_books": ["genre"],
+    "book_info": ["book"],
+    "all_quotes": [],
+    "all_books": [],
+}
+QUOTE_OPERATIONS = {"author_quotes", "author_info", "tag_quotes", "all_quotes"}
+ANSI_PATTERN = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def read_jobs(filename: str) -> List[Dict[str, Any]]:
+    """
+    Reads a job file with one JSON object per line, for example:
+
+    ```
+    {"id": "einstein", "op": "author_quotes", "author": "Albert Einstein"}
+    {"id": "poetry", "op": "genre_books", "genre": "Poetry"}
+    {"id": "attic", "op": "book_info", "book": "A Light in the Attic", "genre": "Poetry"}
+    ```
+
+    Parameters:
+        filename (str): The job file ('-' for standard input).
+
+    Returns:
+        List[Dict[str, Any]]: The jobs. Jobs without an id are numbered by line.
+
+    Raises:
+        ValueError: If a line is not valid JSON, or a job has an unknown operation or misses a field.
+    """
+    jobs = []
+    file = sys.stdin if filename == "-" else open(filename, encoding="utf-8")
+
+    with file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(Fore.RED + f"Line {number} of {filename} is not valid JSON: {e}")
+
+            operation = job.get("op")
+            if operation not in OPERATIONS:
+                raise ValueError(Fore.RED + f"Line {number}: unknown operation '{operation}'. Choose from {', '.join(OPERATIONS)}")
+
+            missing = [field for field in OPERATIONS[operation] if not isinstance(job.get(field), str)]
+            if missing:
+                raise ValueError(Fore.RED + f"Line {number}: operation '{operation}' needs {', '.join(missing)}")
+
+            job.setdefault("id", str(number))
+            jobs.append(job)
+
+    return jobs
+
+
+def job_key(job: Dict[str, Any]) -> Tuple[str, ...]:
+    """Returns the key of a job, equal for jobs doing the same work (names are compared in lowercase)."""
+    fields = OPERATIONS[job["op"]] + (["genre"] if job["op"] == "book_info" else [])     # The genre narrows the search of a book
+    return (job["op"],) + tuple(str(job.get(field, "")).lower().strip() for field in fields)
+
+
+class ResultSink:
+    """
+    Writes the result of every job as soon as it is ready.
+
+    A path ending with `.json` collects the results and writes them with `write_to_json` at the end (job id -> result).
+    Any other path (or '-' for standard output) streams one JSON object per line: {"id", "op", "result"} or {"id", "op", "error"}.
+    """
+    def __init__(self, output: str, stream: TextIO) -> None:
+        self.output = output
+        self.collected: Dict[str, Any] = dict()
+        self.lock = threading.Lock()
+
+        if output.endswith(".json"):
+            self.file = None
+        elif output == "-":
+            self.file = stream
+        else:
+            self.file = open(output, "w", encoding="utf-8")
+
+    def write(self, job: Dict[str, Any], result: Any = None, error: Optional[str] = None) -> None:
+        record = {"id": job["id"], "op": job["op"]}
+        if error is None:
+            record["result"] = CommonMethods.to_plain(result)
+        else:
+            record["error"] = error
+
+        with self.lock:
+            if self.file is None:
+                self.collected[job["id"]] = record
+            else:
+                self.file.write(CommonMethods.dumps_json(record, compact=True).decode("utf-8") + "\n")
+                self.file.flush()
+
+    def close(self) -> None:
+        if self.file is None:
+            CommonMethods.write_to_json(self.collected, self.output, mode='w')
+        elif self.output != "-":
+            self.file.close()
+
+
+class CountingTransport(Transport):
+    """A `Transport` counting the requests sent through it and the bytes of their responses."""
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.requests = 0
+        self.bytes = 0
+        self.count_lock = threading.Lock()
+
+    def _count(self, response: Any) -> Any:
+        with self.count_lock:
+            self.requests += 1
+            self.bytes += len(response.content)
+        return response
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+        return self._count(super().get(url, headers=headers, timeout=timeout))
+
+    def post(self, url: str, data: Dict[str, str], headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> Any:
+        return self._count(super().post(url, data, headers=headers, timeout=timeout))
+
+
+class BatchRunner:
+    """
+    Runs the jobs of a job file through one shared fetch plan.
+
+    Jobs doing the same work run once. The listing and detail pages needed by all jobs are planned first and prefetched
+    together, so the scheduler fetches them concurrently (within its per-host limits and politeness delay).
+    Each page is requested at most once, then every job is answered from the caches of the two scrapers.
+    Quote and book jobs run at the same time, as they use different websites.
+    """
+    def __init__(self, jobs: List[Dict[str, Any]], sink: ResultSink, delay: Tuple[float, float]) -> None:
+        self.jobs = jobs
+        self.sink = sink
+        self.transport = CountingTransport()       # Shared by both scrapers, to count all requests of the batch
+        self.quote_scraper = QuoteScraping(transport=self.transport)
+        self.book_scraper = BookScraping(transport=self.transport)
+        self.succeeded = 0
+        self.failed = 0
+        self.lock = threading.Lock()
+
+        for scraper in (self.quote_scraper, self.book_scraper):
+            scraper.delay = list(delay)
+            scraper.auto_confirm = False        # No user to confirm similar names, so only exact matches are used
+
+        # The listing pages are fetched for every author job anyway, so authors are not searched with the search form
+        self.quote_scraper.use_search = False
+
+        # Jobs doing the same work share one result
+        self.unique: Dict[Tuple[str, ...], List[Dict[str, Any]]] = dict()
+        for job in jobs:
+            self.unique.setdefault(job_key(job), []).append(job)
+
+    def _finish(self, key: Tuple[str, ...], run) -> Any:
+        """Runs a unique job and writes its result (or error) for every job with the same key."""
+        try:
+            result, error = run(), None
+        except Exception as e:
+            result, error = None, ANSI_PATTERN.sub("", str(e))
+
+        for job in self.unique[key]:
+            self.sink.write(job, result, error)
+
+            with self.lock:
+                if error is None:
+                    self.succeeded += 1
+                else:
+                    self.failed += 1
+        return result
+
+    def run(self) -> None:
+        quote_jobs = [key for key in self.unique if key[0] in QUOTE_OPERATIONS]
+        book_jobs = [key for key in self.unique if key[0] not in QUOTE_OPERATIONS]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self.run_quote_jobs, quote_jobs), executor.submit(self.run_book_jobs, book_jobs)]
+            for future in futures:
+                future.result()
+
+    def run_quote_jobs(self, keys: List[Tuple[str, ...]]) -> None:
+        scraper = self.quote_scraper
+        if not keys:
+            return
+
+        # Listing pages, needed to resolve authors, and first pages of the tags
+        if any(key[0] != "tag_quotes" for key in keys):
+            urls = list(scraper.plan_pages())
+            scraper.prefetch([url for page, url in enumerate(urls, start=1) if page not in scraper.quote_pages])
+
+        tags = [self._job(key)["tag"].lower().strip() for key in keys if key[0] == "tag_quotes"]
+        scraper.prefetch([scraper.base_url + f"tag/{tag}/" for tag in dict.fromkeys(tags) if tag not in scraper.crawled_tags])
+
+        # Author pages, once all listing pages are known
+        author_keys = [key for key in keys if key[0] == "author_info"]
+        author_urls = dict()
+
+        for key in author_keys:
+            try:
+                author_urls[key] = scraper.get_author_url(self._job(key)["author"])
+            except Exception:
+                continue        # Reported when the job runs
+
+        scraper.prefetch(list(author_urls.values()))
+
+        for key in keys:
+            job = self._job(key)
+
+            if key[0] == "author_quotes":
+                self._finish(key, lambda: scraper.scrape_author_quotes(job["author"], print_quotes=False))
+            elif key[0] == "author_info":
+                self._finish(key, lambda: scraper.scrape_author_info(author_urls.get(key) or scraper.get_author_url(job["author"]), print_info=False))
+            elif key[0] == "tag_quotes":
+                self._finish(key, lambda: scraper.scrape_tag_quotes([job["tag"]])[job["tag"].lower().strip()])
+            elif key[0] == "all_quotes":
+                self._finish(key, scraper.scrape_all_quotes)
+
+    def run_book_jobs(self, keys: List[Tuple[str, ...]]) -> None:
+        scraper = self.book_scraper
+        if not keys:
+            return
+
+        try:
+            genres = scraper.genre_list()
+        except Exception as e:
+            def fail() -> None:
+                raise e
+
+            for key in keys:        # Every book job needs the genres, so each one fails with the same error
+                self._finish(key, fail)
+            return
+
+        # Genres to harvest: named by a job, or all genres for books without a genre
+        wanted = []
+        for key in keys:
+            job = self._job(key)
+
+            if key[0] == "all_books" or (key[0] == "book_info" and not job.get("genre")):
+                wanted = genres
+                break
+            if job.get("genre"):
+                genre, is_present = scraper.validate_name(job["genre"], genres, kind='genre')
+                if is_present:
+                    wanted.append(genre)
+
+        # First pages of the genres, then the remaining pages planned from them
+        first_pages = [scraper.genre_urls[genre] for genre in dict.fromkeys(wanted)]
+        if any(key[0] == "all_books" for key in keys):
+            first_pages.append(scraper.base_url)
+
+        scraper.prefetch([url for url in first_pages if url not in scraper.book_pages])
+        for url in first_pages:
+            try:
+                planned = list(scraper.plan_pages(url))
+            except Exception:
+                continue        # Reported when the job runs
+            scraper.prefetch([page for page in planned if page not in scraper.book_pages])
+
+        # Book pages, once the genres are harvested
+        book_keys = [key for key in keys if key[0] == "book_info"]
+        book_urls = dict()
+
+        for key in book_keys:
+            job = self._job(key)
+            try:
+                book_urls[key] = scraper.get_book_url(job["book"], job.get("genre", ""))
+            except Exception:
+                continue        # Reported when the job runs
+
+        scraper.prefetch(list(book_urls.values()))
+
+        def genre_books(name: str) -> Dict[str, str]:
+            titles = scraper.scrape_books_from_genre(name, print_books=False)
+            genre = scraper.validate_name(name, genres, kind='genre')[0]
+            return {title: scraper.book_urls[genre][title] for title in titles}
+
+        for key in keys:
+            job = self._job(key)
+
+            if key[0] == "genre_books":
+                self._finish(key, lambda: genre_books(job["genre"]))
+            elif key[0] == "book_info":
+                self._finish(key, lambda: scraper.scrape_book_info(book_urls.get(key) or scraper.get_book_url(job["book"], job.get("genre", "")), print_info=False))
+            elif key[0] == "all_books":
+                self._finish(key, scraper.scrape_all_books)
+
+    def _job(self, key: Tuple[str, ...]) -> Dict[str, Any]:
+        """Returns the first job with a key."""
+        return self.unique[key][0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Runs scraping jobs from a JSONL job file without prompts, "
+                                                 "fetching the pages of all jobs through one shared, concurrent plan.")
+    parser.add_argument("jobs", help="Job file with one JSON object per line ('-' for standard input). Operations: " + ", ".join(OPERATIONS))
+    parser.add_argument("-o", "--output", default="-", help="Output file. '.json' collects all results in one document, "
+                                                           "anything else streams JSON lines. Default is standard output.")
+    parser.add_argument("--delay", type=float, nargs=2, default=[1, 2], metavar=("MIN", "MAX"),
+                        help="Random delay in seconds between the requests of a crawl. Default is 1 2.")
+    parser.add_argument("--archive", help="Page archive every fetched page is appended to, so the results can be extracted again "
+                                          "offline with Program_Replay.")
+    parser.add_argument("--covers", metavar="DIRECTORY", help="Directory the cover images of the books listed or looked up are downloaded to, "
+                                                            "with a manifest. Images already downloaded are skipped.")
+    parser.add_argument("--aliases", help="Alias file of the name corrections confirmed in the interactive programs (for example aliases.json), "
+                                          "so jobs with those misspellings resolve without prompts.")
+    args = parser.parse_args()
+
+    CommonMethods.alias_file = args.aliases
+
+    stdout = sys.stdout
+
+    try:
+        jobs = read_jobs(args.jobs)
+    except (OSError, ValueError) as e:
+        print(Fore.RED + f"{e}", file=sys.stderr)
+        sys.exit(2)
+
+    sink = ResultSink(args.output, stdout)
+    runner = BatchRunner(jobs, sink, (args.delay[0], args.delay[1]))
+
+    archive = PageArchive(args.archive) if args.archive else None
+    for scraper in (runner.quote_scraper, runner.book_scraper):
+        scraper.archive = archive
+
+    covers = CoverDownloader(runner.book_scraper, args.covers) if args.covers else None
+    runner.book_scraper.covers = covers
+
+    start = time.perf_counter()
+
+    # Progress messages of the scrapers go to standard error, so standard output only holds results
+    with redirect_stdout(sys.stderr):
+        runner.run()
+        if covers is not None:
+            covers.wait()
+    sink.close()
+
+    if archive is not None:
+        archive.close()
+
+    elapsed = time.perf_counter() - start
+    print(Fore.GREEN + f"{len(jobs)} jobs ({len(runner.unique)} unique): {runner.succeeded} succeeded, {runner.failed} failed", file=sys.stderr)
+    print(Fore.CYAN + f"{runner.transport.requests} requests, {runner.transport.bytes / 1e6:.2f} MB in {elapsed:.2f} s "
+                      f"({len(jobs) / elapsed:.1f} jobs/s, {runner.transport.requests / elapsed:.1f} requests/s)", file=sys.stderr)
+    if covers is not None:
+        print(Fore.CYAN + f"Covers: {covers.stats['downloaded']} downloaded, {covers.stats['duplicates']} duplicates, "
+                          f"{covers.stats['skipped']} already present, {covers.stats['failed']} failed", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
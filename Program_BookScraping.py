@@ -1,18 +1,18 @@
-from colorama import Fore, init
-from Class_Scraping import BookScraping
+from Class_Scraping import BookScraping, CommonMethods, Fore
 import os
 
 def main():
-    init(autoreset=True)
-    invalid_text = Fore.RED + "WRONG input. Enter again"
+    invalid_text = "WRONG input. Enter again"        # Colored when printed, so colorama is only loaded once it is needed
 
     print()
     print(Fore.LIGHTYELLOW_EX + "Welcome to the Quotes Scraping Application!")
 
+    CommonMethods.alias_file = "aliases.json"       # Name corrections confirmed once are remembered across runs
     book_scraper = BookScraping()
+    book_scraper.speculative = True       # The page of the book looked up is fetched while the user reads the prompts
     result = dict()
 
-    print(Fore.LIGHTBLUE_EX + f"Website used for scraping: {BookScraping.base_url}")
+    print(Fore.LIGHTBLUE_EX + f"Website used for scraping: {book_scraper.base_url}")
     print()
 
     while True:
@@ -26,15 +26,13 @@ def main():
         choice = input("Enter choice: ")
         print()
 
-        while True:
+        while not (choice.isdigit() and int(choice) in [1, 2, 3, 4, 6]):
+            print(Fore.RED + invalid_text)
+            choice = input("Enter choice: ")
+            print()
+        choice = int(choice)        # An int from here on, also when the same operation is repeated
 
-            if choice.isdigit() and int(choice) in [1, 2, 3, 4, 6]:
-                choice = int(choice)
-            else:
-                print(invalid_text)
-                choice = input("Enter choice: ")
-                print()
-            
+        while True:
             if choice == 1:
                 result = book_scraper.genre_list()
                 print(Fore.CYAN + "Genres found:")
@@ -57,4 +55,143 @@ def main():
                 print()
             
             elif choice == 3:
-            
\ No newline at end of file
+                book = input("Enter the title of the book: ")
+                print()
+
+                while True:
+                    try:
+                        book_url = book_scraper.get_book_url(book)
+                        break
+                    except Exception as e:
+                        print()
+                        print(Fore.RED + f"{e}")
+                        book = input("Enter the title of the book: ")
+                        print()
+
+                result[book] = book_scraper.scrape_book_info(book_url)
+                print()
+
+            elif choice == 4:
+                result = book_scraper.scrape_all_books()
+                print()
+
+            elif choice == 6:
+
+                if len(result) != 0:
+                    while True:
+                        save = input("Do you want to save your data (y/n)?: ").lower().strip()
+
+                        if save == 'y':
+                            if isinstance(result, list):
+                                is_list = True
+                                file = input("Enter the name of the file (.txt): ")
+                            else:
+                                is_list = False
+                                file = input("Enter the name of the file (.json): ")
+
+                            if os.path.exists(file) and os.path.getsize(file) != 0:
+                                while True:
+                                    erase = input(Fore.LIGHTRED_EX + "Do you want to erase previous data (y/n)? ").lower().strip()
+
+                                    if erase == 'y':
+                                        mode = 'w'
+                                        break
+                                    elif erase == 'n':
+                                        mode = 'a'
+                                        break
+                                    else:
+                                        print(Fore.RED + invalid_text)
+                            else:
+                                mode = 'w'
+
+                            if is_list:
+                                BookScraping.write_to_text(data=result, filename=file, mode=mode)
+                            else:
+                                BookScraping.write_to_json(data=result, filename=file, mode=mode)
+                            break
+
+                        elif save == 'n':
+                            break
+
+                        else:
+                            print(Fore.RED + invalid_text)
+
+                print(Fore.LIGHTYELLOW_EX + "Thanks for using the Scraping Application")
+                return
+
+            print("What's next on your mind?")
+            print("1. Continue scraping and save the data to a file")
+            print("2. Continue scraping without saving the data")
+            print("3. Save the data to a file and exit")
+            print("4. Exit without saving")
+
+            if choice in [2, 3]:
+                print('''5. Continue scraping and add more data to the existing dataset (don't save yet)
+This means you will be performing the same operation''')
+                print()
+
+            while True:
+                next_choice = input()
+                next_choice = int(next_choice) if next_choice.isdigit() else 0
+                print()
+
+                if next_choice in [1, 3]:
+                    same_op = False
+
+                    if choice == 1:
+                        file = input("Enter the name of the text file (with .txt extension): ")
+                    else:
+                        file = input("Enter the name of the json file (with .json extension): ")
+
+                    if os.path.exists(file) and os.path.getsize(file) != 0:
+                        while True:
+                            erase = input(Fore.LIGHTRED_EX + "Do you want to erase previous data (y/n)? ").lower().strip()
+
+                            if erase == 'y':
+                                mode = 'w'
+                                break
+                            elif erase == 'n':
+                                mode = 'a'
+                                break
+                            else:
+                                print(Fore.RED + invalid_text)
+                    else:
+                        mode = 'w'
+
+                    if choice == 1:
+                        BookScraping.write_to_text(data=result, filename=file, mode=mode)
+                    else:
+                        BookScraping.write_to_json(data=result, filename=file, mode=mode)
+
+                    print(Fore.LIGHTGREEN_EX + "Successfully recorded all data")
+                    print()
+
+                    if next_choice == 3:
+                        print(Fore.LIGHTYELLOW_EX + "Thanks for using the Scraping Application")
+                        return
+
+                    result = dict()
+                    break
+
+                elif next_choice == 2:
+                    same_op = False
+                    result = dict()
+                    break
+
+                elif next_choice == 4:
+                    print(Fore.LIGHTYELLOW_EX + "Thanks for using the Scraping Application")
+                    return
+
+                elif next_choice == 5 and choice in [2, 3]:
+                    same_op = True
+                    break
+
+                else:
+                    print(Fore.RED + invalid_text)
+
+            if not same_op:
+                break
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,18 @@
-from colorama import Fore, init
-from Class_Scraping import QuoteScraping
+from Class_Scraping import QuoteScraping, CommonMethods, Fore
 import os
 
 def main():
-    init(autoreset=True)
-    invalid_text = Fore.RED + "WRONG input. Enter again"
+    invalid_text = "WRONG input. Enter again"        # Colored when printed, so colorama is only loaded once it is needed
 
     print()
     print(Fore.LIGHTYELLOW_EX + "Welcome to the Quotes Scraping Application!")
 
+    CommonMethods.alias_file = "aliases.json"       # Name corrections confirmed once are remembered across runs
     quote_scraper = QuoteScraping()
+    quote_scraper.speculative = True      # The page of the author looked up is fetched while the user reads the prompts
     result = dict()
 
-    print(Fore.LIGHTBLUE_EX + f"Website used for scraping: {QuoteScraping.base_url}")
+    print(Fore.LIGHTBLUE_EX + f"Website used for scraping: {quote_scraper.base_url}")
     print()
 
     while True:
@@ -100,7 +100,7 @@ def main():
                                         mode = 'a'
                                         break
                                     else:
-                                        print(invalid_text)
+                                        print(Fore.RED + invalid_text)
                             else:
                                 mode = 'w'
 
@@ -114,12 +114,12 @@ def main():
                             break
 
                         else:
-                            print(invalid_text)
+                            print(Fore.RED + invalid_text)
 
                 print(Fore.LIGHTYELLOW_EX + "Thanks for using the Scraping Application")
                 return
             else:
-                print(invalid_text)
+                print(Fore.RED + invalid_text)
                 break
 
             print("What's next on your mind?")
@@ -156,7 +156,7 @@ This means you will be performing the same operation''')
                                 mode = 'a'
                                 break
                             else:
-                                print(invalid_text)
+                                print(Fore.RED + invalid_text)
                     else:
                         mode = 'w'
                     
@@ -189,7 +189,7 @@ This means you will be performing the same operation''')
                     break
 
                 else:
-                    print(invalid_text)
+                    print(Fore.RED + invalid_text)
                 
             if not same_op:
                 break
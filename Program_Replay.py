@@ -0,0 +1,126 @@
+from Class_Archive import PageArchive, ArchiveTransport
+from Class_Scraping import QuoteScraping, BookScraping, CommonMethods, Fore
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+from typing import Dict, List, Any, Tuple
+import argparse
+import os
+import sys
+import time
+
+# Operations that can be replayed, and the file each one is written to
+OPERATIONS = {
+    "quotes": "quotes.json",
+    "authors": "authors.json",
+    "books": "books.json",
+    "book_info": "book_info.json",
+}
+
+
+def replay(archive_name: str, operation: str, base_url: str, urls: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Runs one operation against an archive, in a worker process, with no network access.
+
+    Parameters:
+        archive_name (str): The archive file.
+        operation (str): 'quotes', 'authors', 'books' or 'book_info'.
+        base_url (str): The base URL of the website the pages were archived from.
+        urls (List[str]): The book pages to extract, for 'book_info'.
+
+    Returns:
+        tuple: The result (in its JSON form) and the URLs that were requested but not archived.
+    """
+    with PageArchive(archive_name, mode='r') as archive, open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        transport = ArchiveTransport(archive)
+
+        if operation in ("quotes", "authors"):
+            # Listing pages are read from the source they were archived from
+            source = 'api' if base_url + "api/quotes?page=1" in archive else 'html'
+            scraper = QuoteScraping(transport=transport, base_url=base_url, source=source)
+        else:
+            scraper = BookScraping(transport=transport, base_url=base_url)
+        scraper.delay = [0, 0]
+        scraper.auto_confirm = False
+
+        if operation == "quotes":
+            result = scraper.scrape_all_quotes()
+        elif operation == "authors":
+            result = scraper.scrape_all_authors()
+        elif operation == "books":
+            result = scraper.scrape_all_books()
+        else:
+            result = dict()
+            for url in urls:
+                try:
+                    book = scraper.scrape_book_info(url, print_info=False)
+                except Exception:
+                    continue        # Reported as a miss when the page is not archived
+                result[book.title] = book
+
+        return CommonMethods.to_plain(result), transport.misses
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Extracts quotes, authors and books again from a page archive, in parallel and without network access. "
+                                                 "Pages are archived by setting the `archive` of a scraper, or with the --archive option of Program_Batch.")
+    parser.add_argument("archive", help="The page archive.")
+    parser.add_argument("-o", "--output", default="replay", help="Directory the JSON results are written to. Default is 'replay'.")
+    parser.add_argument("--operations", nargs="+", default=list(OPERATIONS), choices=list(OPERATIONS),
+                        help="Operations to replay. Default is all of them.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes. Default is the number of CPUs.")
+    parser.add_argument("--quotes-url", default=QuoteScraping.base_url, help=f"Base URL of the archived quotes website. Default is {QuoteScraping.base_url}.")
+    parser.add_argument("--books-url", default=BookScraping.base_url, help=f"Base URL of the archived books website. Default is {BookScraping.base_url}.")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.archive):
+        print(Fore.RED + f"Archive {args.archive} not found", file=sys.stderr)
+        sys.exit(2)
+
+    with PageArchive(args.archive, mode='r') as archive:
+        page_count = len(archive)
+
+    os.makedirs(args.output, exist_ok=True)
+    start = time.perf_counter()
+    results: Dict[str, Dict[str, Any]] = {operation: dict() for operation in args.operations}
+    misses: List[str] = []
+
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        base_urls = {"quotes": args.quotes_url, "authors": args.quotes_url, "books": args.books_url}
+
+        # The book pages are only known once the listing is extracted, so 'book_info' starts with 'books'
+        first = [operation for operation in args.operations if operation != "book_info"]
+        if "book_info" in args.operations and "books" not in first:
+            first.append("books")
+
+        futures = {executor.submit(replay, args.archive, operation, base_urls[operation], []): operation for operation in first}
+
+        while futures:
+            for future in as_completed(list(futures)):
+                operation = futures.pop(future)
+                result, missed = future.result()
+                misses += missed
+
+                if operation in results:
+                    results[operation].update(result)
+
+                # Book pages are split between the workers
+                if operation == "books" and "book_info" in args.operations:
+                    urls = list(result.values())
+                    size = max(1, -(-len(urls) // args.workers))
+                    for i in range(0, len(urls), size):
+                        futures[executor.submit(replay, args.archive, "book_info", args.books_url, urls[i:i + size])] = "book_info"
+                break
+
+    for operation, result in results.items():
+        CommonMethods.write_to_json(result, os.path.join(args.output, OPERATIONS[operation]), mode='w')
+
+    elapsed = time.perf_counter() - start
+    summary = ", ".join(f"{len(result)} {operation}" for operation, result in results.items())
+    print(Fore.GREEN + f"Replayed {summary} from {page_count} archived pages in {elapsed:.2f} s with {args.workers} workers")
+
+    if misses:
+        print(Fore.YELLOW + f"{len(set(misses))} URLs were requested but not archived, for example {sorted(set(misses))[0]}")
+
+
+if __name__ == "__main__":
+    main()
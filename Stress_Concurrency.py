@@ -0,0 +1,123 @@
+from Class_MockSite import MockSite
+from Class_Scraping import QuoteScraping, BookScraping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from typing import Callable, List, Tuple
+import argparse
+import os
+import random
+import sys
+import time
+
+
+def operations(site: MockSite, quote_scraper: QuoteScraping, book_scraper: BookScraping) -> List[Tuple[str, Callable[[], bool]]]:
+    """
+    Mixed operations on the two shared scrapers, each returning True if its result matches the data of the mock site.
+
+    Parameters:
+        site (MockSite): The mock site serving the data.
+        quote_scraper (QuoteScraping): The shared quotes scraper.
+        book_scraper (BookScraping): The shared books scraper.
+
+    Returns:
+        List[Tuple[str, Callable[[], bool]]]: The name and the check of every operation.
+    """
+    def text(quote: str) -> str:
+        return quote.strip("“”")
+
+    def author_quotes(author: str) -> bool:
+        expected = {text(quote) for quote, name, _ in site.quotes if name == author}
+        return {text(quote) for quote in quote_scraper.scrape_author_quotes(author, print_quotes=False)} == expected
+
+    def author_info(author: str) -> bool:
+        return quote_scraper.scrape_author_info(quote_scraper.get_author_url(author), print_info=False).name == author
+
+    def tag_quotes(tag: str) -> bool:
+        expected = {text(quote) for quote, _, tags in site.quotes if tag in tags}
+        return {text(quote) for quote in quote_scraper.scrape_tag_quotes([tag])[tag]} == expected
+
+    def find_quotes(tag: str) -> bool:
+        found = quote_scraper.find_quotes(tags=[tag])        # Only quotes seen so far, so only checks they are correct
+        expected = {text(quote) for quote, _, tags in site.quotes if tag in tags}
+        return {text(quote) for quote in found} <= expected
+
+    def genre_books(genre: str) -> bool:
+        expected = {book["title"] for book in site.books if book["genre"] == genre}
+        return set(book_scraper.scrape_books_from_genre(genre, print_books=False)) == expected
+
+    def book_info(book: dict) -> bool:
+        info = book_scraper.scrape_book_info(book_scraper.get_book_url(book["title"], book["genre"]), print_info=False)
+        return (info.title, info.upc, info.price) == (book["title"], book["upc"], book["price"])
+
+    def all_books() -> bool:
+        return set(book_scraper.scrape_all_books()) == {book["title"] for book in site.books}
+
+    authors = sorted(set(site.authors.values()))
+    checks = [(f"author_quotes {author}", lambda author=author: author_quotes(author)) for author in authors]
+    checks += [(f"author_info {author}", lambda author=author: author_info(author)) for author in authors]
+    checks += [(f"tag_quotes {tag}", lambda tag=tag: tag_quotes(tag)) for tag in MockSite.tags]
+    checks += [(f"find_quotes {tag}", lambda tag=tag: find_quotes(tag)) for tag in MockSite.tags]
+    checks += [(f"genre_books {genre}", lambda genre=genre: genre_books(genre)) for genre in site.genres]
+    checks += [(f"book_info {book['title']}", lambda book=book: book_info(book)) for book in site.books[::7]]
+    checks += [("all_books", all_books)]
+    return checks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shares one quotes scraper and one books scraper between many threads running mixed operations "
+                                                 "against a local mock site, and checks the results and that no page is fetched twice.")
+    parser.add_argument("--threads", type=int, default=16, help="Number of threads. Default is 16.")
+    parser.add_argument("--rounds", type=int, default=3, help="Times every operation runs (in random order). Default is 3.")
+    parser.add_argument("--latency", type=float, default=0.02, help="Delay in seconds of every response of the mock site. Default is 0.02.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the mock data and of the order of the operations. Default is 0.")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+
+    with MockSite(latency=args.latency, seed=args.seed) as site:
+        quote_scraper = QuoteScraping(base_url=site.quotes_url)
+        book_scraper = BookScraping(base_url=site.books_url)
+
+        for scraper in (quote_scraper, book_scraper):
+            scraper.delay = [0, 0]
+            scraper.auto_confirm = False
+
+        checks = operations(site, quote_scraper, book_scraper) * args.rounds
+        random.Random(args.seed).shuffle(checks)
+
+        def run(check: Tuple[str, Callable[[], bool]]) -> None:
+            name, function = check
+            try:
+                if not function():
+                    failures.append(f"{name}: wrong result")
+            except Exception as e:
+                failures.append(f"{name}: {type(e).__name__}: {e}")
+
+        start = time.perf_counter()
+
+        # Progress messages of the scrapers are not needed
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            with ThreadPoolExecutor(max_workers=args.threads) as executor:
+                list(executor.map(run, checks))
+
+        elapsed = time.perf_counter() - start
+        repeated = {path: count for path, count in site.hits.items() if count > 1}
+
+        for scraper in (quote_scraper, book_scraper):
+            scraper.transport.close()
+
+    print(f"{len(checks)} operations on {args.threads} threads in {elapsed:.2f} s, {sum(site.hits.values())} requests")
+
+    for (website, path), count in sorted(repeated.items()):
+        failures.append(f"{website} {path} fetched {count} times")
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+
+    print("All results are correct and every page was fetched once")
+
+
+if __name__ == "__main__":
+    main()